@@ -1,8 +1,11 @@
+import time
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import polars as pl
 
+import polars_ta.wide as wide
 from polars_ta.prefix.tdx import *
 from polars_ta.prefix.wq import *
 
@@ -82,8 +85,36 @@ def func_ts_date(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
+def func_ts_wide(arrays: dict) -> dict:
+    # the same features on date x asset matrices, no sort or group_by
+    # 在日期x资产的矩阵上计算同样的指标，不需要排序和分组
+    C, H, L = arrays['CLOSE'], arrays['HIGH'], arrays['LOW']
+    return {
+        **{f'ROCP_{i:03d}': wide.ts_returns(C, i) for i in (1, 3, 5, 10, 20, 60, 120)},
+        **{f'SMA_{i:03d}': wide.ts_mean(C, i) for i in (5, 10, 20, 60, 120)},
+        **{f'STD_{i:03d}': wide.ts_std_dev(C, i) for i in (5, 10, 20, 60, 120)},
+        **{f'HHV_{i:03d}': wide.ts_max(H, i) for i in (5, 10, 20, 60, 120)},
+        **{f'LLV_{i:03d}': wide.ts_min(L, i) for i in (5, 10, 20, 60, 120)},
+        **{f'RANK_{i:03d}': wide.ts_rank(C, i) for i in (5, 10, 20, 60, 120)},
+        **{f'HHVBAR_{i:03d}': wide.ts_arg_max(H, i) for i in (5, 10, 20, 60, 120)},
+        **{f'RSI_{i:03d}': wide.ts_RSI(C, i) for i in (6, 12, 24)},
+    }
+
+
+t0 = time.perf_counter()
+# convert to matrices once. rows are dates, columns are assets
+# 一次转成矩阵，行为日期，列为资产
+arrays, dates, assets = wide.to_wide(df, ['CLOSE', 'HIGH', 'LOW'])
+t1 = time.perf_counter()
+features = func_ts_wide(arrays)
+t2 = time.perf_counter()
+df_wide = wide.to_long(features, dates, assets)
+t3 = time.perf_counter()
+
 # ensure grouped before applying to multi-asset data
 # 多资产需要先按资产分组
 df = df.group_by('asset').map_groups(func_ts_date)
+t4 = time.perf_counter()
 
 print(df)
+print(f'long: {t4 - t3:.3f}s. wide: to_wide {t1 - t0:.3f}s, features {t2 - t1:.3f}s, to_long {t3 - t2:.3f}s')
@@ -6,3 +6,7 @@ from ._version import __version__
 TA_EPSILON: float = 1e-8
 # 默认最小样本数量
 MIN_SAMPLES: Optional[int] = None
+# 分段计算时的并行线程数。指定partition_by后各分组分摊到多个线程，1表示单线程
+NUM_THREADS: int = 1
+# 浮点结果使用Float32。numba算子与talib封装的输出减半内存，滚动累加仍用float64。需在构建表达式前设置
+FLOAT32: bool = False
@@ -1,3 +1,41 @@
-from polars_ta.candles.cdl1 import *  # noqa
-from polars_ta.candles.cdl1_limit import *  # noqa
-from polars_ta.candles.cdl2 import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.candles.cdl1': [
+        'candle_color',
+        'doji',
+        'efficiency_ratio',
+        'high_low_range',
+        'lower_shadow',
+        'real_body',
+        'shadows',
+        'upper_shadow',
+    ],
+    'polars_ta.candles.cdl1_limit': [
+        'dragonfly',
+        'four_price_doji',
+        'gravestone',
+        'limit_down',
+        'limit_down_at_close',
+        'limit_down_at_high',
+        'limit_down_at_open',
+        'limit_down_four_price_doji',
+        'limit_down_gravestone',
+        'limit_up',
+        'limit_up_at_close',
+        'limit_up_at_high',
+        'limit_up_at_open',
+        'limit_up_dragonfly',
+        'limit_up_four_price_doji',
+    ],
+    'polars_ta.candles.cdl2': [
+        'lower_body',
+        'ts_gap_down',
+        'ts_gap_up',
+        'ts_real_body_gap_down',
+        'ts_real_body_gap_up',
+        'upper_body',
+    ],
+})
@@ -1 +1,15 @@
-from polars_ta.labels.future import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.labels.future': [
+        'cut',
+        'log',
+        'ts_delay',
+        'ts_log_diff',
+        'ts_log_return',
+        'ts_simple_return',
+        'ts_triple_barrier',
+    ],
+})
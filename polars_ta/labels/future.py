@@ -12,12 +12,17 @@ https://mp.weixin.qq.com/s/XtgYezFsslOfW-QyIMr0VA
 https://github.com/Rachnog/Advanced-Deep-Trading/blob/master/bars-labels-diff/Labeling.ipynb
 
 """
-from polars import Expr, struct, Float64
+from typing import Optional
 
-from polars_ta.labels._nb import _triple_barrier
-from polars_ta.utils.numba_ import batches_i2_o1, struct_to_numpy
+from polars import Expr, Float64
+
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i2_o1, struct_to_numpy, struct_with_partition, struct_to_offsets
 from polars_ta.wq import cut, ts_delay, ts_log_diff, log
 
+# 首次使用时才导入
+_nb = lazy_import('polars_ta.labels._nb')
+
 
 def ts_log_return(close: Expr, n: int = 5) -> Expr:
     """将未来数据当成卖出价后移到买入价位置，计算对数收益率
@@ -109,7 +114,7 @@ def ts_simple_return(close: Expr, n: int = 5, threshold: float = 0.0, *more_thre
     return cut(close.pct_change(n).shift(-n), threshold, *more_threshold)
 
 
-def ts_triple_barrier(close: Expr, high: Expr, low: Expr, d: int = 5, take_profit: float = 0.1, stop_loss: float = 0.05) -> Expr:
+def ts_triple_barrier(close: Expr, high: Expr, low: Expr, d: int = 5, take_profit: float = 0.1, stop_loss: float = 0.05, partition_by: Optional[Expr] = None) -> Expr:
     """三重障碍打标法
 
     Parameters
@@ -126,6 +131,8 @@ def ts_triple_barrier(close: Expr, high: Expr, low: Expr, d: int = 5, take_profi
         止盈比例
     stop_loss:float
         止损比例
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Returns
     -------
@@ -162,4 +169,4 @@ def ts_triple_barrier(close: Expr, high: Expr, low: Expr, d: int = 5, take_profi
     ```
 
     """
-    return struct(f0=close, f1=high, f2=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3), _triple_barrier, d, take_profit, stop_loss), return_dtype=Float64)
+    return struct_with_partition(partition_by, f0=close, f1=high, f2=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3), _nb._triple_barrier, d, take_profit, stop_loss, offsets=struct_to_offsets(xx, 3)), return_dtype=Float64)
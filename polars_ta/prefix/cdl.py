@@ -1 +1,4 @@
-from polars_ta.candles import *  # noqa
+from polars_ta.utils.lazy import lazy_getattr
+from polars_ta.candles import __all__ as _all
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {'polars_ta.candles': _all})
@@ -1 +1,4 @@
-from polars_ta.labels import *  # noqa
+from polars_ta.utils.lazy import lazy_getattr
+from polars_ta.labels import __all__ as _all
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {'polars_ta.labels': _all})
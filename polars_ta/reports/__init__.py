@@ -1 +1,12 @@
-from polars_ta.reports.cicc import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.reports.cicc': [
+        'ts_RSRS',
+        'ts_RSRS_R2',
+        'ts_regression',
+        'ts_zscore',
+    ],
+})
@@ -1,6 +1,6 @@
-from polars import Expr
+from polars import Expr, field
 
-from polars_ta.wq import ts_corr, ts_zscore, ts_std_dev, ts_regression_slope
+from polars_ta.wq import ts_zscore, ts_regression
 
 
 def ts_RSRS_R2(high: Expr, low: Expr, n: int = 18, m: int = 600) -> Expr:
@@ -10,8 +10,9 @@ def ts_RSRS_R2(high: Expr, low: Expr, n: int = 18, m: int = 600) -> Expr:
     ----------
     中金：金融工程视角下的技术择时艺术
     """
-    a = ts_corr(high, low, n)
-    return ts_zscore(ts_std_dev(high, n) / ts_std_dev(low, n) * a, m) * (a ** 2)
+    # 斜率std(high)/std(low)*corr与R²=corr²来自同一次回归，在struct内取两个字段，只回归一次
+    reg = ts_regression(high, low, d=n)
+    return reg.struct.with_fields(out=ts_zscore(field('slope'), m) * field('r2')).struct.field('out')
 
 
 def ts_RSRS(high: Expr, low: Expr, n: int = 18, m: int = 600) -> Expr:
@@ -21,4 +22,4 @@ def ts_RSRS(high: Expr, low: Expr, n: int = 18, m: int = 600) -> Expr:
     ----------
     中金：金融工程视角下的技术择时艺术
     """
-    return ts_zscore(ts_regression_slope(high, low, n), m)
+    return ts_zscore(ts_regression(high, low, d=n).struct.field('slope').name.keep(), m)
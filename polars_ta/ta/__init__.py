@@ -1,8 +1,96 @@
-from polars_ta.ta.momentum import *  # noqa
-from polars_ta.ta.operators import *  # noqa
-from polars_ta.ta.overlap import *  # noqa
-from polars_ta.ta.price import *  # noqa
-from polars_ta.ta.statistic import *  # noqa
-from polars_ta.ta.transform import *  # noqa
-from polars_ta.ta.volatility import *  # noqa
-from polars_ta.ta.volume import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.ta.momentum': [
+        'APO',
+        'AROON',
+        'MACD',
+        'MOM',
+        'PPO',
+        'ROC',
+        'ROCP',
+        'ROCR',
+        'ROCR100',
+        'RSI',
+        'RSV',
+        'STOCHF',
+        'TRIX',
+        'WILLR',
+        'max_',
+        'ts_delta',
+        'ts_returns',
+    ],
+    'polars_ta.ta.operators': [
+        'ADD',
+        'DIV',
+        'MAXINDEX',
+        'MININDEX',
+        'MUL',
+        'SUB',
+        'SUM',
+        'ts_arg_max',
+        'ts_arg_min',
+    ],
+    'polars_ta.ta.overlap': [
+        'BBANDS',
+        'DEMA',
+        'KAMA',
+        'MAX',
+        'MIDPOINT',
+        'MIDPRICE',
+        'MIN',
+        'SMA',
+        'TEMA',
+        'TRIMA',
+        'WMA',
+    ],
+    'polars_ta.ta.price': [
+        'AVGPRICE',
+        'MEDPRICE',
+        'TYPPRICE',
+        'WCLPRICE',
+    ],
+    'polars_ta.ta.statistic': [
+        'BETA',
+        'CORREL',
+        'LINEARREG',
+        'LINEARREG_ANGLE',
+        'LINEARREG_INTERCEPT',
+        'LINEARREG_SLOPE',
+        'STDDEV',
+        'TSF',
+        'VAR',
+        'ts_std_dev',
+    ],
+    'polars_ta.ta.transform': [
+        'ACOS',
+        'ASIN',
+        'ATAN',
+        'CEIL',
+        'COS',
+        'COSH',
+        'EXP',
+        'FLOOR',
+        'LN',
+        'LOG10',
+        'SIN',
+        'SINH',
+        'SQRT',
+        'TAN',
+        'TANH',
+    ],
+    'polars_ta.ta.volatility': [
+        'ATR',
+        'NATR',
+        'RMA',
+        'TRANGE',
+    ],
+    'polars_ta.ta.volume': [
+        'AD',
+        'ADOSC',
+        'EMA',
+        'OBV',
+    ],
+})
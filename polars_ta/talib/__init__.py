@@ -1,11 +1,16 @@
 # generated by codegen_talib.py
-import talib as _ta
-from polars import Expr, struct, Struct, Field, Float64, Int32
+from typing import Optional
 
-from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1, batches_i2_o2, struct_to_numpy
+from polars import Expr, Struct, Field, Int32
 
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1, batches_i2_o2, float_dtype, series_to_numpy, struct_to_numpy, struct_to_offsets, struct_with_partition
 
-def HT_DCPERIOD(close: Expr) -> Expr:  # ['real']
+# 首次使用时才导入talib
+_ta = lazy_import('talib')
+
+
+def HT_DCPERIOD(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """HT_DCPERIOD(ndarray real)
 
 HT_DCPERIOD(real)
@@ -16,10 +21,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.HT_DCPERIOD), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.HT_DCPERIOD, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.HT_DCPERIOD, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def HT_DCPHASE(close: Expr) -> Expr:  # ['real']
+def HT_DCPHASE(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """HT_DCPHASE(ndarray real)
 
 HT_DCPHASE(real)
@@ -30,10 +38,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.HT_DCPHASE), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.HT_DCPHASE, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.HT_DCPHASE, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def HT_PHASOR(close: Expr) -> Expr:  # ['inphase', 'quadrature']
+def HT_PHASOR(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['inphase', 'quadrature']
     """HT_PHASOR(ndarray real)
 
 HT_PHASOR(real)
@@ -45,11 +56,14 @@ Inputs:
 Outputs:
     inphase
     quadrature"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.HT_PHASOR), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.HT_PHASOR, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.HT_PHASOR, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def HT_SINE(close: Expr) -> Expr:  # ['sine', 'leadsine']
+def HT_SINE(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['sine', 'leadsine']
     """HT_SINE(ndarray real)
 
 HT_SINE(real)
@@ -61,11 +75,14 @@ Inputs:
 Outputs:
     sine
     leadsine"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.HT_SINE), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.HT_SINE, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.HT_SINE, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def HT_TRENDMODE(close: Expr) -> Expr:  # ['integer']
+def HT_TRENDMODE(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """HT_TRENDMODE(ndarray real)
 
 HT_TRENDMODE(real)
@@ -76,10 +93,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.HT_TRENDMODE), return_dtype=Int32)
+    dtype = Int32
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.HT_TRENDMODE, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.HT_TRENDMODE, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ADD(high: Expr, low: Expr) -> Expr:  # ['real']
+def ADD(high: Expr, low: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ADD(ndarray real0, ndarray real1)
 
 ADD(real0, real1)
@@ -91,10 +111,11 @@ Inputs:
     real1: (any ndarray)
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.ADD), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.ADD, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def DIV(high: Expr, low: Expr) -> Expr:  # ['real']
+def DIV(high: Expr, low: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """DIV(ndarray real0, ndarray real1)
 
 DIV(real0, real1)
@@ -106,10 +127,11 @@ Inputs:
     real1: (any ndarray)
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.DIV), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.DIV, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def MAX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def MAX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MAX(ndarray real, int timeperiod=-0x80000000)
 
 MAX(real[, timeperiod=?])
@@ -122,10 +144,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MAX, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MAX, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MAX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MAXINDEX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['integer']
+def MAXINDEX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """MAXINDEX(ndarray real, int timeperiod=-0x80000000)
 
 MAXINDEX(real[, timeperiod=?])
@@ -138,10 +163,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MAXINDEX, timeperiod), return_dtype=Int32)
+    dtype = Int32
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MAXINDEX, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MAXINDEX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MIN(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def MIN(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MIN(ndarray real, int timeperiod=-0x80000000)
 
 MIN(real[, timeperiod=?])
@@ -154,10 +182,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MIN, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MIN, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MIN, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MININDEX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['integer']
+def MININDEX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """MININDEX(ndarray real, int timeperiod=-0x80000000)
 
 MININDEX(real[, timeperiod=?])
@@ -170,10 +201,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MININDEX, timeperiod), return_dtype=Int32)
+    dtype = Int32
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MININDEX, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MININDEX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MINMAX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['min', 'max']
+def MINMAX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['min', 'max']
     """MINMAX(ndarray real, int timeperiod=-0x80000000)
 
 MINMAX(real[, timeperiod=?])
@@ -187,11 +221,14 @@ Parameters:
 Outputs:
     min
     max"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MINMAX, timeperiod), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MINMAX, timeperiod, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MINMAX, timeperiod, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MINMAXINDEX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['minidx', 'maxidx']
+def MINMAXINDEX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['minidx', 'maxidx']
     """MINMAXINDEX(ndarray real, int timeperiod=-0x80000000)
 
 MINMAXINDEX(real[, timeperiod=?])
@@ -205,11 +242,14 @@ Parameters:
 Outputs:
     minidx
     maxidx"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MINMAXINDEX, timeperiod), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MINMAXINDEX, timeperiod, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MINMAXINDEX, timeperiod, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MULT(high: Expr, low: Expr) -> Expr:  # ['real']
+def MULT(high: Expr, low: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MULT(ndarray real0, ndarray real1)
 
 MULT(real0, real1)
@@ -221,10 +261,11 @@ Inputs:
     real1: (any ndarray)
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MULT), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MULT, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def SUB(high: Expr, low: Expr) -> Expr:  # ['real']
+def SUB(high: Expr, low: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SUB(ndarray real0, ndarray real1)
 
 SUB(real0, real1)
@@ -236,10 +277,11 @@ Inputs:
     real1: (any ndarray)
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SUB), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SUB, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def SUM(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def SUM(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SUM(ndarray real, int timeperiod=-0x80000000)
 
 SUM(real[, timeperiod=?])
@@ -252,10 +294,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.SUM, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.SUM, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.SUM, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ACOS(close: Expr) -> Expr:  # ['real']
+def ACOS(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ACOS(ndarray real)
 
 ACOS(real)
@@ -266,10 +311,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ACOS), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ACOS, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ACOS, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ASIN(close: Expr) -> Expr:  # ['real']
+def ASIN(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ASIN(ndarray real)
 
 ASIN(real)
@@ -280,10 +328,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ASIN), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ASIN, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ASIN, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ATAN(close: Expr) -> Expr:  # ['real']
+def ATAN(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ATAN(ndarray real)
 
 ATAN(real)
@@ -294,10 +345,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ATAN), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ATAN, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ATAN, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def CEIL(close: Expr) -> Expr:  # ['real']
+def CEIL(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """CEIL(ndarray real)
 
 CEIL(real)
@@ -308,10 +362,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.CEIL), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.CEIL, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.CEIL, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def COS(close: Expr) -> Expr:  # ['real']
+def COS(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """COS(ndarray real)
 
 COS(real)
@@ -322,10 +379,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.COS), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.COS, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.COS, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def COSH(close: Expr) -> Expr:  # ['real']
+def COSH(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """COSH(ndarray real)
 
 COSH(real)
@@ -336,10 +396,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.COSH), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.COSH, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.COSH, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def EXP(close: Expr) -> Expr:  # ['real']
+def EXP(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """EXP(ndarray real)
 
 EXP(real)
@@ -350,10 +413,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.EXP), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.EXP, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.EXP, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def FLOOR(close: Expr) -> Expr:  # ['real']
+def FLOOR(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """FLOOR(ndarray real)
 
 FLOOR(real)
@@ -364,10 +430,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.FLOOR), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.FLOOR, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.FLOOR, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def LN(close: Expr) -> Expr:  # ['real']
+def LN(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LN(ndarray real)
 
 LN(real)
@@ -378,10 +447,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LN), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LN, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LN, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def LOG10(close: Expr) -> Expr:  # ['real']
+def LOG10(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LOG10(ndarray real)
 
 LOG10(real)
@@ -392,10 +464,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LOG10), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LOG10, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LOG10, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def SIN(close: Expr) -> Expr:  # ['real']
+def SIN(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SIN(ndarray real)
 
 SIN(real)
@@ -406,10 +481,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.SIN), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.SIN, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.SIN, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def SINH(close: Expr) -> Expr:  # ['real']
+def SINH(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SINH(ndarray real)
 
 SINH(real)
@@ -420,10 +498,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.SINH), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.SINH, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.SINH, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def SQRT(close: Expr) -> Expr:  # ['real']
+def SQRT(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SQRT(ndarray real)
 
 SQRT(real)
@@ -434,10 +515,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.SQRT), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.SQRT, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.SQRT, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TAN(close: Expr) -> Expr:  # ['real']
+def TAN(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TAN(ndarray real)
 
 TAN(real)
@@ -448,10 +532,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TAN), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TAN, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TAN, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TANH(close: Expr) -> Expr:  # ['real']
+def TANH(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TANH(ndarray real)
 
 TANH(real)
@@ -462,10 +549,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TANH), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TANH, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TANH, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ADX(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def ADX(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ADX(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 ADX(high, low, close[, timeperiod=?])
@@ -478,10 +568,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ADX, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ADX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def ADXR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def ADXR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ADXR(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 ADXR(high, low, close[, timeperiod=?])
@@ -494,10 +585,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ADXR, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ADXR, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def APO(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, matype: float = 0.0) -> Expr:  # ['real']
+def APO(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """APO(ndarray real, int fastperiod=-0x80000000, int slowperiod=-0x80000000, int matype=0)
 
 APO(real[, fastperiod=?, slowperiod=?, matype=?])
@@ -512,10 +604,13 @@ Parameters:
     matype: 0 (Simple Moving Average)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.APO, fastperiod, slowperiod, matype), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.APO, fastperiod, slowperiod, matype, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.APO, fastperiod, slowperiod, matype, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def AROON(high: Expr, low: Expr, timeperiod: float = 14.0) -> Expr:  # ['aroondown', 'aroonup']
+def AROON(high: Expr, low: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['aroondown', 'aroonup']
     """AROON(ndarray high, ndarray low, int timeperiod=-0x80000000)
 
 AROON(high, low[, timeperiod=?])
@@ -529,11 +624,12 @@ Parameters:
 Outputs:
     aroondown
     aroonup"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 2, dtype=float), _ta.AROON, timeperiod), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 2, dtype=float), _ta.AROON, timeperiod, dtype=ftype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def AROONOSC(high: Expr, low: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def AROONOSC(high: Expr, low: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """AROONOSC(ndarray high, ndarray low, int timeperiod=-0x80000000)
 
 AROONOSC(high, low[, timeperiod=?])
@@ -546,10 +642,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.AROONOSC, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.AROONOSC, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def BOP(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['real']
+def BOP(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """BOP(ndarray open, ndarray high, ndarray low, ndarray close)
 
 BOP(open, high, low, close)
@@ -560,10 +657,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     real"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.BOP), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.BOP, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CCI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def CCI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """CCI(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 CCI(high, low, close[, timeperiod=?])
@@ -576,10 +674,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.CCI, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.CCI, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def CMO(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def CMO(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """CMO(ndarray real, int timeperiod=-0x80000000)
 
 CMO(real[, timeperiod=?])
@@ -592,10 +691,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.CMO, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.CMO, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.CMO, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def DX(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def DX(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """DX(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 DX(high, low, close[, timeperiod=?])
@@ -608,10 +710,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.DX, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.DX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def MACD(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, signalperiod: float = 9.0) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
+def MACD(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, signalperiod: float = 9.0, partition_by: Optional[Expr] = None) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
     """MACD(ndarray real, int fastperiod=-0x80000000, int slowperiod=-0x80000000, int signalperiod=-0x80000000)
 
 MACD(real[, fastperiod=?, slowperiod=?, signalperiod=?])
@@ -628,11 +731,14 @@ Outputs:
     macd
     macdsignal
     macdhist"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(3)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MACD, fastperiod, slowperiod, signalperiod), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(3)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MACD, fastperiod, slowperiod, signalperiod, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MACD, fastperiod, slowperiod, signalperiod, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MACDEXT(close: Expr, fastperiod: float = 12.0, fastmatype: float = 0.0, slowperiod: float = 26.0, slowmatype: float = 0.0, signalperiod: float = 9.0, signalmatype: float = 0.0) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
+def MACDEXT(close: Expr, fastperiod: float = 12.0, fastmatype: float = 0.0, slowperiod: float = 26.0, slowmatype: float = 0.0, signalperiod: float = 9.0, signalmatype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
     """MACDEXT(ndarray real, int fastperiod=-0x80000000, int fastmatype=0, int slowperiod=-0x80000000, int slowmatype=0, int signalperiod=-0x80000000, int signalmatype=0)
 
 MACDEXT(real[, fastperiod=?, fastmatype=?, slowperiod=?, slowmatype=?, signalperiod=?, signalmatype=?])
@@ -652,11 +758,14 @@ Outputs:
     macd
     macdsignal
     macdhist"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(3)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MACDEXT, fastperiod, fastmatype, slowperiod, slowmatype, signalperiod, signalmatype), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(3)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MACDEXT, fastperiod, fastmatype, slowperiod, slowmatype, signalperiod, signalmatype, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MACDEXT, fastperiod, fastmatype, slowperiod, slowmatype, signalperiod, signalmatype, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MACDFIX(close: Expr, signalperiod: float = 9.0) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
+def MACDFIX(close: Expr, signalperiod: float = 9.0, partition_by: Optional[Expr] = None) -> Expr:  # ['macd', 'macdsignal', 'macdhist']
     """MACDFIX(ndarray real, int signalperiod=-0x80000000)
 
 MACDFIX(real[, signalperiod=?])
@@ -671,11 +780,14 @@ Outputs:
     macd
     macdsignal
     macdhist"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(3)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MACDFIX, signalperiod), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(3)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MACDFIX, signalperiod, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MACDFIX, signalperiod, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MFI(high: Expr, low: Expr, close: Expr, volume: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def MFI(high: Expr, low: Expr, close: Expr, volume: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MFI(ndarray high, ndarray low, ndarray close, ndarray volume, int timeperiod=-0x80000000)
 
 MFI(high, low, close, volume[, timeperiod=?])
@@ -688,10 +800,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.MFI, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.MFI, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def MINUS_DI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def MINUS_DI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MINUS_DI(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 MINUS_DI(high, low, close[, timeperiod=?])
@@ -704,10 +817,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.MINUS_DI, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.MINUS_DI, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def MINUS_DM(high: Expr, low: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def MINUS_DM(high: Expr, low: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MINUS_DM(ndarray high, ndarray low, int timeperiod=-0x80000000)
 
 MINUS_DM(high, low[, timeperiod=?])
@@ -720,10 +834,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MINUS_DM, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MINUS_DM, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def MOM(close: Expr, timeperiod: float = 10.0) -> Expr:  # ['real']
+def MOM(close: Expr, timeperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MOM(ndarray real, int timeperiod=-0x80000000)
 
 MOM(real[, timeperiod=?])
@@ -736,10 +851,13 @@ Parameters:
     timeperiod: 10
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MOM, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MOM, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MOM, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def PLUS_DI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def PLUS_DI(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """PLUS_DI(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 PLUS_DI(high, low, close[, timeperiod=?])
@@ -752,10 +870,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.PLUS_DI, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.PLUS_DI, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def PLUS_DM(high: Expr, low: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def PLUS_DM(high: Expr, low: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """PLUS_DM(ndarray high, ndarray low, int timeperiod=-0x80000000)
 
 PLUS_DM(high, low[, timeperiod=?])
@@ -768,10 +887,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.PLUS_DM, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.PLUS_DM, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def PPO(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, matype: float = 0.0) -> Expr:  # ['real']
+def PPO(close: Expr, fastperiod: float = 12.0, slowperiod: float = 26.0, matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """PPO(ndarray real, int fastperiod=-0x80000000, int slowperiod=-0x80000000, int matype=0)
 
 PPO(real[, fastperiod=?, slowperiod=?, matype=?])
@@ -786,10 +906,13 @@ Parameters:
     matype: 0 (Simple Moving Average)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.PPO, fastperiod, slowperiod, matype), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.PPO, fastperiod, slowperiod, matype, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.PPO, fastperiod, slowperiod, matype, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ROC(close: Expr, timeperiod: float = 10.0) -> Expr:  # ['real']
+def ROC(close: Expr, timeperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ROC(ndarray real, int timeperiod=-0x80000000)
 
 ROC(real[, timeperiod=?])
@@ -802,10 +925,13 @@ Parameters:
     timeperiod: 10
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ROC, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ROC, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ROC, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ROCP(close: Expr, timeperiod: float = 10.0) -> Expr:  # ['real']
+def ROCP(close: Expr, timeperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ROCP(ndarray real, int timeperiod=-0x80000000)
 
 ROCP(real[, timeperiod=?])
@@ -818,10 +944,13 @@ Parameters:
     timeperiod: 10
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ROCP, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ROCP, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ROCP, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ROCR(close: Expr, timeperiod: float = 10.0) -> Expr:  # ['real']
+def ROCR(close: Expr, timeperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ROCR(ndarray real, int timeperiod=-0x80000000)
 
 ROCR(real[, timeperiod=?])
@@ -834,10 +963,13 @@ Parameters:
     timeperiod: 10
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ROCR, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ROCR, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ROCR, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ROCR100(close: Expr, timeperiod: float = 10.0) -> Expr:  # ['real']
+def ROCR100(close: Expr, timeperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ROCR100(ndarray real, int timeperiod=-0x80000000)
 
 ROCR100(real[, timeperiod=?])
@@ -850,10 +982,13 @@ Parameters:
     timeperiod: 10
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.ROCR100, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.ROCR100, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.ROCR100, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def RSI(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def RSI(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """RSI(ndarray real, int timeperiod=-0x80000000)
 
 RSI(real[, timeperiod=?])
@@ -866,10 +1001,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.RSI, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.RSI, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.RSI, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def STOCH(high: Expr, low: Expr, close: Expr, fastk_period: float = 5.0, slowk_period: float = 3.0, slowk_matype: float = 0.0, slowd_period: float = 3.0, slowd_matype: float = 0.0) -> Expr:  # ['slowk', 'slowd']
+def STOCH(high: Expr, low: Expr, close: Expr, fastk_period: float = 5.0, slowk_period: float = 3.0, slowk_matype: float = 0.0, slowd_period: float = 3.0, slowd_matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['slowk', 'slowd']
     """STOCH(ndarray high, ndarray low, ndarray close, int fastk_period=-0x80000000, int slowk_period=-0x80000000, int slowk_matype=0, int slowd_period=-0x80000000, int slowd_matype=0)
 
 STOCH(high, low, close[, fastk_period=?, slowk_period=?, slowk_matype=?, slowd_period=?, slowd_matype=?])
@@ -887,11 +1025,12 @@ Parameters:
 Outputs:
     slowk
     slowd"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 3, dtype=float), _ta.STOCH, fastk_period, slowk_period, slowk_matype, slowd_period, slowd_matype), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 3, dtype=float), _ta.STOCH, fastk_period, slowk_period, slowk_matype, slowd_period, slowd_matype, dtype=ftype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def STOCHF(high: Expr, low: Expr, close: Expr, fastk_period: float = 5.0, fastd_period: float = 3.0, fastd_matype: float = 0.0) -> Expr:  # ['fastk', 'fastd']
+def STOCHF(high: Expr, low: Expr, close: Expr, fastk_period: float = 5.0, fastd_period: float = 3.0, fastd_matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['fastk', 'fastd']
     """STOCHF(ndarray high, ndarray low, ndarray close, int fastk_period=-0x80000000, int fastd_period=-0x80000000, int fastd_matype=0)
 
 STOCHF(high, low, close[, fastk_period=?, fastd_period=?, fastd_matype=?])
@@ -907,11 +1046,12 @@ Parameters:
 Outputs:
     fastk
     fastd"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 3, dtype=float), _ta.STOCHF, fastk_period, fastd_period, fastd_matype), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 3, dtype=float), _ta.STOCHF, fastk_period, fastd_period, fastd_matype, dtype=ftype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def STOCHRSI(close: Expr, timeperiod: float = 14.0, fastk_period: float = 5.0, fastd_period: float = 3.0, fastd_matype: float = 0.0) -> Expr:  # ['fastk', 'fastd']
+def STOCHRSI(close: Expr, timeperiod: float = 14.0, fastk_period: float = 5.0, fastd_period: float = 3.0, fastd_matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['fastk', 'fastd']
     """STOCHRSI(ndarray real, int timeperiod=-0x80000000, int fastk_period=-0x80000000, int fastd_period=-0x80000000, int fastd_matype=0)
 
 STOCHRSI(real[, timeperiod=?, fastk_period=?, fastd_period=?, fastd_matype=?])
@@ -928,11 +1068,14 @@ Parameters:
 Outputs:
     fastk
     fastd"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.STOCHRSI, timeperiod, fastk_period, fastd_period, fastd_matype), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.STOCHRSI, timeperiod, fastk_period, fastd_period, fastd_matype, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.STOCHRSI, timeperiod, fastk_period, fastd_period, fastd_matype, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TRIX(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def TRIX(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TRIX(ndarray real, int timeperiod=-0x80000000)
 
 TRIX(real[, timeperiod=?])
@@ -945,10 +1088,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TRIX, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TRIX, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TRIX, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ULTOSC(high: Expr, low: Expr, close: Expr, timeperiod1: float = 7.0, timeperiod2: float = 14.0, timeperiod3: float = 28.0) -> Expr:  # ['real']
+def ULTOSC(high: Expr, low: Expr, close: Expr, timeperiod1: float = 7.0, timeperiod2: float = 14.0, timeperiod3: float = 28.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ULTOSC(ndarray high, ndarray low, ndarray close, int timeperiod1=-0x80000000, int timeperiod2=-0x80000000, int timeperiod3=-0x80000000)
 
 ULTOSC(high, low, close[, timeperiod1=?, timeperiod2=?, timeperiod3=?])
@@ -963,10 +1109,11 @@ Parameters:
     timeperiod3: 28
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ULTOSC, timeperiod1, timeperiod2, timeperiod3), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ULTOSC, timeperiod1, timeperiod2, timeperiod3, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def WILLR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def WILLR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """WILLR(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 WILLR(high, low, close[, timeperiod=?])
@@ -979,10 +1126,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.WILLR, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.WILLR, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def BBANDS(close: Expr, timeperiod: float = 5.0, nbdevup: float = 2.0, nbdevdn: float = 2.0, matype: float = 0.0) -> Expr:  # ['upperband', 'middleband', 'lowerband']
+def BBANDS(close: Expr, timeperiod: float = 5.0, nbdevup: float = 2.0, nbdevdn: float = 2.0, matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['upperband', 'middleband', 'lowerband']
     """BBANDS(ndarray real, int timeperiod=-0x80000000, double nbdevup=-4e37, double nbdevdn=-4e37, int matype=0)
 
 BBANDS(real[, timeperiod=?, nbdevup=?, nbdevdn=?, matype=?])
@@ -1000,11 +1148,14 @@ Outputs:
     upperband
     middleband
     lowerband"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(3)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.BBANDS, timeperiod, nbdevup, nbdevdn, matype), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(3)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.BBANDS, timeperiod, nbdevup, nbdevdn, matype, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.BBANDS, timeperiod, nbdevup, nbdevdn, matype, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def DEMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def DEMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """DEMA(ndarray real, int timeperiod=-0x80000000)
 
 DEMA(real[, timeperiod=?])
@@ -1017,10 +1168,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.DEMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.DEMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.DEMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def EMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def EMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """EMA(ndarray real, int timeperiod=-0x80000000)
 
 EMA(real[, timeperiod=?])
@@ -1033,10 +1187,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.EMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.EMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.EMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def HT_TRENDLINE(close: Expr) -> Expr:  # ['real']
+def HT_TRENDLINE(close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """HT_TRENDLINE(ndarray real)
 
 HT_TRENDLINE(real)
@@ -1047,10 +1204,13 @@ Inputs:
     real: (any ndarray)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.HT_TRENDLINE), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.HT_TRENDLINE, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.HT_TRENDLINE, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def KAMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def KAMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """KAMA(ndarray real, int timeperiod=-0x80000000)
 
 KAMA(real[, timeperiod=?])
@@ -1063,10 +1223,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.KAMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.KAMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.KAMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MA(close: Expr, timeperiod: float = 30.0, matype: float = 0.0) -> Expr:  # ['real']
+def MA(close: Expr, timeperiod: float = 30.0, matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MA(ndarray real, int timeperiod=-0x80000000, int matype=0)
 
 MA(real[, timeperiod=?, matype=?])
@@ -1080,10 +1243,13 @@ Parameters:
     matype: 0 (Simple Moving Average)
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MA, timeperiod, matype), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MA, timeperiod, matype, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MA, timeperiod, matype, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MAMA(close: Expr, fastlimit: float = 0.5, slowlimit: float = 0.05) -> Expr:  # ['mama', 'fama']
+def MAMA(close: Expr, fastlimit: float = 0.5, slowlimit: float = 0.05, partition_by: Optional[Expr] = None) -> Expr:  # ['mama', 'fama']
     """MAMA(ndarray real, double fastlimit=-4e37, double slowlimit=-4e37)
 
 MAMA(real[, fastlimit=?, slowlimit=?])
@@ -1098,11 +1264,14 @@ Parameters:
 Outputs:
     mama
     fama"""
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return close.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), _ta.MAMA, fastlimit, slowlimit), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), _ta.MAMA, fastlimit, slowlimit, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), _ta.MAMA, fastlimit, slowlimit, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MAVP(close: Expr, periods: Expr, minperiod: float = 2.0, maxperiod: float = 30.0, matype: float = 0.0) -> Expr:  # ['real']
+def MAVP(close: Expr, periods: Expr, minperiod: float = 2.0, maxperiod: float = 30.0, matype: float = 0.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MAVP(ndarray real, ndarray periods, int minperiod=-0x80000000, int maxperiod=-0x80000000, int matype=0)
 
 MAVP(real, periods[, minperiod=?, maxperiod=?, matype=?])
@@ -1118,10 +1287,11 @@ Parameters:
     matype: 0 (Simple Moving Average)
 Outputs:
     real"""
-    return struct(f0=close, f1=periods).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MAVP, minperiod, maxperiod, matype), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=close, f1=periods).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MAVP, minperiod, maxperiod, matype, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def MIDPOINT(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def MIDPOINT(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MIDPOINT(ndarray real, int timeperiod=-0x80000000)
 
 MIDPOINT(real[, timeperiod=?])
@@ -1134,10 +1304,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.MIDPOINT, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.MIDPOINT, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.MIDPOINT, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def MIDPRICE(high: Expr, low: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def MIDPRICE(high: Expr, low: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MIDPRICE(ndarray high, ndarray low, int timeperiod=-0x80000000)
 
 MIDPRICE(high, low[, timeperiod=?])
@@ -1150,10 +1323,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MIDPRICE, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MIDPRICE, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def SAR(high: Expr, low: Expr, acceleration: float = 0.02, maximum: float = 0.2) -> Expr:  # ['real']
+def SAR(high: Expr, low: Expr, acceleration: float = 0.02, maximum: float = 0.2, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SAR(ndarray high, ndarray low, double acceleration=0.02, double maximum=0.2)
 
 SAR(high, low[, acceleration=?, maximum=?])
@@ -1167,10 +1341,11 @@ Parameters:
     maximum: 0.2
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SAR, acceleration, maximum), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SAR, acceleration, maximum, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def SAREXT(high: Expr, low: Expr, startvalue: float = 0.0, offsetonreverse: float = 0.0, accelerationinitlong: float = 0.02, accelerationlong: float = 0.02, accelerationmaxlong: float = 0.2, accelerationinitshort: float = 0.02, accelerationshort: float = 0.02, accelerationmaxshort: float = 0.2) -> Expr:  # ['real']
+def SAREXT(high: Expr, low: Expr, startvalue: float = 0.0, offsetonreverse: float = 0.0, accelerationinitlong: float = 0.02, accelerationlong: float = 0.02, accelerationmaxlong: float = 0.2, accelerationinitshort: float = 0.02, accelerationshort: float = 0.02, accelerationmaxshort: float = 0.2, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SAREXT(ndarray high, ndarray low, double startvalue=-4e37, double offsetonreverse=-4e37, double accelerationinitlong=-4e37, double accelerationlong=-4e37, double accelerationmaxlong=-4e37, double accelerationinitshort=-4e37, double accelerationshort=-4e37, double accelerationmaxshort=-4e37)
 
 SAREXT(high, low[, startvalue=?, offsetonreverse=?, accelerationinitlong=?, accelerationlong=?, accelerationmaxlong=?, accelerationinitshort=?, accelerationshort=?, accelerationmaxshort=?])
@@ -1190,10 +1365,11 @@ Parameters:
     accelerationmaxshort: 0.2
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SAREXT, startvalue, offsetonreverse, accelerationinitlong, accelerationlong, accelerationmaxlong, accelerationinitshort, accelerationshort, accelerationmaxshort), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.SAREXT, startvalue, offsetonreverse, accelerationinitlong, accelerationlong, accelerationmaxlong, accelerationinitshort, accelerationshort, accelerationmaxshort, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def SMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def SMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """SMA(ndarray real, int timeperiod=-0x80000000)
 
 SMA(real[, timeperiod=?])
@@ -1206,10 +1382,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.SMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.SMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.SMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def T3(close: Expr, timeperiod: float = 5.0, vfactor: float = 0.7) -> Expr:  # ['real']
+def T3(close: Expr, timeperiod: float = 5.0, vfactor: float = 0.7, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """T3(ndarray real, int timeperiod=-0x80000000, double vfactor=-4e37)
 
 T3(real[, timeperiod=?, vfactor=?])
@@ -1223,10 +1402,13 @@ Parameters:
     vfactor: 0.7
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.T3, timeperiod, vfactor), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.T3, timeperiod, vfactor, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.T3, timeperiod, vfactor, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TEMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def TEMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TEMA(ndarray real, int timeperiod=-0x80000000)
 
 TEMA(real[, timeperiod=?])
@@ -1239,10 +1421,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TEMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TEMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TEMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TRIMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def TRIMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TRIMA(ndarray real, int timeperiod=-0x80000000)
 
 TRIMA(real[, timeperiod=?])
@@ -1255,10 +1440,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TRIMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TRIMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TRIMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def WMA(close: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def WMA(close: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """WMA(ndarray real, int timeperiod=-0x80000000)
 
 WMA(real[, timeperiod=?])
@@ -1271,10 +1459,13 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.WMA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.WMA, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.WMA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def CDL2CROWS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL2CROWS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL2CROWS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL2CROWS(open, high, low, close)
@@ -1285,10 +1476,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL2CROWS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL2CROWS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3BLACKCROWS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3BLACKCROWS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3BLACKCROWS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3BLACKCROWS(open, high, low, close)
@@ -1299,10 +1491,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3BLACKCROWS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3BLACKCROWS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3INSIDE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3INSIDE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3INSIDE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3INSIDE(open, high, low, close)
@@ -1313,10 +1506,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3INSIDE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3INSIDE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3LINESTRIKE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3LINESTRIKE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3LINESTRIKE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3LINESTRIKE(open, high, low, close)
@@ -1327,10 +1521,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3LINESTRIKE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3LINESTRIKE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3OUTSIDE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3OUTSIDE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3OUTSIDE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3OUTSIDE(open, high, low, close)
@@ -1341,10 +1536,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3OUTSIDE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3OUTSIDE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3STARSINSOUTH(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3STARSINSOUTH(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3STARSINSOUTH(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3STARSINSOUTH(open, high, low, close)
@@ -1355,10 +1551,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3STARSINSOUTH), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3STARSINSOUTH, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDL3WHITESOLDIERS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDL3WHITESOLDIERS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDL3WHITESOLDIERS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDL3WHITESOLDIERS(open, high, low, close)
@@ -1369,10 +1566,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3WHITESOLDIERS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDL3WHITESOLDIERS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLABANDONEDBABY(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3) -> Expr:  # ['integer']
+def CDLABANDONEDBABY(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLABANDONEDBABY(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.3)
 
 CDLABANDONEDBABY(open, high, low, close[, penetration=?])
@@ -1385,10 +1583,11 @@ Parameters:
     penetration: 0.3
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLABANDONEDBABY, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLABANDONEDBABY, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLADVANCEBLOCK(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLADVANCEBLOCK(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLADVANCEBLOCK(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLADVANCEBLOCK(open, high, low, close)
@@ -1399,10 +1598,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLADVANCEBLOCK), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLADVANCEBLOCK, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLBELTHOLD(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLBELTHOLD(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLBELTHOLD(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLBELTHOLD(open, high, low, close)
@@ -1413,10 +1613,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLBELTHOLD), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLBELTHOLD, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLBREAKAWAY(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLBREAKAWAY(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLBREAKAWAY(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLBREAKAWAY(open, high, low, close)
@@ -1427,10 +1628,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLBREAKAWAY), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLBREAKAWAY, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLCLOSINGMARUBOZU(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLCLOSINGMARUBOZU(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLCLOSINGMARUBOZU(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLCLOSINGMARUBOZU(open, high, low, close)
@@ -1441,10 +1643,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCLOSINGMARUBOZU), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCLOSINGMARUBOZU, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLCONCEALBABYSWALL(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLCONCEALBABYSWALL(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLCONCEALBABYSWALL(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLCONCEALBABYSWALL(open, high, low, close)
@@ -1455,10 +1658,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCONCEALBABYSWALL), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCONCEALBABYSWALL, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLCOUNTERATTACK(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLCOUNTERATTACK(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLCOUNTERATTACK(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLCOUNTERATTACK(open, high, low, close)
@@ -1469,10 +1673,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCOUNTERATTACK), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLCOUNTERATTACK, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLDARKCLOUDCOVER(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.5) -> Expr:  # ['integer']
+def CDLDARKCLOUDCOVER(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.5, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLDARKCLOUDCOVER(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.5)
 
 CDLDARKCLOUDCOVER(open, high, low, close[, penetration=?])
@@ -1485,10 +1690,11 @@ Parameters:
     penetration: 0.5
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDARKCLOUDCOVER, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDARKCLOUDCOVER, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLDOJI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLDOJI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLDOJI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLDOJI(open, high, low, close)
@@ -1499,10 +1705,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDOJI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDOJI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLDOJISTAR(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLDOJISTAR(open, high, low, close)
@@ -1513,10 +1720,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDOJISTAR), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDOJISTAR, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLDRAGONFLYDOJI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLDRAGONFLYDOJI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLDRAGONFLYDOJI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLDRAGONFLYDOJI(open, high, low, close)
@@ -1527,10 +1735,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDRAGONFLYDOJI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLDRAGONFLYDOJI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLENGULFING(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLENGULFING(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLENGULFING(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLENGULFING(open, high, low, close)
@@ -1541,10 +1750,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLENGULFING), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLENGULFING, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLEVENINGDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3) -> Expr:  # ['integer']
+def CDLEVENINGDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLEVENINGDOJISTAR(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.3)
 
 CDLEVENINGDOJISTAR(open, high, low, close[, penetration=?])
@@ -1557,10 +1767,11 @@ Parameters:
     penetration: 0.3
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLEVENINGDOJISTAR, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLEVENINGDOJISTAR, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLEVENINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3) -> Expr:  # ['integer']
+def CDLEVENINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLEVENINGSTAR(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.3)
 
 CDLEVENINGSTAR(open, high, low, close[, penetration=?])
@@ -1573,10 +1784,11 @@ Parameters:
     penetration: 0.3
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLEVENINGSTAR, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLEVENINGSTAR, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLGAPSIDESIDEWHITE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLGAPSIDESIDEWHITE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLGAPSIDESIDEWHITE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLGAPSIDESIDEWHITE(open, high, low, close)
@@ -1587,10 +1799,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLGAPSIDESIDEWHITE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLGAPSIDESIDEWHITE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLGRAVESTONEDOJI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLGRAVESTONEDOJI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLGRAVESTONEDOJI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLGRAVESTONEDOJI(open, high, low, close)
@@ -1601,10 +1814,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLGRAVESTONEDOJI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLGRAVESTONEDOJI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHAMMER(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHAMMER(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHAMMER(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHAMMER(open, high, low, close)
@@ -1615,10 +1829,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHAMMER), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHAMMER, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHANGINGMAN(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHANGINGMAN(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHANGINGMAN(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHANGINGMAN(open, high, low, close)
@@ -1629,10 +1844,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHANGINGMAN), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHANGINGMAN, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHARAMI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHARAMI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHARAMI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHARAMI(open, high, low, close)
@@ -1643,10 +1859,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHARAMI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHARAMI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHARAMICROSS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHARAMICROSS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHARAMICROSS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHARAMICROSS(open, high, low, close)
@@ -1657,10 +1874,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHARAMICROSS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHARAMICROSS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHIGHWAVE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHIGHWAVE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHIGHWAVE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHIGHWAVE(open, high, low, close)
@@ -1671,10 +1889,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIGHWAVE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIGHWAVE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHIKKAKE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHIKKAKE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHIKKAKE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHIKKAKE(open, high, low, close)
@@ -1685,10 +1904,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIKKAKE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIKKAKE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHIKKAKEMOD(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHIKKAKEMOD(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHIKKAKEMOD(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHIKKAKEMOD(open, high, low, close)
@@ -1699,10 +1919,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIKKAKEMOD), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHIKKAKEMOD, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLHOMINGPIGEON(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLHOMINGPIGEON(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLHOMINGPIGEON(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLHOMINGPIGEON(open, high, low, close)
@@ -1713,10 +1934,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHOMINGPIGEON), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLHOMINGPIGEON, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLIDENTICAL3CROWS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLIDENTICAL3CROWS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLIDENTICAL3CROWS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLIDENTICAL3CROWS(open, high, low, close)
@@ -1727,10 +1949,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLIDENTICAL3CROWS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLIDENTICAL3CROWS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLINNECK(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLINNECK(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLINNECK(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLINNECK(open, high, low, close)
@@ -1741,10 +1964,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLINNECK), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLINNECK, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLINVERTEDHAMMER(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLINVERTEDHAMMER(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLINVERTEDHAMMER(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLINVERTEDHAMMER(open, high, low, close)
@@ -1755,10 +1979,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLINVERTEDHAMMER), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLINVERTEDHAMMER, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLKICKING(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLKICKING(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLKICKING(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLKICKING(open, high, low, close)
@@ -1769,10 +1994,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLKICKING), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLKICKING, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLKICKINGBYLENGTH(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLKICKINGBYLENGTH(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLKICKINGBYLENGTH(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLKICKINGBYLENGTH(open, high, low, close)
@@ -1783,10 +2009,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLKICKINGBYLENGTH), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLKICKINGBYLENGTH, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLLADDERBOTTOM(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLLADDERBOTTOM(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLLADDERBOTTOM(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLLADDERBOTTOM(open, high, low, close)
@@ -1797,10 +2024,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLADDERBOTTOM), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLADDERBOTTOM, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLLONGLEGGEDDOJI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLLONGLEGGEDDOJI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLLONGLEGGEDDOJI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLLONGLEGGEDDOJI(open, high, low, close)
@@ -1811,10 +2039,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLONGLEGGEDDOJI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLONGLEGGEDDOJI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLLONGLINE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLLONGLINE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLLONGLINE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLLONGLINE(open, high, low, close)
@@ -1825,10 +2054,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLONGLINE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLLONGLINE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLMARUBOZU(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLMARUBOZU(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLMARUBOZU(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLMARUBOZU(open, high, low, close)
@@ -1839,10 +2069,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMARUBOZU), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMARUBOZU, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLMATCHINGLOW(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLMATCHINGLOW(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLMATCHINGLOW(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLMATCHINGLOW(open, high, low, close)
@@ -1853,10 +2084,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMATCHINGLOW), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMATCHINGLOW, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLMATHOLD(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.5) -> Expr:  # ['integer']
+def CDLMATHOLD(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.5, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLMATHOLD(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.5)
 
 CDLMATHOLD(open, high, low, close[, penetration=?])
@@ -1869,10 +2101,11 @@ Parameters:
     penetration: 0.5
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMATHOLD, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMATHOLD, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLMORNINGDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3) -> Expr:  # ['integer']
+def CDLMORNINGDOJISTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLMORNINGDOJISTAR(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.3)
 
 CDLMORNINGDOJISTAR(open, high, low, close[, penetration=?])
@@ -1885,10 +2118,11 @@ Parameters:
     penetration: 0.3
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMORNINGDOJISTAR, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMORNINGDOJISTAR, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLMORNINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3) -> Expr:  # ['integer']
+def CDLMORNINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr, penetration: float = 0.3, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLMORNINGSTAR(ndarray open, ndarray high, ndarray low, ndarray close, double penetration=0.3)
 
 CDLMORNINGSTAR(open, high, low, close[, penetration=?])
@@ -1901,10 +2135,11 @@ Parameters:
     penetration: 0.3
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMORNINGSTAR, penetration), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLMORNINGSTAR, penetration, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLONNECK(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLONNECK(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLONNECK(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLONNECK(open, high, low, close)
@@ -1915,10 +2150,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLONNECK), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLONNECK, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLPIERCING(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLPIERCING(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLPIERCING(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLPIERCING(open, high, low, close)
@@ -1929,10 +2165,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLPIERCING), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLPIERCING, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLRICKSHAWMAN(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLRICKSHAWMAN(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLRICKSHAWMAN(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLRICKSHAWMAN(open, high, low, close)
@@ -1943,10 +2180,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLRICKSHAWMAN), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLRICKSHAWMAN, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLRISEFALL3METHODS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLRISEFALL3METHODS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLRISEFALL3METHODS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLRISEFALL3METHODS(open, high, low, close)
@@ -1957,10 +2195,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLRISEFALL3METHODS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLRISEFALL3METHODS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSEPARATINGLINES(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSEPARATINGLINES(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSEPARATINGLINES(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSEPARATINGLINES(open, high, low, close)
@@ -1971,10 +2210,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSEPARATINGLINES), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSEPARATINGLINES, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSHOOTINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSHOOTINGSTAR(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSHOOTINGSTAR(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSHOOTINGSTAR(open, high, low, close)
@@ -1985,10 +2225,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSHOOTINGSTAR), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSHOOTINGSTAR, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSHORTLINE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSHORTLINE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSHORTLINE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSHORTLINE(open, high, low, close)
@@ -1999,10 +2240,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSHORTLINE), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSHORTLINE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSPINNINGTOP(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSPINNINGTOP(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSPINNINGTOP(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSPINNINGTOP(open, high, low, close)
@@ -2013,10 +2255,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSPINNINGTOP), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSPINNINGTOP, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSTALLEDPATTERN(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSTALLEDPATTERN(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSTALLEDPATTERN(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSTALLEDPATTERN(open, high, low, close)
@@ -2027,10 +2270,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSTALLEDPATTERN), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSTALLEDPATTERN, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLSTICKSANDWICH(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLSTICKSANDWICH(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLSTICKSANDWICH(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLSTICKSANDWICH(open, high, low, close)
@@ -2041,10 +2285,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSTICKSANDWICH), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLSTICKSANDWICH, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLTAKURI(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLTAKURI(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLTAKURI(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLTAKURI(open, high, low, close)
@@ -2055,10 +2300,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTAKURI), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTAKURI, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLTASUKIGAP(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLTASUKIGAP(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLTASUKIGAP(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLTASUKIGAP(open, high, low, close)
@@ -2069,10 +2315,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTASUKIGAP), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTASUKIGAP, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLTHRUSTING(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLTHRUSTING(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLTHRUSTING(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLTHRUSTING(open, high, low, close)
@@ -2083,10 +2330,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTHRUSTING), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTHRUSTING, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLTRISTAR(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLTRISTAR(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLTRISTAR(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLTRISTAR(open, high, low, close)
@@ -2097,10 +2345,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTRISTAR), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLTRISTAR, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLUNIQUE3RIVER(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLUNIQUE3RIVER(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLUNIQUE3RIVER(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLUNIQUE3RIVER(open, high, low, close)
@@ -2111,10 +2360,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLUNIQUE3RIVER), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLUNIQUE3RIVER, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLUPSIDEGAP2CROWS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLUPSIDEGAP2CROWS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLUPSIDEGAP2CROWS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLUPSIDEGAP2CROWS(open, high, low, close)
@@ -2125,10 +2375,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLUPSIDEGAP2CROWS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLUPSIDEGAP2CROWS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def CDLXSIDEGAP3METHODS(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['integer']
+def CDLXSIDEGAP3METHODS(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['integer']
     """CDLXSIDEGAP3METHODS(ndarray open, ndarray high, ndarray low, ndarray close)
 
 CDLXSIDEGAP3METHODS(open, high, low, close)
@@ -2139,10 +2390,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     integer (values are -100, 0 or 100)"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLXSIDEGAP3METHODS), return_dtype=Int32)
+    dtype = Int32
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.CDLXSIDEGAP3METHODS, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def AVGPRICE(open: Expr, high: Expr, low: Expr, close: Expr) -> Expr:  # ['real']
+def AVGPRICE(open: Expr, high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """AVGPRICE(ndarray open, ndarray high, ndarray low, ndarray close)
 
 AVGPRICE(open, high, low, close)
@@ -2153,10 +2405,11 @@ Inputs:
     prices: ['open', 'high', 'low', 'close']
 Outputs:
     real"""
-    return struct(f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.AVGPRICE), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=open, f1=high, f2=low, f3=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.AVGPRICE, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def MEDPRICE(high: Expr, low: Expr) -> Expr:  # ['real']
+def MEDPRICE(high: Expr, low: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """MEDPRICE(ndarray high, ndarray low)
 
 MEDPRICE(high, low)
@@ -2167,10 +2420,11 @@ Inputs:
     prices: ['high', 'low']
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MEDPRICE), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.MEDPRICE, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def TYPPRICE(high: Expr, low: Expr, close: Expr) -> Expr:  # ['real']
+def TYPPRICE(high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TYPPRICE(ndarray high, ndarray low, ndarray close)
 
 TYPPRICE(high, low, close)
@@ -2181,10 +2435,11 @@ Inputs:
     prices: ['high', 'low', 'close']
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.TYPPRICE), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.TYPPRICE, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def WCLPRICE(high: Expr, low: Expr, close: Expr) -> Expr:  # ['real']
+def WCLPRICE(high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """WCLPRICE(ndarray high, ndarray low, ndarray close)
 
 WCLPRICE(high, low, close)
@@ -2195,10 +2450,11 @@ Inputs:
     prices: ['high', 'low', 'close']
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.WCLPRICE), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.WCLPRICE, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def BETA(high: Expr, low: Expr, timeperiod: float = 5.0) -> Expr:  # ['real']
+def BETA(high: Expr, low: Expr, timeperiod: float = 5.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """BETA(ndarray real0, ndarray real1, int timeperiod=-0x80000000)
 
 BETA(real0, real1[, timeperiod=?])
@@ -2212,10 +2468,11 @@ Parameters:
     timeperiod: 5
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.BETA, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.BETA, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def CORREL(high: Expr, low: Expr, timeperiod: float = 30.0) -> Expr:  # ['real']
+def CORREL(high: Expr, low: Expr, timeperiod: float = 30.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """CORREL(ndarray real0, ndarray real1, int timeperiod=-0x80000000)
 
 CORREL(real0, real1[, timeperiod=?])
@@ -2229,10 +2486,11 @@ Parameters:
     timeperiod: 30
 Outputs:
     real"""
-    return struct(f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.CORREL, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.CORREL, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def LINEARREG(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def LINEARREG(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LINEARREG(ndarray real, int timeperiod=-0x80000000)
 
 LINEARREG(real[, timeperiod=?])
@@ -2245,10 +2503,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LINEARREG, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LINEARREG, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LINEARREG, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def LINEARREG_ANGLE(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def LINEARREG_ANGLE(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LINEARREG_ANGLE(ndarray real, int timeperiod=-0x80000000)
 
 LINEARREG_ANGLE(real[, timeperiod=?])
@@ -2261,10 +2522,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LINEARREG_ANGLE, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LINEARREG_ANGLE, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LINEARREG_ANGLE, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def LINEARREG_INTERCEPT(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def LINEARREG_INTERCEPT(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LINEARREG_INTERCEPT(ndarray real, int timeperiod=-0x80000000)
 
 LINEARREG_INTERCEPT(real[, timeperiod=?])
@@ -2277,10 +2541,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LINEARREG_INTERCEPT, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LINEARREG_INTERCEPT, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LINEARREG_INTERCEPT, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def LINEARREG_SLOPE(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def LINEARREG_SLOPE(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """LINEARREG_SLOPE(ndarray real, int timeperiod=-0x80000000)
 
 LINEARREG_SLOPE(real[, timeperiod=?])
@@ -2293,10 +2560,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.LINEARREG_SLOPE, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.LINEARREG_SLOPE, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.LINEARREG_SLOPE, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def STDDEV(close: Expr, timeperiod: float = 5.0, nbdev: float = 1.0) -> Expr:  # ['real']
+def STDDEV(close: Expr, timeperiod: float = 5.0, nbdev: float = 1.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """STDDEV(ndarray real, int timeperiod=-0x80000000, double nbdev=-4e37)
 
 STDDEV(real[, timeperiod=?, nbdev=?])
@@ -2310,10 +2580,13 @@ Parameters:
     nbdev: 1.0
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.STDDEV, timeperiod, nbdev), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.STDDEV, timeperiod, nbdev, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.STDDEV, timeperiod, nbdev, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def TSF(close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def TSF(close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TSF(ndarray real, int timeperiod=-0x80000000)
 
 TSF(real[, timeperiod=?])
@@ -2326,10 +2599,13 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.TSF, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.TSF, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.TSF, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def VAR(close: Expr, timeperiod: float = 5.0, nbdev: float = 1.0) -> Expr:  # ['real']
+def VAR(close: Expr, timeperiod: float = 5.0, nbdev: float = 1.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """VAR(ndarray real, int timeperiod=-0x80000000, double nbdev=-4e37)
 
 VAR(real[, timeperiod=?, nbdev=?])
@@ -2343,10 +2619,13 @@ Parameters:
     nbdev: 1.0
 Outputs:
     real"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _ta.VAR, timeperiod, nbdev), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), _ta.VAR, timeperiod, nbdev, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), _ta.VAR, timeperiod, nbdev, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ATR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def ATR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ATR(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 ATR(high, low, close[, timeperiod=?])
@@ -2359,10 +2638,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ATR, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.ATR, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def NATR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0) -> Expr:  # ['real']
+def NATR(high: Expr, low: Expr, close: Expr, timeperiod: float = 14.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """NATR(ndarray high, ndarray low, ndarray close, int timeperiod=-0x80000000)
 
 NATR(high, low, close[, timeperiod=?])
@@ -2375,10 +2655,11 @@ Parameters:
     timeperiod: 14
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.NATR, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.NATR, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def TRANGE(high: Expr, low: Expr, close: Expr) -> Expr:  # ['real']
+def TRANGE(high: Expr, low: Expr, close: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """TRANGE(ndarray high, ndarray low, ndarray close)
 
 TRANGE(high, low, close)
@@ -2389,10 +2670,11 @@ Inputs:
     prices: ['high', 'low', 'close']
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.TRANGE), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=float), _ta.TRANGE, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
-def AD(high: Expr, low: Expr, close: Expr, volume: Expr) -> Expr:  # ['real']
+def AD(high: Expr, low: Expr, close: Expr, volume: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """AD(ndarray high, ndarray low, ndarray close, ndarray volume)
 
 AD(high, low, close, volume)
@@ -2403,10 +2685,11 @@ Inputs:
     prices: ['high', 'low', 'close', 'volume']
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.AD), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.AD, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def ADOSC(high: Expr, low: Expr, close: Expr, volume: Expr, fastperiod: float = 3.0, slowperiod: float = 10.0) -> Expr:  # ['real']
+def ADOSC(high: Expr, low: Expr, close: Expr, volume: Expr, fastperiod: float = 3.0, slowperiod: float = 10.0, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """ADOSC(ndarray high, ndarray low, ndarray close, ndarray volume, int fastperiod=-0x80000000, int slowperiod=-0x80000000)
 
 ADOSC(high, low, close, volume[, fastperiod=?, slowperiod=?])
@@ -2420,10 +2703,11 @@ Parameters:
     slowperiod: 10
 Outputs:
     real"""
-    return struct(f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.ADOSC, fastperiod, slowperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=close, f3=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _ta.ADOSC, fastperiod, slowperiod, dtype=dtype, offsets=struct_to_offsets(xx, 4)), return_dtype=dtype)
 
 
-def OBV(close: Expr, volume: Expr) -> Expr:  # ['real']
+def OBV(close: Expr, volume: Expr, partition_by: Optional[Expr] = None) -> Expr:  # ['real']
     """OBV(ndarray real, ndarray volume)
 
 OBV(real, volume)
@@ -2435,4 +2719,167 @@ Inputs:
     prices: ['volume']
 Outputs:
     real"""
-    return struct(f0=close, f1=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.OBV), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=close, f1=volume).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=float), _ta.OBV, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
+
+
+__all__ = [
+    'HT_DCPERIOD',
+    'HT_DCPHASE',
+    'HT_PHASOR',
+    'HT_SINE',
+    'HT_TRENDMODE',
+    'ADD',
+    'DIV',
+    'MAX',
+    'MAXINDEX',
+    'MIN',
+    'MININDEX',
+    'MINMAX',
+    'MINMAXINDEX',
+    'MULT',
+    'SUB',
+    'SUM',
+    'ACOS',
+    'ASIN',
+    'ATAN',
+    'CEIL',
+    'COS',
+    'COSH',
+    'EXP',
+    'FLOOR',
+    'LN',
+    'LOG10',
+    'SIN',
+    'SINH',
+    'SQRT',
+    'TAN',
+    'TANH',
+    'ADX',
+    'ADXR',
+    'APO',
+    'AROON',
+    'AROONOSC',
+    'BOP',
+    'CCI',
+    'CMO',
+    'DX',
+    'MACD',
+    'MACDEXT',
+    'MACDFIX',
+    'MFI',
+    'MINUS_DI',
+    'MINUS_DM',
+    'MOM',
+    'PLUS_DI',
+    'PLUS_DM',
+    'PPO',
+    'ROC',
+    'ROCP',
+    'ROCR',
+    'ROCR100',
+    'RSI',
+    'STOCH',
+    'STOCHF',
+    'STOCHRSI',
+    'TRIX',
+    'ULTOSC',
+    'WILLR',
+    'BBANDS',
+    'DEMA',
+    'EMA',
+    'HT_TRENDLINE',
+    'KAMA',
+    'MA',
+    'MAMA',
+    'MAVP',
+    'MIDPOINT',
+    'MIDPRICE',
+    'SAR',
+    'SAREXT',
+    'SMA',
+    'T3',
+    'TEMA',
+    'TRIMA',
+    'WMA',
+    'CDL2CROWS',
+    'CDL3BLACKCROWS',
+    'CDL3INSIDE',
+    'CDL3LINESTRIKE',
+    'CDL3OUTSIDE',
+    'CDL3STARSINSOUTH',
+    'CDL3WHITESOLDIERS',
+    'CDLABANDONEDBABY',
+    'CDLADVANCEBLOCK',
+    'CDLBELTHOLD',
+    'CDLBREAKAWAY',
+    'CDLCLOSINGMARUBOZU',
+    'CDLCONCEALBABYSWALL',
+    'CDLCOUNTERATTACK',
+    'CDLDARKCLOUDCOVER',
+    'CDLDOJI',
+    'CDLDOJISTAR',
+    'CDLDRAGONFLYDOJI',
+    'CDLENGULFING',
+    'CDLEVENINGDOJISTAR',
+    'CDLEVENINGSTAR',
+    'CDLGAPSIDESIDEWHITE',
+    'CDLGRAVESTONEDOJI',
+    'CDLHAMMER',
+    'CDLHANGINGMAN',
+    'CDLHARAMI',
+    'CDLHARAMICROSS',
+    'CDLHIGHWAVE',
+    'CDLHIKKAKE',
+    'CDLHIKKAKEMOD',
+    'CDLHOMINGPIGEON',
+    'CDLIDENTICAL3CROWS',
+    'CDLINNECK',
+    'CDLINVERTEDHAMMER',
+    'CDLKICKING',
+    'CDLKICKINGBYLENGTH',
+    'CDLLADDERBOTTOM',
+    'CDLLONGLEGGEDDOJI',
+    'CDLLONGLINE',
+    'CDLMARUBOZU',
+    'CDLMATCHINGLOW',
+    'CDLMATHOLD',
+    'CDLMORNINGDOJISTAR',
+    'CDLMORNINGSTAR',
+    'CDLONNECK',
+    'CDLPIERCING',
+    'CDLRICKSHAWMAN',
+    'CDLRISEFALL3METHODS',
+    'CDLSEPARATINGLINES',
+    'CDLSHOOTINGSTAR',
+    'CDLSHORTLINE',
+    'CDLSPINNINGTOP',
+    'CDLSTALLEDPATTERN',
+    'CDLSTICKSANDWICH',
+    'CDLTAKURI',
+    'CDLTASUKIGAP',
+    'CDLTHRUSTING',
+    'CDLTRISTAR',
+    'CDLUNIQUE3RIVER',
+    'CDLUPSIDEGAP2CROWS',
+    'CDLXSIDEGAP3METHODS',
+    'AVGPRICE',
+    'MEDPRICE',
+    'TYPPRICE',
+    'WCLPRICE',
+    'BETA',
+    'CORREL',
+    'LINEARREG',
+    'LINEARREG_ANGLE',
+    'LINEARREG_INTERCEPT',
+    'LINEARREG_SLOPE',
+    'STDDEV',
+    'TSF',
+    'VAR',
+    'ATR',
+    'NATR',
+    'TRANGE',
+    'AD',
+    'ADOSC',
+    'OBV',
+]
@@ -1,15 +1,209 @@
-from polars_ta.tdx.arithmetic import *  # noqa
-from polars_ta.tdx.choice import *  # noqa
-from polars_ta.tdx.energy import *  # noqa
-from polars_ta.tdx.logical import *  # noqa
-from polars_ta.tdx.moving_average import *  # noqa
-from polars_ta.tdx.over_bought_over_sold import *  # noqa
-from polars_ta.tdx.pattern import *  # noqa
-from polars_ta.tdx.pattern_feature import *  # noqa
-from polars_ta.tdx.pressure_support import *  # noqa
-from polars_ta.tdx.reference import *  # noqa
-from polars_ta.tdx.statistic import *  # noqa
-from polars_ta.tdx.times import *  # noqa
-from polars_ta.tdx.trend import *  # noqa
-from polars_ta.tdx.trend_feature import *  # noqa
-from polars_ta.tdx.volume import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.tdx.arithmetic': [
+        'ACOS',
+        'ADD',
+        'ASIN',
+        'ATAN',
+        'CEILING',
+        'COS',
+        'EXP',
+        'FLOOR',
+        'FRACPART',
+        'INTPART',
+        'LN',
+        'LOG',
+        'MOD',
+        'POW',
+        'REVERSE',
+        'ROUND',
+        'ROUND2',
+        'SGN',
+        'SIGN',
+        'SIN',
+        'SUB',
+        'TAN',
+    ],
+    'polars_ta.tdx.choice': [
+        'IFF',
+        'IFN',
+        'VALUEWHEN',
+        'if_else',
+    ],
+    'polars_ta.tdx.energy': [
+        'BRAR_AR',
+        'BRAR_BR',
+        'CR',
+        'MASS',
+        'MEDPRICE',
+        'PSY',
+    ],
+    'polars_ta.tdx.logical': [
+        'ALL',
+        'ANY',
+        'DOWNNDAY',
+        'EXISTR',
+        'LONGCROSS',
+        'NDAY',
+        'UPNDAY',
+        'not_',
+    ],
+    'polars_ta.tdx.moving_average': [
+        'AVGPRICE',
+        'BBI',
+    ],
+    'polars_ta.tdx.over_bought_over_sold': [
+        'ATR',
+        'BIAS',
+        'CCI',
+        'KDJ',
+        'MFI',
+        'MTM',
+        'RSI',
+        'RSV',
+        'TYPPRICE',
+    ],
+    'polars_ta.tdx.pattern_feature': [
+        'BETWEEN',
+        'CROSS',
+        'LAST',
+        'NOT',
+        '仙人指路',
+        '低开大阳线',
+        '低点搜寻',
+        '出水芙蓉',
+        '出水芙蓉II',
+        '剑',
+        '单阳不破选股',
+        '四串阳',
+        '四串阴',
+        '回补跳空向上缺口',
+        '均线多头排列',
+        '均线空头排列',
+        '天量法则',
+        '强势整理',
+        '揉搓线',
+        '早晨之星',
+        '旭日初升',
+        '突破',
+        '老鸭头',
+        '蜻蜓点水',
+        '跳空缺口选股',
+        '近日创历史新低',
+        '近日创历史新高',
+        '高开大阴线',
+        '鸳鸯底',
+    ],
+    'polars_ta.tdx.pressure_support': [
+        'BOLL',
+        'BOLL_M',
+        'SQRT',
+    ],
+    'polars_ta.tdx.reference': [
+        'BARSLAST',
+        'BARSLASTCOUNT',
+        'BARSSINCE',
+        'BARSSINCEN',
+        'DIFF',
+        'DMA',
+        'EMA',
+        'EXPMA',
+        'EXPMEMA',
+        'FILTER',
+        'HHVBARS',
+        'HOD',
+        'LLVBARS',
+        'LOD',
+        'LOWRANGE',
+        'MAX',
+        'MEMA',
+        'MIN',
+        'MULAR',
+        'RANGE',
+        'REFX',
+        'SMA_CN',
+        'SUMIF',
+        'TMA',
+        'WMA',
+    ],
+    'polars_ta.tdx.statistic': [
+        'AVEDEV',
+        'COVAR',
+        'DEVSQ',
+        'RELATE',
+        'SLOPE',
+        'STD',
+        'STDDEV',
+        'STDP',
+        'VAR',
+        'VARP',
+        'ts_up_stat',
+    ],
+    'polars_ta.tdx.times': [
+        'FROMOPEN',
+        'FROMOPEN_1',
+    ],
+    'polars_ta.tdx.trend': [
+        'ADX',
+        'ADXR',
+        'DPO',
+        'EMV',
+        'MINUS_DI',
+        'MINUS_DM',
+        'PLUS_DI',
+        'PLUS_DM',
+        'TR',
+    ],
+    'polars_ta.tdx.trend_feature': [
+        'ABS',
+        'COUNT',
+        'EVERY',
+        'EXIST',
+        'HHV',
+        'LLV',
+        'MA',
+        'N天内出现以涨停收盘',
+        'N天内出现涨停',
+        'N天内有跳空向上缺口',
+        'N天内经常涨停',
+        'N日内上涨多于下跌',
+        'N日内下跌多于上涨',
+        'N日内创新低',
+        'N日内创新高',
+        'N日内阳线多于阴线',
+        'N日内阴线多于阳线',
+        'ts_WINNER_COST',
+        'ts_cum_max',
+        'ts_cum_min',
+        '下跌多日再放量上涨',
+        '价量渐低后阳包阴',
+        '单日放量',
+        '小步碎阳',
+        '平台整理',
+        '拉升后多日调整',
+        '持续放量',
+        '持续缩量',
+        '放量上攻',
+        '昨日底部十字星',
+        '温和放量上攻',
+        '突然放量',
+        '突破长期盘整',
+        '跳空高开或低开',
+        '连续N天收阳线',
+        '连续N天收阴线',
+        '间隔放量',
+        '阶段放量',
+        '阶段缩量',
+    ],
+    'polars_ta.tdx.volume': [
+        'CUMSUM',
+        'IF',
+        'OBV',
+        'REF',
+        'SUM',
+        'VR',
+    ],
+})
@@ -6,7 +6,7 @@ from numpy.lib.stride_tricks import sliding_window_view
 
 @jit(nopython=True, nogil=True, cache=True)
 def roll_avedev(x1, window):
-    out = full(x1.shape, np.nan, dtype=np.float64)
+    out = full(x1.shape, np.nan, dtype=x1.dtype)
     if len(x1) < window:
         return out
     a1 = sliding_window_view(x1, window)
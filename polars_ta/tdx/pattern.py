@@ -1,10 +1,15 @@
-from polars import Expr, Struct, Field, Float64, struct
+from typing import Optional
 
-from polars_ta.tdx._chip import _WINNER_COST
-from polars_ta.utils.numba_ import batches_i2_o2, struct_to_numpy
+from polars import Expr, Struct, Field, Float64
 
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i2_o2, struct_to_numpy, struct_with_partition, struct_to_offsets
 
-def ts_WINNER_COST(high: Expr, low: Expr, avg: Expr, turnover: Expr, close: Expr, cost: Expr = 0.5, step: float = 0.1) -> Expr:
+# 首次使用时才导入
+_chip = lazy_import('polars_ta.tdx._chip')
+
+
+def ts_WINNER_COST(high: Expr, low: Expr, avg: Expr, turnover: Expr, close: Expr, cost: Expr = 0.5, step: float = 0.1, partition_by: Optional[Expr] = None) -> Expr:
     """
     获利盘比例
         WINNER(CLOSE),表示以当前收市价卖出的获利盘比例,例如返回0.1表示10%获利盘;WINNER(10.5)表示10.5元价格的获利盘比例
@@ -28,6 +33,8 @@ def ts_WINNER_COST(high: Expr, low: Expr, avg: Expr, turnover: Expr, close: Expr
         成本比例，0~1
     step
         步长。一字涨停时，三角分布的底为1，高为2。但无法当成梯形计算面积，所以从中用半步长切开计算
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Returns
     -------
@@ -46,4 +53,4 @@ def ts_WINNER_COST(high: Expr, low: Expr, avg: Expr, turnover: Expr, close: Expr
 
     """
     dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return struct(f0=high, f1=low, f2=avg, f3=turnover, f4=close, f5=cost).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 6, dtype=float), _WINNER_COST, step), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=high, f1=low, f2=avg, f3=turnover, f4=close, f5=cost).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 6, dtype=float), _chip._WINNER_COST, step, offsets=struct_to_offsets(xx, 6)), return_dtype=dtype)
@@ -19,6 +19,8 @@ from polars_ta.wq.time_series import ts_sum as SUM
 ```
 
 """
+from typing import Optional
+
 from polars import Boolean, Int32, UInt16
 from polars import Expr
 from polars import when
@@ -26,8 +28,8 @@ from polars import when
 from polars_ta.ta.overlap import EMA as _ema
 from polars_ta.ta.overlap import SMA as MA
 from polars_ta.ta.volatility import TRANGE as TR  # noqa
-from polars_ta.tdx._nb import roll_bars_since_n
-from polars_ta.utils.numba_ import batches_i1_o1
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, struct_with_partition, struct_to_offsets
 from polars_ta.wq.arithmetic import max_ as MAX  # noqa
 from polars_ta.wq.arithmetic import min_ as MIN  # noqa
 from polars_ta.wq.time_series import ts_arg_max as HHVBARS  # noqa
@@ -41,6 +43,9 @@ from polars_ta.wq.time_series import ts_min as LLV  # noqa
 from polars_ta.wq.time_series import ts_product as MULAR  # noqa
 from polars_ta.wq.time_series import ts_sum as SUM
 
+# 首次使用时才导入
+_nb = lazy_import('polars_ta.tdx._nb')
+
 
 def BARSLAST(condition: Expr) -> Expr:
     """# of Observations since last time condition was true
@@ -66,10 +71,12 @@ def BARSSINCE(condition: Expr) -> Expr:
     return a - b
 
 
-def BARSSINCEN(condition: Expr, N: int = 30) -> Expr:
+def BARSSINCEN(condition: Expr, N: int = 30, partition_by: Optional[Expr] = None) -> Expr:
     """# of Observations since the first time condition was true (rolling within N observations)
     N周期内第一次X不为0到现在的天数"""
-    return condition.cast(Boolean).map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_bars_since_n, N, dtype=UInt16), return_dtype=UInt16)
+    if partition_by is None:
+        return condition.cast(Boolean).map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), _nb.roll_bars_since_n, N, dtype=UInt16), return_dtype=UInt16)
+    return struct_with_partition(partition_by, f0=condition.cast(Boolean)).map_batches(lambda xx: batches_i1_o1(xx.struct[0].to_numpy(), _nb.roll_bars_since_n, N, dtype=UInt16, offsets=struct_to_offsets(xx, 1)), return_dtype=UInt16)
 
 
 def CUMSUM(close: Expr) -> Expr:
@@ -1,16 +1,24 @@
-from polars import Expr, Struct, Field, Int64, Float64
+from typing import Optional
 
-from polars_ta.tdx._nb import roll_avedev, _up_stat
-from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2
+from polars import Expr, Struct, Field, Int64
+
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, float_dtype, series_to_numpy, struct_with_partition, struct_to_offsets
 from polars_ta.wq.time_series import ts_corr as RELATE  # noqa
 from polars_ta.wq.time_series import ts_covariance as COVAR  # noqa
 from polars_ta.wq.time_series import ts_std_dev as _ts_std_dev
 
+# 首次使用时才导入
+_nb = lazy_import('polars_ta.tdx._nb')
+
 
-def AVEDEV(close: Expr, timeperiod: int = 5) -> Expr:
+def AVEDEV(close: Expr, timeperiod: int = 5, partition_by: Optional[Expr] = None) -> Expr:
     """mean absolute deviation
     平均绝对偏差"""
-    return close.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_avedev, timeperiod), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return close.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _nb.roll_avedev, timeperiod, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=close).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _nb.roll_avedev, timeperiod, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
 def DEVSQ(close: Expr, timeperiod: int = 5) -> Expr:
@@ -46,13 +54,15 @@ def VARP(close: Expr, timeperiod: int = 5) -> Expr:
     return close.rolling_var(timeperiod, ddof=0)
 
 
-def ts_up_stat(x: Expr) -> Expr:
+def ts_up_stat(x: Expr, partition_by: Optional[Expr] = None) -> Expr:
     """T天N板统计，与通达信结果一样，最简为5天2板
 
     Parameters
     ----------
     x: Expr
         布尔序列，True表示涨停
+    partition_by: Expr
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Returns
     -------
@@ -89,4 +99,6 @@ def ts_up_stat(x: Expr) -> Expr:
 
     """
     dtype = Struct([Field(f"column_{i}", Int64) for i in range(3)])
-    return x.map_batches(lambda x1: batches_i1_o2(x1.to_numpy(), _up_stat), return_dtype=dtype)
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o2(x1.to_numpy(), _nb._up_stat), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o2(xx.struct[0].to_numpy(), _nb._up_stat, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
@@ -0,0 +1,211 @@
+"""
+numba实现的公共函数。由`polars_ta.utils.numba_`转发，首次使用时才导入numba
+"""
+from functools import lru_cache
+
+import numpy as np
+from numba import jit
+from numpy import full
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@jit(nopython=True, nogil=True, fastmath=True, cache=True)
+def isnan(x):
+    # https://github.com/numba/numba/issues/2919#issuecomment-747377615
+    if int(x) == -9223372036854775808:
+        return True
+    else:
+        return False
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def full_with_window_size(arr, fill_value, dtype=None, window_size: int = 1):
+    """创建一个更大的数组，填充后一截数据"""
+    out = full(arr.shape[0] + window_size - 1, fill_value, dtype=dtype)
+    out[window_size - 1:] = arr
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def sliding_window_with_min_periods(arr, window_size: int, min_periods: int):
+    """为rolling准备的数据，当数据长度不足时，用nan填充"""
+    windows = sliding_window_view(arr, window_size)
+    valid_counts = np.sum(~np.isnan(windows), axis=1)
+    # 修改这一行，使用布尔索引而不是np.where
+    result = windows.copy()
+    result[valid_counts < min_periods] = np.nan
+    return result
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _fill_window(buf, x, i: int, window_size: int):
+    """将以i结尾的窗口复制到buf，不足部分前端用nan填充。与full_with_window_size+sliding_window_view的窗口一致"""
+    start = i - window_size + 1
+    if start >= 0:
+        for j in range(window_size):
+            buf[j] = x[start + j]
+    else:
+        buf[:-start] = np.nan
+        for j in range(i + 1):
+            buf[j - start] = x[j]
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _update_valid(x, i: int, window_size: int, valid: int) -> int:
+    """滚动更新窗口内的有效值数量。加入x[i]，移出x[i-window_size]"""
+    if not np.isnan(x[i]):
+        valid += 1
+    if i >= window_size and not np.isnan(x[i - window_size]):
+        valid -= 1
+    return valid
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _neumaier_add(s, c, k: int, v: float):
+    """Neumaier补偿求和。s[k]累加v，舍入误差累计到c[k]，结果为s[k]+c[k]"""
+    t = s[k] + v
+    if abs(s[k]) >= abs(v):
+        c[k] += (s[k] - t) + v
+    else:
+        c[k] += (v - t) + s[k]
+    s[k] = t
+
+
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _neumaier_scalar(s, c, v):
+    """标量版的Neumaier补偿求和。返回新的(s, c)，累加器留在寄存器中，比数组版快"""
+    t = s + v
+    if abs(s) >= abs(v):
+        c += (s - t) + v
+    else:
+        c += (v - t) + s
+    return t, c
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _nanmean_range(x, start: int, end: int) -> float:
+    """x[start:end]中有效值的均值，没有有效值时返回0。用于滚动累加时选取锚点"""
+    total = 0.0
+    count = 0
+    for j in range(max(start, 0), end):
+        if not np.isnan(x[j]):
+            total += x[j]
+            count += 1
+    return total / count if count > 0 else 0.0
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _roll_1(x1: np.ndarray, window: int, min_periods: int, func, *args):
+    """流式滚动模板。不生成n*w的窗口矩阵，只用O(w)的缓冲区
+
+    窗口内有效值数量增量维护，不足min_periods时跳过。func为numba函数，签名为func(v1, *args)
+
+    Notes
+    -----
+    numba函数作为参数时无法落盘缓存，常用算子请参考roll_prod，用_update_valid与_fill_window写成独立函数
+
+    Examples
+    --------
+    ```python
+    @jit(nopython=True, nogil=True, cache=True)
+    def _sum(a1, k):
+        return np.nansum(a1) * k
+
+    _roll_1(x1, 10, 5, _sum, 2.0)
+    ```
+
+    """
+    out1 = np.full(x1.shape[0], np.nan, dtype=np.float64)
+    buf1 = np.empty(window, dtype=np.float64)
+    valid1 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        if valid1 == 0 or valid1 < min_periods:
+            continue
+        _fill_window(buf1, x1, i, window)
+        out1[i] = func(buf1, *args)
+    return out1
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _roll_2(x1, x2, window, min_periods, func, *args):
+    """流式滚动模板，两输入。每路输入的有效值数量都需满足min_periods"""
+    out1 = np.full(x1.shape[0], np.nan, dtype=np.float64)
+    buf1 = np.empty(window, dtype=np.float64)
+    buf2 = np.empty(window, dtype=np.float64)
+    valid1 = 0
+    valid2 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        valid2 = _update_valid(x2, i, window, valid2)
+        if valid1 == 0 or valid1 < min_periods:
+            continue
+        if valid2 == 0 or valid2 < min_periods:
+            continue
+        _fill_window(buf1, x1, i, window)
+        _fill_window(buf2, x2, i, window)
+        out1[i] = func(buf1, buf2, *args)
+    return out1
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _roll_3(x1, x2, x3, window, min_periods, func, *args):
+    """流式滚动模板，三输入。每路输入的有效值数量都需满足min_periods"""
+    out1 = np.full(x1.shape[0], np.nan, dtype=np.float64)
+    buf1 = np.empty(window, dtype=np.float64)
+    buf2 = np.empty(window, dtype=np.float64)
+    buf3 = np.empty(window, dtype=np.float64)
+    valid1 = 0
+    valid2 = 0
+    valid3 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        valid2 = _update_valid(x2, i, window, valid2)
+        valid3 = _update_valid(x3, i, window, valid3)
+        if valid1 == 0 or valid1 < min_periods:
+            continue
+        if valid2 == 0 or valid2 < min_periods:
+            continue
+        if valid3 == 0 or valid3 < min_periods:
+            continue
+        _fill_window(buf1, x1, i, window)
+        _fill_window(buf2, x2, i, window)
+        _fill_window(buf3, x3, i, window)
+        out1[i] = func(buf1, buf2, buf3, *args)
+    return out1
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def nb_roll_sum(x1, window):
+    """Demo code. Use `pl.col('A').rolling_sum(10).alias('a1')` instead.
+    演示代码，请直接用 pl.col('A').rolling_sum(10).alias('a1')"""
+    out = np.full(x1.shape, np.nan, dtype=np.float64)
+    if len(x1) < window:
+        return out
+    a1 = sliding_window_view(x1, window)
+    for i, v1 in enumerate(a1):
+        out[i + window - 1] = np.sum(v1)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def nb_roll_cov(x1, x2, window):
+    """Demo code. Use `pl.rolling_cov(pl.col('A'), pl.col('B'), window_size=10).alias('a6')` instead.
+    演示代码，pl.rolling_cov(pl.col('A'), pl.col('B'), window_size=10).alias('a6')"""
+    out = np.full(x1.shape, np.nan, dtype=np.float64)
+    if len(x1) < window:
+        return out
+    a1 = sliding_window_view(x1, window)
+    a2 = sliding_window_view(x2, window)
+    for i, (v1, v2) in enumerate(zip(a1, a2)):
+        out[i + window - 1] = np.cov(v1, v2)[0, 1]
+    return out
+
+
+@lru_cache
+@jit(nopython=True, nogil=True, fastmath=True, cache=True)
+def get_exponent_weights(
+        window: int = 10,
+        half_life: int = 5,
+) -> np.ndarray:
+    return np.repeat(0.5 ** (1 / half_life), window) ** np.arange(window - 1, -1, -1)
@@ -0,0 +1,77 @@
+"""
+延迟导入
+
+1. `lazy_getattr`生成模块级`__getattr__`(PEP 562)，包的`__init__`与`prefix`模块用它按名字导入子模块
+2. `lazy_import`返回模块代理，`talib`、`polars_ols`、numba的kernel模块等首次访问属性时才导入
+
+"""
+import importlib
+import sys
+from typing import Dict, List, Tuple
+
+
+class LazyModule:
+    """模块代理。首次访问属性时才真正导入，导入由`importlib`加锁，多线程安全"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, item):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, item)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """延迟导入模块。已导入的模块直接使用"""
+    lazy = LazyModule(name)
+    lazy._module = sys.modules.get(name, None)
+    return lazy
+
+
+def lazy_getattr(module: str, imports: Dict[str, List[str]]) -> Tuple:
+    """生成模块级的`__getattr__`、`__dir__`与`__all__`
+
+    Parameters
+    ----------
+    module
+        当前模块名，一般传`__name__`
+    imports
+        来源模块 -> 导出名列表。导出名可写成`name as alias`
+
+    Examples
+    --------
+    ```python
+    __getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+        'polars_ta.tdx.reference': [
+            'BARSLAST',
+            'BARSSINCEN as ts_BARSSINCEN',
+        ],
+    })
+    ```
+
+    """
+    names = {}
+    for source, items in imports.items():
+        for item in items:
+            name, _, alias = item.partition(' as ')
+            names[alias or name] = (source, name)
+
+    def __getattr__(name: str):
+        try:
+            source, attr = names[name]
+        except KeyError:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(source), attr)
+        # 缓存到模块中，下次不再经过__getattr__
+        setattr(sys.modules[module], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module])) | set(names))
+
+    return __getattr__, __dir__, list(names)
@@ -2,14 +2,35 @@
 Demo for using numba to implement rolling functions.
 本文件是使用numba实现rolling的函数，演示用
 """
-from functools import lru_cache
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Optional, Sequence
 
 import numpy as np
-from numba import jit
-from numpy import full
-from numpy.lib.stride_tricks import sliding_window_view
-from polars import Series, Expr, struct, DataFrame, Float64
+from polars import Series, Expr, struct, DataFrame, Float32, Float64
+
+import polars_ta
+from polars_ta.utils.lazy import lazy_getattr, lazy_import
+
+# numba实现的函数在`polars_ta.utils._nb`中，首次使用时才导入numba
+_nb = lazy_import('polars_ta.utils._nb')
+__getattr__, __dir__, _ = lazy_getattr(__name__, {
+    'polars_ta.utils._nb': [
+        'isnan',
+        'full_with_window_size',
+        'sliding_window_with_min_periods',
+        '_fill_window',
+        '_update_valid',
+        '_neumaier_add',
+        '_nanmean_range',
+        '_roll_1',
+        '_roll_2',
+        '_roll_3',
+        'nb_roll_sum',
+        'nb_roll_cov',
+        'get_exponent_weights',
+    ],
+})
 
 """
 Series.to_numpy的操作在调用之前做，这样可控一些
@@ -17,156 +38,212 @@ batches_i1_o1这一类的函数输入不支持Series，只支持numpy。设计
 """
 
 
-@jit(nopython=True, nogil=True, fastmath=True, cache=True)
-def isnan(x):
-    # https://github.com/numba/numba/issues/2919#issuecomment-747377615
-    if int(x) == -9223372036854775808:
-        return True
-    else:
-        return False
-
-
-@jit(nopython=True, nogil=True, cache=True)
-def full_with_window_size(arr, fill_value, dtype=None, window_size: int = 1):
-    """创建一个更大的数组，填充后一截数据"""
-    out = full(arr.shape[0] + window_size - 1, fill_value, dtype=dtype)
-    out[window_size - 1:] = arr
-    return out
-
-
-@jit(nopython=True, nogil=True, cache=True)
-def sliding_window_with_min_periods(arr, window_size: int, min_periods: int):
-    """为rolling准备的数据，当数据长度不足时，用nan填充"""
-    windows = sliding_window_view(arr, window_size)
-    valid_counts = np.sum(~np.isnan(windows), axis=1)
-    # 修改这一行，使用布尔索引而不是np.where
-    result = windows.copy()
-    result[valid_counts < min_periods] = np.nan
-    return result
-
-
-@jit(nopython=True, nogil=True, cache=True)
-def _roll_1(x1: np.ndarray, window: int, min_periods: int, func):
-    """TODO 只是模板演示，无法编译通过"""
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1).all():
-            continue
-        out1[i] = func(v1)
-    return out1[:x1.shape[0]]
-
-
-@jit(nopython=True, nogil=True, cache=True)
-def _roll_2(x1, x2, window, min_periods, func):
-    """TODO 只是模板演示，无法编译通过"""
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2) in enumerate(zip(a1, a2)):
-        if np.isnan(v1).all():
-            continue
-        if np.isnan(v2).all():
-            continue
-        out1[i] = func(v1, v2)
-    return out1[:x1.shape[0]]
-
-
-@jit(nopython=True, nogil=True, cache=True)
-def _roll_3(x1, x2, x3, window, min_periods, func):
-    """TODO 只是模板演示，无法编译通过"""
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    out3 = full_with_window_size(x3, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    a3 = sliding_window_with_min_periods(out3, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2, v3) in enumerate(zip(a1, a2, a3)):
-        if np.isnan(v1).all():
-            continue
-        if np.isnan(v2).all():
-            continue
-        if np.isnan(v3).all():
-            continue
-        out1[i] = func(v1, v2, v3)
-    return out1[:x1.shape[0]]
+def float_dtype():
+    """浮点结果类型。`polars_ta.FLOAT32`为True时为Float32，否则为Float64
+
+    构建表达式时取一次，同时用作`return_dtype`和batches_*的`dtype`，保证两者一致
+    """
+    return Float32 if polars_ta.FLOAT32 else Float64
+
+
+def numpy_dtype(dtype):
+    """polars浮点类型转numpy类型，其它原样返回"""
+    if dtype == Float32:
+        return np.float32
+    if dtype == Float64:
+        return np.float64
+    return dtype
+
+
+def series_to_numpy(x: Series, dtype=None) -> np.ndarray:
+    """Series转numpy，供kernel使用
+
+    1. 无null且类型一致时直接共享内存，不复制。得到的数组只读，kernel不能原地修改输入
+    2. 有null时只复制一次，null转成nan
+    3. 类型不一致时才转换，已转换过的不再复制。dtype可以是polars浮点类型
+
+    kernel统一以nan表示缺失，所以有null的列必须经过一次转换
+    """
+    arr = x.to_numpy()
+    if dtype is not None:
+        arr = arr.astype(numpy_dtype(dtype), copy=False)
+    return arr
+
+
+def numpy_to_series(arr: np.ndarray, dtype=None) -> Series:
+    """kernel输出转Series。浮点数组的nan转成null，整数与布尔数组不可能有nan，直接构造"""
+    if arr.dtype.kind == 'f':
+        return Series(arr, nan_to_null=True, dtype=dtype)
+    return Series(arr, dtype=dtype)
 
 
 def struct_to_numpy(xx, n: int, dtype=None):
-    if dtype is None:
-        return [xx.struct[i].to_numpy() for i in range(n)]
+    return [series_to_numpy(xx.struct[i], dtype) for i in range(n)]
+
+
+def struct_with_partition(partition_by: Optional[Expr] = None, **named_exprs: Expr) -> Expr:
+    """将输入拼接成struct。指定partition_by时追加到最后一个字段，供struct_to_offsets分段
+
+    结果列名取第一个输入的列名，与直接对输入调用map_batches一致，而不是字段名f0。
+    输入为多列时(如`pl.col('a', 'b')`)字段会重名，指定partition_by时直接报错，可逐列调用或不指定partition_by改用over
+    """
+    if partition_by is not None:
+        multi = [name for name, e in named_exprs.items() if e.meta.has_multiple_outputs()]
+        if multi:
+            raise ValueError(f"partition_by does not support multi-column input, call once per column or use over instead: {multi}")
+        named_exprs[f"f{len(named_exprs)}"] = partition_by
+    return struct(**named_exprs).name.keep()
+
+
+def group_offsets(by: Series) -> np.ndarray:
+    """分组边界。`by`中值连续相同的行为一段，返回每段起点以及末尾的总长度
+
+    数据需已按分组和时间排序，同一分组的行必须连续
+
+    Examples
+    --------
+    ```python
+    group_offsets(pl.Series(['A', 'A', 'B', 'B', 'B', 'C']))
+    array([0, 2, 5, 6])
+    ```
+
+    """
+    ids = by.rle_id().to_numpy()
+    if len(ids) == 0:
+        return np.zeros(1, dtype=np.int64)
+    return np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1, [len(ids)])).astype(np.int64)
+
+
+def struct_to_offsets(xx: Series, n: int) -> Optional[np.ndarray]:
+    """struct前n个字段为输入，存在第n+1个字段时视为分组列，返回分组边界"""
+    if len(xx.struct.fields) > n:
+        return group_offsets(xx.struct[n])
+    return None
+
+
+def _run_segments(func, xx: List[np.ndarray], args, offsets: np.ndarray, outs: List[np.ndarray], first: int, last: int):
+    """计算第first到last-1段，结果写入outs中对应的切片"""
+    for g in range(first, last):
+        start, end = offsets[g], offsets[g + 1]
+        r = func(*[x[start:end] for x in xx], *args)
+        if isinstance(r, tuple):
+            for o, v in zip(outs, r):
+                o[start:end] = v
+        else:
+            outs[0][start:end] = r
+
+
+def _split_segments(offsets: np.ndarray, n: int) -> List[int]:
+    """将分段按行数尽量均匀地切成n块，返回每块的起始段号以及末尾的段数"""
+    targets = np.linspace(0, offsets[-1], n + 1)[1:-1]
+    bounds = np.searchsorted(offsets, targets)
+    return sorted(set([0, *bounds.tolist(), len(offsets) - 1]))
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """共享的线程池，按`polars_ta.NUM_THREADS`创建
+
+    polars可能在多个线程中同时执行表达式，线程池从不关闭，并行度由每次提交的块数控制。
+    NUM_THREADS调大后换一个更大的线程池，旧线程池不关闭，已提交的任务照常完成
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None or _executor._max_workers < polars_ta.NUM_THREADS:
+            _executor = ThreadPoolExecutor(max_workers=polars_ta.NUM_THREADS, thread_name_prefix='polars_ta')
+        return _executor
+
+
+def _apply_segments(func, xx: List[np.ndarray], args, offsets: np.ndarray):
+    """按分组边界逐段调用func，每段的滚动状态都从头开始。结果拼接成与输入等长的数组
+
+    段间循环在Python中完成，kernel本身仍是落盘缓存的numba函数。
+    将kernel作为参数传入numba的驱动函数无法落盘缓存，每个进程都要重新编译，所以不采用
+
+    `polars_ta.NUM_THREADS`大于1时，各段分块后交给线程池。kernel都是`nogil=True`，可以多核并行
+    """
+    count = len(offsets) - 1
+    if count <= 0:
+        # 空输入
+        return func(*xx, *args)
+
+    # 先算第一段，得到输出的个数与类型
+    start, end = offsets[0], offsets[1]
+    r = func(*[x[start:end] for x in xx], *args)
+    rs = r if isinstance(r, tuple) else (r,)
+    outs = [np.empty(xx[0].shape[0], dtype=np.asarray(o).dtype) for o in rs]
+    for o, v in zip(outs, rs):
+        o[start:end] = v
+
+    n_threads = min(polars_ta.NUM_THREADS, count - 1)
+    if n_threads <= 1:
+        _run_segments(func, xx, args, offsets, outs, 1, count)
     else:
-        return [xx.struct[i].to_numpy().astype(dtype) for i in range(n)]
+        bounds = _split_segments(offsets[1:] - offsets[1], n_threads)
+        executor = _get_executor()
+        futures = [executor.submit(_run_segments, func, xx, args, offsets, outs, a + 1, b + 1) for a, b in zip(bounds[:-1], bounds[1:])]
+        for f in futures:
+            f.result()
+    return tuple(outs) if isinstance(r, tuple) else outs[0]
 
 
-def batches_i1_o1(x1: np.ndarray, func, *args, dtype=None) -> Series:
-    return Series(func(x1, *args), nan_to_null=True, dtype=dtype)
+def _apply(func, xx: List[np.ndarray], args, offsets: Optional[np.ndarray]):
+    if offsets is None:
+        return func(*xx, *args)
+    return _apply_segments(func, xx, args, offsets)
 
 
-def batches_i2_o1(xx: List[np.ndarray], func, *args, dtype=None) -> Series:
-    return Series(func(*xx, *args), nan_to_null=True, dtype=dtype)
+def batches_i1_o1(x1: np.ndarray, func, *args, dtype=None, offsets: Optional[np.ndarray] = None) -> Series:
+    return numpy_to_series(_apply(func, [x1], args, offsets), dtype=dtype)
 
 
-def batches_i1_o2(x1: np.ndarray, func, *args, dtype=None) -> Series:
-    return DataFrame(func(x1, *args), nan_to_null=True).to_struct()
+def batches_i2_o1(xx: List[np.ndarray], func, *args, dtype=None, offsets: Optional[np.ndarray] = None) -> Series:
+    return numpy_to_series(_apply(func, xx, args, offsets), dtype=dtype)
 
 
-def batches_i2_o2(xx: List[np.ndarray], func, *args, dtype=None) -> Series:
-    return DataFrame(func(*xx, *args), nan_to_null=True).to_struct()
+def expr_names(xs: Sequence[Expr]) -> List[str]:
+    """多个输入表达式的输出列名，用作struct的字段名。有无法确定的(如`pl.all()`)或重名时退回`column_0`、`column_1`..."""
+    names = [x.meta.output_name(raise_if_undetermined=False) for x in xs]
+    if None in names or len(set(names)) != len(names):
+        return [f"column_{i}" for i in range(len(xs))]
+    return names
 
 
-def batches_i2_o2_v2(xx: List[np.ndarray], func, *args, dtype=None) -> Series:
-    """此写法也能用，速度差异不大"""
-    out = func(*xx, *args)
-    arr = np.empty((xx[0].shape[0], len(out)), dtype=dtype)
-    for i, x in enumerate(out):
-        arr[:, i] = x
-    return Series(arr, nan_to_null=True).arr.to_struct()
+def numpy_to_struct(outs, names: Optional[Sequence[str]] = None, dtype=None) -> Series:
+    """多个kernel输出拼成Struct。每个输出先转成Series再组装，不经过二维数组，也不复制列
 
+    polars没有从多个Series直接构造Struct的公开接口，这里的DataFrame只持有各Series的引用，
+    `to_struct`得到的字段与kernel输出共享内存，每次调用只有几十微秒的固定开销
 
-@jit(nopython=True, nogil=True, cache=True)
-def nb_roll_sum(x1, window):
-    """Demo code. Use `pl.col('A').rolling_sum(10).alias('a1')` instead.
-    演示代码，请直接用 pl.col('A').rolling_sum(10).alias('a1')"""
-    out = np.full(x1.shape, np.nan, dtype=np.float64)
-    if len(x1) < window:
-        return out
-    a1 = sliding_window_view(x1, window)
-    for i, v1 in enumerate(a1):
-        out[i + window - 1] = np.sum(v1)
-    return out
+    Parameters
+    ----------
+    outs
+        kernel输出的多个数组
+    names
+        字段名。默认为`column_0`、`column_1`...
+    dtype
+        浮点输出的类型。整数输出不受影响
 
+    """
+    if names is None:
+        names = [f"column_{i}" for i in range(len(outs))]
+    return DataFrame([numpy_to_series(o, dtype if o.dtype.kind == 'f' else None).alias(name) for name, o in zip(names, outs)]).to_struct()
 
-@jit(nopython=True, nogil=True, cache=True)
-def nb_roll_cov(x1, x2, window):
-    """Demo code. Use `pl.rolling_cov(pl.col('A'), pl.col('B'), window_size=10).alias('a6')` instead.
-    演示代码，pl.rolling_cov(pl.col('A'), pl.col('B'), window_size=10).alias('a6')"""
-    out = np.full(x1.shape, np.nan, dtype=np.float64)
-    if len(x1) < window:
-        return out
-    a1 = sliding_window_view(x1, window)
-    a2 = sliding_window_view(x2, window)
-    for i, (v1, v2) in enumerate(zip(a1, a2)):
-        out[i + window - 1] = np.cov(v1, v2)[0, 1]
-    return out
 
+def batches_i1_o2(x1: np.ndarray, func, *args, dtype=None, offsets: Optional[np.ndarray] = None, names: Optional[Sequence[str]] = None) -> Series:
+    return numpy_to_struct(_apply(func, [x1], args, offsets), names, dtype)
 
-def roll_sum(x: Expr, n: int) -> Expr:
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), nb_roll_sum, n), return_dtype=Float64)
 
+def batches_i2_o2(xx: List[np.ndarray], func, *args, dtype=None, offsets: Optional[np.ndarray] = None, names: Optional[Sequence[str]] = None) -> Series:
+    return numpy_to_struct(_apply(func, xx, args, offsets), names, dtype)
 
-def roll_cov(a: Expr, b: Expr, n: int) -> Expr:
-    return struct(f0=a, f1=b).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), nb_roll_cov, n), return_dtype=Float64)
 
+def roll_sum(x: Expr, n: int) -> Expr:
+    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), _nb.nb_roll_sum, n), return_dtype=Float64)
 
-@lru_cache
-@jit(nopython=True, nogil=True, fastmath=True, cache=True)
-def get_exponent_weights(
-        window: int = 10,
-        half_life: int = 5,
-) -> np.ndarray:
-    return np.repeat(0.5 ** (1 / half_life), window) ** np.arange(window - 1, -1, -1)
+
+def roll_cov(a: Expr, b: Expr, n: int) -> Expr:
+    return struct(f0=a, f1=b).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), _nb.nb_roll_cov, n), return_dtype=Float64)
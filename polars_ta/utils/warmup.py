@@ -0,0 +1,195 @@
+"""
+numba kernel预热
+
+每个新进程首次调用kernel时，即使有`cache=True`，也要为每个签名编译或校验磁盘缓存。
+批处理任务常启动大量短命的worker，这部分延迟会反复出现。可在启动时调用`warmup`，
+或后台预热，同时报告哪些签名没有命中缓存
+
+命令行
+------
+```bash
+# 构建镜像时执行一次，将编译结果写入缓存目录(NUMBA_CACHE_DIR)
+python -m polars_ta.utils.warmup
+```
+
+"""
+import importlib
+import time
+from concurrent.futures import Future
+from threading import Thread
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+# 参数模板中的占位符
+F = 'float'  # 浮点数组。按dtypes逐个预热，每种类型都预热可写与只读两种
+F64 = 'float64'  # 只以float64调用的浮点数组，也分可写与只读
+FW = 'float_writable'  # 浮点数组，只有可写一种。kernel的输入是调用前新建的数组
+F2 = 'float_2d'  # 二维浮点数组，只有可写一种。kernel的输入是调用前拼接的数组
+B = 'bool'  # 布尔数组。polars转换布尔列时总是复制，只有可写一种
+
+# 模块 -> kernel -> 参数模板。非占位符的参数原样传入，Python的int/float/bool对应int64/float64/boolean
+# 只预热由Python直接调用的kernel，仅在kernel内部调用的函数(isnan、_fill_window等)随调用方一起编译。
+# `_roll_1`等以函数为参数，numba不能缓存，不预热
+KERNELS = {
+    'polars_ta.utils._nb': {
+        'nb_roll_sum': (F, 3),
+        'nb_roll_cov': (F, F, 3),
+        'get_exponent_weights': (10, 5),
+    },
+    'polars_ta.wq._nb': {
+        'roll_argmax': (F, 3, 2, False),
+        'roll_argmin': (F, 3, 2, False),
+        'roll_prod': (F, 3, 2),
+        'roll_moment': (F, 3, 2, 3),
+        'roll_co_kurtosis': (F, F, 3, 2),
+        'roll_co_skewness': (F, F, 3, 2),
+        'roll_partial_corr': (F, F, F, 3, 2),
+        'roll_triple_corr': (F, F, F, 3, 2),
+        '_cum_prod_by': (F, F),
+        '_cum_sum_by': (F, F),
+        '_cum_sum_reset': (F,),
+        '_sum_split_by': (FW, FW, np.arange(8).reshape(1, -1), 3, 1),
+        '_signals_to_size': (B, B, B, B, False, False),
+        'roll_decay_linear': (F, np.array([3, 5]), np.array([2, 5])),
+        'roll_exp_moments': (F, 3, 2, 0.5),
+        'roll_ols': (F, F2, 3, 2, 0.5, True),
+        'roll_rank_quantile': (FW, np.arange(8).reshape(1, -1), 3, 2, np.array([0.5]), 0, True),
+        'cs_top_bottom': (F64, 3, 0, False),
+        'cs_rank_zscore_qcut': (np.arange(16.0).reshape(2, -1), np.tile(np.arange(8), (2, 1)), np.arange(4), 4, 0),
+    },
+    'polars_ta.wide._nb': {
+        'roll_sum': (np.ones((2, 8)), 3, 2, True),
+        'roll_std': (np.ones((2, 8)), 3, 2, 1),
+        'roll_cov': (np.ones((2, 8)), np.ones((2, 8)), 3, 2, 1),
+        'ewm_mean': (np.ones((2, 8)), 0.5, 2),
+    },
+    'polars_ta.tdx._nb': {
+        'roll_avedev': (F, 3),
+        'roll_bars_since_n': (B, 3),
+        '_up_stat': (B,),
+    },
+    'polars_ta.tdx._chip': {
+        '_WINNER_COST': (F64, F64, F64, F64, F64, F64, 0.1),
+    },
+    'polars_ta.labels._nb': {
+        '_triple_barrier': (F, F, F, 3, 0.1, 0.05),
+    },
+}
+
+
+def _sample(dtype, readonly: bool) -> np.ndarray:
+    """预热用的小数组。只读数组对应`Series.to_numpy`零复制的结果，numba将其视为不同的签名"""
+    arr = np.array([1, 2, np.nan, 3, 4, 5, 4, 3], dtype=float).astype(dtype)
+    arr.setflags(write=not readonly)
+    return arr
+
+
+def _variants(template: tuple, dtypes: Sequence) -> List[tuple]:
+    """按参数模板展开成多组实参"""
+    if any(t is F for t in template):
+        kinds = [(dtype, readonly) for dtype in dtypes for readonly in (False, True)]
+    elif any(t is FW or t is F2 for t in template):
+        kinds = [(dtype, False) for dtype in dtypes]
+    elif any(t is F64 for t in template):
+        kinds = [(np.float64, False), (np.float64, True)]
+    else:
+        kinds = [(np.float64, False)]
+
+    variants = []
+    for dtype, readonly in kinds:
+        args = []
+        for t in template:
+            if t is F or t is FW:
+                args.append(_sample(dtype, readonly))
+            elif t is F2:
+                args.append(np.vstack([_sample(dtype, False)] * 2))
+            elif t is F64:
+                args.append(_sample(np.float64, readonly))
+            elif t is B:
+                args.append(_sample(np.float64, False) > 2)
+            else:
+                args.append(t)
+        variants.append(tuple(args))
+    return variants
+
+
+def _warmup(dtypes: Sequence) -> Dict[str, Dict[str, List[str]]]:
+    report = {}
+    for module, kernels in KERNELS.items():
+        m = importlib.import_module(module)
+        for name, template in kernels.items():
+            # lru_cache包装的kernel取原始的dispatcher
+            kernel = getattr(m, name)
+            if not hasattr(kernel, 'stats'):
+                kernel = kernel.__wrapped__
+            hits = dict(kernel.stats.cache_hits)
+            misses = dict(kernel.stats.cache_misses)
+            for args in _variants(template, dtypes):
+                kernel(*args)
+            report[f'{module}.{name}'] = {
+                'hits': [str(sig) for sig, n in kernel.stats.cache_hits.items() if n > hits.get(sig, 0)],
+                'misses': [str(sig) for sig, n in kernel.stats.cache_misses.items() if n > misses.get(sig, 0)],
+            }
+    return report
+
+
+def warmup(dtypes: Sequence = (np.float64, np.float32), background: bool = False) -> Union[Dict[str, Dict[str, List[str]]], Future]:
+    """编译或从缓存加载所有numba kernel
+
+    Parameters
+    ----------
+    dtypes
+        浮点数组的类型。默认float64与float32(`polars_ta.FLOAT32`)都预热
+    background
+        是否在后台线程中预热。numba编译有全局锁，主线程同时调用kernel时会等待预热完成的那部分，不会重复编译
+
+    Returns
+    -------
+    dict or Future
+        kernel全名 -> {'hits': 从缓存加载的签名, 'misses': 未命中缓存、重新编译的签名}。
+        本进程中已编译过的签名两者都不出现。`background=True`时返回Future，`result()`得到同样的字典
+
+    Notes
+    -----
+    多输入kernel只预热全部可写与全部只读两种组合，一部分列有null(复制后可写)、一部分无null(只读)时，
+    混合签名仍在首次使用时编译
+
+    Examples
+    --------
+    ```python
+    from polars_ta.utils.warmup import warmup
+
+    future = warmup(background=True)
+    ...
+    missed = {k: v['misses'] for k, v in future.result().items() if v['misses']}
+    ```
+
+    """
+    if not background:
+        return _warmup(dtypes)
+
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(_warmup(dtypes))
+        except BaseException as e:
+            future.set_exception(e)
+
+    # 守护线程，进程退出时不等待预热结束
+    Thread(target=run, name='polars_ta-warmup', daemon=True).start()
+    return future
+
+
+if __name__ == '__main__':
+    t0 = time.perf_counter()
+    report = warmup()
+    t1 = time.perf_counter()
+    hits = sum(len(v['hits']) for v in report.values())
+    misses = sum(len(v['misses']) for v in report.values())
+    for name, v in report.items():
+        for sig in v['misses']:
+            print('miss', name, sig)
+    print(f'{len(report)} kernels, {hits} signatures loaded from cache, {misses} compiled, {t1 - t0:.3f}s')
@@ -0,0 +1,36 @@
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.wide.convert': [
+        'cross_section',
+        'to_long',
+        'to_wide',
+    ],
+    'polars_ta.wide.store': [
+        'append_panel',
+        'load_panel',
+        'save_panel',
+    ],
+    'polars_ta.wide.time_series': [
+        'ts_ATR',
+        'ts_RMA',
+        'ts_RSI',
+        'ts_arg_max',
+        'ts_arg_min',
+        'ts_corr',
+        'ts_covariance',
+        'ts_decay_linear',
+        'ts_delay',
+        'ts_delta',
+        'ts_max',
+        'ts_mean',
+        'ts_min',
+        'ts_product',
+        'ts_rank',
+        'ts_returns',
+        'ts_std_dev',
+        'ts_sum',
+    ],
+})
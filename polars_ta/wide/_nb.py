@@ -0,0 +1,202 @@
+"""
+宽表(日期×资产)的numba kernel
+
+输入为C连续的二维数组，每行一个日期，每列一个资产，nan为缺失值。外层循环日期，内层循环资产，
+每个资产一份滚动状态。内层循环连续访问内存，所有资产一起推进，可被向量化。
+
+加减滚动的累加和每window行从头重算一次，避免误差累积
+"""
+import numpy as np
+from numba import jit
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_sum(xx, window, min_periods, mean):
+    """滚动求和。mean=True时为滚动均值。与polars的rolling_sum/rolling_mean一致，null不计数"""
+    n, k = xx.shape
+    out = np.full((n, k), np.nan)
+    s = np.zeros(k)
+    c = np.zeros(k, dtype=np.int64)
+    for t in range(n):
+        if t >= window and t % window == 0:
+            # 重算窗口中除当前行外的部分
+            s[:] = 0
+            c[:] = 0
+            for r in range(t - window + 1, t):
+                for j in range(k):
+                    v = xx[r, j]
+                    if not np.isnan(v):
+                        s[j] += v
+                        c[j] += 1
+        elif t >= window:
+            for j in range(k):
+                v = xx[t - window, j]
+                if not np.isnan(v):
+                    s[j] -= v
+                    c[j] -= 1
+        for j in range(k):
+            v = xx[t, j]
+            if not np.isnan(v):
+                s[j] += v
+                c[j] += 1
+            if c[j] >= min_periods and c[j] > 0:
+                out[t, j] = s[j] / c[j] if mean else s[j]
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_std(xx, window, min_periods, ddof):
+    """滚动标准差。累加的是与参考值的差，重算时参考值取窗口均值，减少相减抵消的误差"""
+    n, k = xx.shape
+    out = np.full((n, k), np.nan)
+    ref = np.full(k, np.nan)
+    s1 = np.zeros(k)
+    s2 = np.zeros(k)
+    c = np.zeros(k, dtype=np.int64)
+    for t in range(n):
+        if t >= window and t % window == 0:
+            s1[:] = 0
+            c[:] = 0
+            for r in range(t - window + 1, t):
+                for j in range(k):
+                    v = xx[r, j]
+                    if not np.isnan(v):
+                        s1[j] += v
+                        c[j] += 1
+            for j in range(k):
+                ref[j] = s1[j] / c[j] if c[j] > 0 else np.nan
+                s1[j] = 0
+                s2[j] = 0
+            for r in range(t - window + 1, t):
+                for j in range(k):
+                    d = xx[r, j] - ref[j]
+                    if not np.isnan(d):
+                        s1[j] += d
+                        s2[j] += d * d
+        elif t >= window:
+            for j in range(k):
+                d = xx[t - window, j] - ref[j]
+                if not np.isnan(d):
+                    s1[j] -= d
+                    s2[j] -= d * d
+                    c[j] -= 1
+        for j in range(k):
+            v = xx[t, j]
+            if not np.isnan(v):
+                if np.isnan(ref[j]):
+                    ref[j] = v
+                d = v - ref[j]
+                s1[j] += d
+                s2[j] += d * d
+                c[j] += 1
+            if c[j] >= min_periods and c[j] > ddof:
+                out[t, j] = np.sqrt(max(s2[j] - s1[j] * s1[j] / c[j], 0.0) / (c[j] - ddof))
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_cov(xx, yy, window, min_periods, ddof):
+    """滚动协方差与相关系数，返回(2, n, k)。只用x、y都有效的行"""
+    n, k = xx.shape
+    out = np.full((2, n, k), np.nan)
+    rx = np.full(k, np.nan)
+    ry = np.full(k, np.nan)
+    sx = np.zeros(k)
+    sy = np.zeros(k)
+    sxx = np.zeros(k)
+    syy = np.zeros(k)
+    sxy = np.zeros(k)
+    c = np.zeros(k, dtype=np.int64)
+    for t in range(n):
+        if t >= window and t % window == 0:
+            sx[:] = 0
+            sy[:] = 0
+            c[:] = 0
+            for r in range(t - window + 1, t):
+                for j in range(k):
+                    a = xx[r, j]
+                    b = yy[r, j]
+                    if not (np.isnan(a) or np.isnan(b)):
+                        sx[j] += a
+                        sy[j] += b
+                        c[j] += 1
+            for j in range(k):
+                rx[j] = sx[j] / c[j] if c[j] > 0 else np.nan
+                ry[j] = sy[j] / c[j] if c[j] > 0 else np.nan
+                sx[j] = 0
+                sy[j] = 0
+                sxx[j] = 0
+                syy[j] = 0
+                sxy[j] = 0
+            for r in range(t - window + 1, t):
+                for j in range(k):
+                    a = xx[r, j] - rx[j]
+                    b = yy[r, j] - ry[j]
+                    if not (np.isnan(a) or np.isnan(b)):
+                        sx[j] += a
+                        sy[j] += b
+                        sxx[j] += a * a
+                        syy[j] += b * b
+                        sxy[j] += a * b
+        elif t >= window:
+            for j in range(k):
+                a = xx[t - window, j] - rx[j]
+                b = yy[t - window, j] - ry[j]
+                if not (np.isnan(a) or np.isnan(b)):
+                    sx[j] -= a
+                    sy[j] -= b
+                    sxx[j] -= a * a
+                    syy[j] -= b * b
+                    sxy[j] -= a * b
+                    c[j] -= 1
+        for j in range(k):
+            a = xx[t, j]
+            b = yy[t, j]
+            if not (np.isnan(a) or np.isnan(b)):
+                if np.isnan(rx[j]):
+                    rx[j] = a
+                    ry[j] = b
+                a -= rx[j]
+                b -= ry[j]
+                sx[j] += a
+                sy[j] += b
+                sxx[j] += a * a
+                syy[j] += b * b
+                sxy[j] += a * b
+                c[j] += 1
+            if c[j] >= min_periods and c[j] > 0:
+                cxy = sxy[j] - sx[j] * sy[j] / c[j]
+                if c[j] > ddof:
+                    out[0, t, j] = cxy / (c[j] - ddof)
+                vv = (sxx[j] - sx[j] * sx[j] / c[j]) * (syy[j] - sy[j] * sy[j] / c[j])
+                if vv > 0:
+                    out[1, t, j] = cxy / np.sqrt(vv)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def ewm_mean(xx, alpha, min_periods):
+    """指数移动平均。与polars的ewm_mean(adjust=False)一致
+
+    中间有null时，旧值的权重按间隔的行数衰减。null处结果为null
+    """
+    n, k = xx.shape
+    out = np.full((n, k), np.nan)
+    y = np.full(k, np.nan)
+    w = np.zeros(k)  # 旧值的权重
+    c = np.zeros(k, dtype=np.int64)
+    for t in range(n):
+        for j in range(k):
+            v = xx[t, j]
+            if np.isnan(v):
+                w[j] *= 1 - alpha
+                continue
+            if c[j] == 0:
+                y[j] = v
+            else:
+                y[j] = (w[j] * y[j] + alpha * v) / (w[j] + alpha)
+            w[j] = 1 - alpha
+            c[j] += 1
+            if c[j] >= min_periods:
+                out[t, j] = y[j]
+    return out
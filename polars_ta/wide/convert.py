@@ -0,0 +1,106 @@
+"""
+长表与宽表互转
+
+长表每行一个(日期, 资产)，宽表为每个字段一个二维数组，行为日期，列为资产，缺失为nan
+"""
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from polars import DataFrame, Series, Float64, Int64, col, all_horizontal
+
+
+def to_wide(df: DataFrame, values: Sequence[str], index: str = 'date', on: str = 'asset', order: str = 'C') -> Tuple[Dict[str, np.ndarray], Series, Series]:
+    """长表转宽表。不需要排序，按日期与资产的编号直接写入二维数组
+
+    Parameters
+    ----------
+    df
+        长表。同一日期同一资产只能有一行
+    values
+        需要转换的字段
+    index
+        日期列，排序后作为行
+    on
+        资产列，排序后作为列
+    order
+        数组的内存布局。'C'适合`polars_ta.wide`中的滚动求和、标准差等，'F'适合arg_max、decay_linear等逐资产计算的算子
+
+    Returns
+    -------
+    arrays
+        字段名 -> 二维数组，float64，缺失为nan
+    index
+        每行的日期
+    on
+        每列的资产
+
+    Examples
+    --------
+    ```python
+    arrays, dates, assets = to_wide(df, ['CLOSE', 'HIGH', 'LOW'])
+    out = {'SMA_20': ts_mean(arrays['CLOSE'], 20)}
+    df = to_long(out, dates, assets, drop_nulls=True)
+    ```
+
+    """
+    codes = df.select(
+        col(index).rank('dense').cast(Int64) - 1,
+        col(on).rank('dense').cast(Int64) - 1,
+    )
+    i = codes.get_column(index).to_numpy()
+    j = codes.get_column(on).to_numpy()
+    dates = df.get_column(index).unique().sort()
+    assets = df.get_column(on).unique().sort()
+    arrays = {}
+    for v in values:
+        arr = np.full((len(dates), len(assets)), np.nan, order=order)
+        arr[i, j] = df.get_column(v).cast(Float64).to_numpy()
+        arrays[v] = arr
+    return arrays, dates, assets
+
+
+def to_long(arrays: Dict[str, np.ndarray], index: Series, on: Series, drop_nulls: bool = False) -> DataFrame:
+    """宽表转长表。按资产、日期排序，可直接用于`polars_ta.wq`的时序算子
+
+    Parameters
+    ----------
+    arrays
+        字段名 -> 二维数组，行为日期，列为资产
+    index
+        每行的日期
+    on
+        每列的资产
+    drop_nulls
+        是否去掉所有字段都为null的行
+
+    """
+    n, k = len(index), len(on)
+    df = DataFrame([
+        Series(index.name, np.tile(index.to_numpy(), k), dtype=index.dtype),
+        Series(on.name, np.repeat(on.to_numpy(), n), dtype=on.dtype),
+        # 按列展开，同一资产的日期连续
+        *[Series(name, arr.ravel(order='F'), nan_to_null=True) for name, arr in arrays.items()],
+    ])
+    if drop_nulls:
+        df = df.filter(~all_horizontal(col(name).is_null() for name in arrays))
+    return df
+
+
+def cross_section(arrays: Dict[str, np.ndarray], on: Series, row: int, nan_to_null: bool = False) -> DataFrame:
+    """某一行(日期)的截面，可直接用于`polars_ta.wq`的截面算子
+
+    C连续的数组每行是连续的内存，字段列不复制，`load_panel`映射的数组也是如此
+
+    Parameters
+    ----------
+    arrays
+        字段名 -> 二维数组，行为日期，列为资产
+    on
+        每列的资产
+    row
+        第几行
+    nan_to_null
+        是否将nan转成null。转换时会复制
+
+    """
+    return DataFrame([on, *[Series(name, arr[row], nan_to_null=nan_to_null) for name, arr in arrays.items()]])
@@ -0,0 +1,200 @@
+"""
+内存映射的宽表存储
+
+每个字段一个文件，内容为float64的二维数组，行为日期，列为资产，C连续，缺失为nan。
+日期与资产的索引各存为一个parquet文件。多个进程打开同一目录时直接映射文件，共享操作系统的页缓存，
+不需要各自读取、反序列化整个面板
+
+```
+panel/
+    dates.parquet       # 每行的日期
+    assets.parquet      # 每列的资产
+    CLOSE.5000.f64      # 字段名.列数.f64
+    HIGH.5000.f64
+```
+
+追加新日期时只在文件末尾写入新行，写完所有字段后再替换日期索引。读取方按日期索引的行数映射，看不到写了一半的行。
+出现新资产时按新的列数重写所有字段，先替换资产索引再替换日期索引，最后删除旧文件。只支持一个写入方
+
+Examples
+--------
+```python
+from polars_ta.wide import append_panel, load_panel, save_panel, to_wide, ts_mean
+
+save_panel('panel', *to_wide(df_history, ['CLOSE', 'HIGH', 'LOW']))
+# 每日收盘后追加
+append_panel('panel', *to_wide(df_today, ['CLOSE', 'HIGH', 'LOW']))
+
+# 研究进程
+arrays, dates, assets = load_panel('panel')
+sma = ts_mean(arrays['CLOSE'], 20)
+```
+
+"""
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from polars import Series, Int64, concat, read_parquet
+
+_DATES = 'dates.parquet'
+_ASSETS = 'assets.parquet'
+
+
+def _field_path(path: str, field: str, k: int) -> str:
+    # 文件名带列数，扩充资产时写新文件，不影响正在按旧列数读取的进程
+    return os.path.join(path, f'{field}.{k}.f64')
+
+
+def _fields(path: str, k: int) -> List[str]:
+    suffix = f'.{k}.f64'
+    return sorted(f[:-len(suffix)] for f in os.listdir(path) if f.endswith(suffix))
+
+
+def _read_index(path: str, name: str) -> Series:
+    return read_parquet(os.path.join(path, name)).to_series()
+
+
+def _write_index(path: str, name: str, s: Series) -> None:
+    # 先写临时文件再替换，读取方总是看到完整的索引
+    tmp = os.path.join(path, name + '.tmp')
+    s.to_frame().write_parquet(tmp)
+    os.replace(tmp, os.path.join(path, name))
+
+
+def _map(file: str, n: int, k: int, mode: str) -> np.ndarray:
+    if n * k == 0:
+        # 空文件不能映射
+        return np.full((n, k), np.nan)
+    return np.memmap(file, dtype=np.float64, mode=mode, shape=(n, k))
+
+
+def _check(arrays: Dict[str, np.ndarray], index: Series, on: Series) -> None:
+    if index.n_unique() != len(index) or not index.is_sorted():
+        raise ValueError('dates must be unique and sorted')
+    if on.n_unique() != len(on):
+        raise ValueError('assets must be unique')
+    for field, arr in arrays.items():
+        if arr.shape != (len(index), len(on)):
+            raise ValueError(f'{field}: shape {arr.shape} does not match ({len(index)}, {len(on)})')
+
+
+def save_panel(path: str, arrays: Dict[str, np.ndarray], index: Series, on: Series) -> None:
+    """新建宽表存储。参数与`to_wide`的返回值相同
+
+    Parameters
+    ----------
+    path
+        目录。不能已有存储
+    arrays
+        字段名 -> 二维数组，行为日期，列为资产
+    index
+        每行的日期。唯一且升序
+    on
+        每列的资产。唯一
+
+    """
+    if os.path.exists(os.path.join(path, _DATES)):
+        raise FileExistsError(f'{path} already contains a panel')
+    _check(arrays, index, on)
+    os.makedirs(path, exist_ok=True)
+    for field, arr in arrays.items():
+        np.ascontiguousarray(arr, dtype=np.float64).tofile(_field_path(path, field, len(on)))
+    _write_index(path, _ASSETS, on)
+    _write_index(path, _DATES, index)
+
+
+def append_panel(path: str, arrays: Dict[str, np.ndarray], index: Series, on: Series) -> None:
+    """追加新的日期。参数与`to_wide`的返回值相同
+
+    Parameters
+    ----------
+    path
+        `save_panel`创建的目录
+    arrays
+        字段名 -> 二维数组。字段必须与存储中的相同
+    index
+        新的日期。唯一且升序，都晚于已有的日期
+    on
+        资产。可以是已有资产的一部分，缺少的资产为nan；新资产排在已有资产之后，所有字段按新的列数重写
+
+    """
+    dates = _read_index(path, _DATES)
+    assets = _read_index(path, _ASSETS)
+    n, k = len(dates), len(assets)
+    if set(arrays) != set(_fields(path, k)):
+        raise ValueError(f'fields {sorted(arrays)} do not match {_fields(path, k)}')
+    _check(arrays, index, on)
+    m = len(index)
+    if m == 0:
+        return
+    if n > 0 and index[0] <= dates[-1]:
+        raise ValueError(f'dates must be later than {dates[-1]}')
+
+    on = on.cast(assets.dtype).rename(assets.name)
+    new = on.filter(~on.is_in(assets.to_list()))
+    assets2 = concat([assets, new]) if len(new) > 0 else assets
+    k2 = len(assets2)
+    # 输入的每一列在存储中的位置
+    cols = on.replace_strict(assets2, np.arange(k2), return_dtype=Int64).to_numpy()
+
+    for field, arr in arrays.items():
+        rows = np.full((m, k2), np.nan)
+        rows[:, cols] = arr
+        if k2 == k:
+            with open(_field_path(path, field, k), 'r+b') as f:
+                # 截掉上次中断时写入、但未记入日期索引的行
+                f.truncate(n * k * 8)
+                f.seek(0, os.SEEK_END)
+                rows.tofile(f)
+        else:
+            out = np.memmap(_field_path(path, field, k2), dtype=np.float64, mode='w+', shape=(n + m, k2))
+            out[:n, :k] = _map(_field_path(path, field, k), n, k, 'r')
+            out[:n, k:] = np.nan
+            out[n:] = rows
+            out.flush()
+            del out
+
+    if k2 != k:
+        _write_index(path, _ASSETS, assets2)
+    _write_index(path, _DATES, concat([dates, index.cast(dates.dtype).rename(dates.name)]))
+    if k2 != k:
+        for field in arrays:
+            os.remove(_field_path(path, field, k))
+
+
+def load_panel(path: str, fields: Optional[Sequence[str]] = None, mode: str = 'r') -> Tuple[Dict[str, np.ndarray], Series, Series]:
+    """映射宽表存储。返回值与`to_wide`相同，数组不复制，可直接传给`polars_ta.wide`的算子
+
+    Parameters
+    ----------
+    path
+        `save_panel`创建的目录
+    fields
+        需要的字段。默认全部
+    mode
+        'r'只读。'c'写时复制，修改只在本进程可见，不写回文件
+
+    Returns
+    -------
+    arrays
+        字段名 -> `np.memmap`，行为日期，列为资产，C连续
+    index
+        每行的日期
+    on
+        每列的资产
+
+    """
+    for retry in range(3):
+        # 先读日期再读资产，与写入的顺序相反，保证文件中至少有这么多行
+        dates = _read_index(path, _DATES)
+        assets = _read_index(path, _ASSETS)
+        n, k = len(dates), len(assets)
+        try:
+            arrays = {field: _map(_field_path(path, field, k), n, k, mode) for field in (fields or _fields(path, k))}
+        except FileNotFoundError:
+            # 写入方扩充资产后删除了旧文件，重新读索引
+            if retry == 2:
+                raise
+            continue
+        return arrays, dates, assets
@@ -0,0 +1,157 @@
+"""
+宽表上的时序算子
+
+输入为二维数组，行为日期，列为资产，nan为缺失值，返回同样形状的float64数组。
+不需要排序，也不需要over或group_by。结果与`polars_ta.wq`中同名算子相同，
+相当于长表补齐所有(日期, 资产)、缺失值为null后按资产分组计算，窗口按日期行数计
+
+1. 滚动求和、均值、标准差、协方差、相关系数、指数平均：二维kernel，所有资产一起推进，C连续的输入最快
+2. arg_max、decay_linear、rank、product：按列展开后每个资产为连续的一段，与长表共用一维kernel，F连续的输入不复制
+3. max、min：交给polars，宽表每列一个资产
+
+"""
+from typing import Optional
+
+import numpy as np
+from polars import DataFrame, all as all_
+
+import polars_ta
+from polars_ta import TA_EPSILON
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import _apply_segments
+from polars_ta.wq.time_series import _roll_decay_linear, _roll_rank_quantile
+
+# 首次使用时才导入
+_nb = lazy_import('polars_ta.wide._nb')
+_wq_nb = lazy_import('polars_ta.wq._nb')
+
+
+def _c(x: np.ndarray) -> np.ndarray:
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def _columns(func, *xx: np.ndarray, args=()) -> np.ndarray:
+    """逐资产调用一维kernel。`polars_ta.NUM_THREADS`大于1时多线程"""
+    xx = [np.asfortranarray(x, dtype=np.float64) for x in xx]
+    n, k = xx[0].shape
+    out = _apply_segments(func, [x.ravel(order='F') for x in xx], args, np.arange(k + 1) * n)
+    return np.asarray(out, dtype=np.float64).reshape((n, k), order='F')
+
+
+def _polars(x: np.ndarray, expr) -> np.ndarray:
+    """polars原生的算子。宽表每列一个资产，各列并行"""
+    return DataFrame(x, orient='row', nan_to_null=True).select(expr).to_numpy()
+
+
+def ts_sum(x: np.ndarray, d: int = 30, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动求和"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _nb.roll_sum(_c(x), d, minp, False)
+
+
+def ts_mean(x: np.ndarray, d: int = 5, min_samples: Optional[int] = None) -> np.ndarray:
+    """简单移动平均"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _nb.roll_sum(_c(x), d, minp, True)
+
+
+def ts_std_dev(x: np.ndarray, d: int = 5, ddof: int = 0, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动标准差"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _nb.roll_std(_c(x), d, minp, ddof)
+
+
+def ts_covariance(x: np.ndarray, y: np.ndarray, d: int = 5, ddof: int = 1, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动协方差。只用x、y都有效的行"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _nb.roll_cov(_c(x), _c(y), d, minp, ddof)[0]
+
+
+def ts_corr(x: np.ndarray, y: np.ndarray, d: int = 5, ddof: int = 1, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动相关系数。只用x、y都有效的行，窗口内x或y为常数时为nan。ddof与`polars_ta.wq.ts_corr`的参数对应，不影响结果"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _nb.roll_cov(_c(x), _c(y), d, minp, 1)[1]
+
+
+def ts_max(x: np.ndarray, d: int = 30, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动最大值"""
+    minp = min_samples or polars_ta.MIN_SAMPLES
+    return _polars(x, all_().rolling_max(d, min_samples=minp))
+
+
+def ts_min(x: np.ndarray, d: int = 30, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动最小值"""
+    minp = min_samples or polars_ta.MIN_SAMPLES
+    return _polars(x, all_().rolling_min(d, min_samples=minp))
+
+
+def ts_delay(x: np.ndarray, d: int = 1) -> np.ndarray:
+    """时序数据移动。d为负时向前移动，移动的行数不少于总行数时全为nan"""
+    out = np.full(x.shape, np.nan)
+    if abs(d) >= x.shape[0]:
+        return out
+    if d >= 0:
+        out[d:] = x[:x.shape[0] - d]
+    else:
+        out[:d] = x[-d:]
+    return out
+
+
+def ts_delta(x: np.ndarray, d: int = 1) -> np.ndarray:
+    """时序差分"""
+    return x - ts_delay(x, d)
+
+
+def ts_returns(x: np.ndarray, d: int = 1) -> np.ndarray:
+    """简单收益率"""
+    return x / ts_delay(x, d) - 1
+
+
+def ts_arg_max(x: np.ndarray, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None) -> np.ndarray:
+    """最大值相对位置。最近的一天记为第0天"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _columns(_wq_nb.roll_argmax, x, args=(d, minp, reverse))
+
+
+def ts_arg_min(x: np.ndarray, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None) -> np.ndarray:
+    """最小值相对位置。最近的一天记为第0天"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _columns(_wq_nb.roll_argmin, x, args=(d, minp, reverse))
+
+
+def ts_decay_linear(x: np.ndarray, d: int = 30, min_samples: Optional[int] = None) -> np.ndarray:
+    """线性衰减移动平均"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _columns(_roll_decay_linear, x, args=((d,), (minp,)))
+
+
+def ts_rank(x: np.ndarray, d: int = 5, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动排名。平均排名除以窗口内有效值个数，范围(0,1]"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _columns(_roll_rank_quantile, x, args=(d, minp, (), 'nearest', True))
+
+
+def ts_product(x: np.ndarray, d: int = 5, min_samples: Optional[int] = None) -> np.ndarray:
+    """时序滚动乘"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    return _columns(_wq_nb.roll_prod, x, args=(d, minp))
+
+
+def ts_RMA(x: np.ndarray, timeperiod: int = 30) -> np.ndarray:
+    """alpha=1/timeperiod的指数移动平均，同`polars_ta.ta.RMA`"""
+    return _nb.ewm_mean(_c(x), 1 / timeperiod, timeperiod)
+
+
+def ts_RSI(close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
+    """相对强弱指标，同`polars_ta.tdx.RSI`。范围[0,1]"""
+    dif = ts_delta(close, 1)
+    dif[np.isnan(dif)] = 0
+    return ts_RMA(np.maximum(dif, 0), timeperiod) / (ts_RMA(np.abs(dif), timeperiod) + TA_EPSILON)
+
+
+def ts_ATR(high: np.ndarray, low: np.ndarray, close: np.ndarray, N: int = 14) -> np.ndarray:
+    """真实波幅的简单移动平均，同`polars_ta.tdx.ATR`"""
+    prev_close = ts_delay(close, 1)
+    # 与max_horizontal一样忽略缺失值
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return ts_mean(tr, N)
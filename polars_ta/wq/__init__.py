@@ -1,8 +1,224 @@
-from polars_ta.wq.arithmetic import *  # noqa
-from polars_ta.wq.cross_sectional import *  # noqa
-from polars_ta.wq.half_life import *  # noqa
-from polars_ta.wq.logical import *  # noqa
-from polars_ta.wq.preprocess import *  # noqa
-from polars_ta.wq.time_series import *  # noqa
-from polars_ta.wq.transformational import *  # noqa
-from polars_ta.wq.vector import *  # noqa
+# this code is auto generated by tools/lazy_init.py
+
+from polars_ta.utils.lazy import lazy_getattr
+
+__getattr__, __dir__, __all__ = lazy_getattr(__name__, {
+    'polars_ta.wq.arithmetic': [
+        'abs_',
+        'add',
+        'arc_cos',
+        'arc_sin',
+        'arc_tan',
+        'arc_tan2',
+        'cbrt',
+        'ceiling',
+        'cos',
+        'cosh',
+        'cot',
+        'cube',
+        'degrees',
+        'div',
+        'divide',
+        'exp',
+        'expm1',
+        'floor',
+        'fraction',
+        'inverse',
+        'log',
+        'log10',
+        'log1p',
+        'log2',
+        'max_',
+        'mean',
+        'min_',
+        'mod',
+        'multiply',
+        'power',
+        'radians',
+        'reverse',
+        'round_',
+        'round_down',
+        's_log_1p',
+        'sign',
+        'signed_power',
+        'sin',
+        'sinh',
+        'softsign',
+        'sqrt',
+        'square',
+        'std',
+        'subtract',
+        'tan',
+        'tanh',
+        'var',
+    ],
+    'polars_ta.wq.cross_sectional': [
+        'cs_fill_except_all_null',
+        'cs_fill_max',
+        'cs_fill_mean',
+        'cs_fill_min',
+        'cs_fill_null',
+        'cs_one_side',
+        'cs_qcut',
+        'cs_qcut_multi',
+        'cs_rank',
+        'cs_rank_if',
+        'cs_rank_multi',
+        'cs_regression_neut',
+        'cs_regression_proj',
+        'cs_scale',
+        'cs_scale_down',
+        'cs_top_bottom',
+        'cs_top_bottom_k',
+        'cs_transform_multi',
+        'cs_truncate',
+        'cs_zscore_multi',
+    ],
+    'polars_ta.wq.half_life': [
+        'ts_mean_hl',
+        'ts_moments_hl',
+        'ts_regression_hl',
+        'ts_std_hl',
+        'ts_sum_hl',
+        'ts_var_hl',
+    ],
+    'polars_ta.wq.logical': [
+        'and_',
+        'equal',
+        'if_else',
+        'is_finite',
+        'is_nan',
+        'is_not_finite',
+        'is_not_nan',
+        'is_not_null',
+        'is_null',
+        'less',
+        'negate',
+        'not_',
+        'or_',
+        'xor',
+    ],
+    'polars_ta.wq.preprocess': [
+        'cs_3sigma',
+        'cs_demean',
+        'cs_mad',
+        'cs_mad_zscore',
+        'cs_mad_zscore_resid',
+        'cs_mad_zscore_resid_zscore',
+        'cs_minmax',
+        'cs_preprocess_multi',
+        'cs_quantile',
+        'cs_quantile_zscore',
+        'cs_resid',
+        'cs_resid_group',
+        'cs_resid_multi',
+        'cs_resid_w',
+        'cs_resid_zscore',
+        'cs_robust_scale',
+        'cs_zscore',
+        'cs_zscore_resid',
+    ],
+    'polars_ta.wq.time_series': [
+        'ts_arg_max',
+        'ts_arg_min',
+        'ts_co_kurtosis',
+        'ts_co_skewness',
+        'ts_corr',
+        'ts_count',
+        'ts_count_eq',
+        'ts_count_ge',
+        'ts_count_nans',
+        'ts_count_nulls',
+        'ts_covariance',
+        'ts_cum_count',
+        'ts_cum_max',
+        'ts_cum_min',
+        'ts_cum_prod',
+        'ts_cum_prod_by',
+        'ts_cum_sum',
+        'ts_cum_sum_by',
+        'ts_cum_sum_reset',
+        'ts_decay_exp_window',
+        'ts_decay_linear',
+        'ts_decay_linear_multi',
+        'ts_delay',
+        'ts_delta',
+        'ts_fill_null',
+        'ts_ir',
+        'ts_kurtosis',
+        'ts_l2_norm',
+        'ts_log_diff',
+        'ts_max',
+        'ts_max_diff',
+        'ts_mean',
+        'ts_median',
+        'ts_min',
+        'ts_min_diff',
+        'ts_min_max_cps',
+        'ts_min_max_diff',
+        'ts_moment',
+        'ts_partial_corr',
+        'ts_percentage',
+        'ts_percentages',
+        'ts_pred',
+        'ts_product',
+        'ts_rank',
+        'ts_realized_volatility',
+        'ts_regression',
+        'ts_regression_intercept',
+        'ts_regression_pred',
+        'ts_regression_resid',
+        'ts_regression_slope',
+        'ts_resid',
+        'ts_returns',
+        'ts_scale',
+        'ts_shifts_v1',
+        'ts_shifts_v2',
+        'ts_shifts_v3',
+        'ts_signals_to_size',
+        'ts_skewness',
+        'ts_std_dev',
+        'ts_sum',
+        'ts_sum_split_by',
+        'ts_triple_corr',
+        'ts_weighted_decay',
+        'ts_weighted_mean',
+        'ts_weighted_sum',
+        'ts_zscore',
+    ],
+    'polars_ta.wq.transformational': [
+        'bool_',
+        'clamp',
+        'cut',
+        'fill_nan',
+        'fill_null',
+        'float_',
+        'int_',
+        'left_tail',
+        'lit_',
+        'logit',
+        'nop',
+        'purify',
+        'right_tail',
+        'sigmoid',
+        'tail',
+    ],
+    'polars_ta.wq.vector': [
+        'vec_avg',
+        'vec_choose',
+        'vec_count',
+        'vec_ir',
+        'vec_kurtosis',
+        'vec_l2_norm',
+        'vec_max',
+        'vec_median',
+        'vec_min',
+        'vec_norm',
+        'vec_percentage',
+        'vec_powersum',
+        'vec_range',
+        'vec_skewness',
+        'vec_stddev',
+        'vec_sum',
+    ],
+})
@@ -1,249 +1,530 @@
 import numpy as np
 from numba import jit, float64, boolean
-from numpy import argmax, argmin, full, vstack, corrcoef, nanprod, nanmean, nanstd
+from numpy import full
 from numpy.lib.stride_tricks import sliding_window_view
 
-from polars_ta.utils.numba_ import isnan, full_with_window_size, sliding_window_with_min_periods
+from polars_ta.utils._nb import isnan, _update_valid, _fill_window, _neumaier_add, _neumaier_scalar, _nanmean_range
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def roll_argmax(x1, window, min_periods, reverse):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
+def _roll_arg_extreme(x1, window, min_periods, reverse, is_max):
+    """单调队列实现的滚动最值位置，O(n)时间，O(w)额外内存
+
+    位置只计算窗口内的有效值(非NaN)，与先压缩NaN再argmax的结果一致。
+    reverse=True时，相同的最值取最近的一个，返回其后有效值的数量；
+    reverse=False时，相同的最值取最远的一个，返回其前有效值的数量。
+    """
+    n = x1.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+    if min_periods > window:
+        return out
+
+    # 环形缓冲区实现的双端队列，记录下标、值、截止到该下标的有效值累计数量
+    q_idx = np.empty(window, dtype=np.int64)
+    q_val = np.empty(window, dtype=np.float64)
+    q_cnt = np.empty(window, dtype=np.int64)
+    head = 0
+    size = 0
+
+    cum = 0  # 有效值累计数量
+    valid = 0  # 窗口内有效值数量
+    run = 0  # 到当前为止连续有效值数量
+    for i in range(n):
+        # 移出窗口
+        if i >= window:
+            if not np.isnan(float(x1[i - window])):
+                valid -= 1
+            if size > 0 and q_idx[head] <= i - window:
+                head = (head + 1) % window
+                size -= 1
+
+        v = float(x1[i])
+        if np.isnan(v):
+            run = 0
+            continue
+        cum += 1
+        valid += 1
+        run += 1
+
+        # 维护单调性。reverse时相等的旧值也弹出，使队首为最近的最值
+        while size > 0:
+            tail = (head + size - 1) % window
+            t = q_val[tail]
+            if is_max:
+                drop = t < v or (reverse and t == v)
+            else:
+                drop = t > v or (reverse and t == v)
+            if not drop:
+                break
+            size -= 1
+        tail = (head + size) % window
+        q_idx[tail] = i
+        q_val[tail] = v
+        q_cnt[tail] = cum
+        size += 1
 
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1[-min_periods:]).any():
+        if run < min_periods:
             continue
+        after = cum - q_cnt[head]
         if reverse:
-            v1 = v1[::-1]
-        out1[i] = argmax(v1[~np.isnan(v1)])
+            out[i] = after
+        else:
+            out[i] = valid - 1 - after
 
-    return out1[:x1.shape[0]]
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_argmax(x1, window, min_periods, reverse):
+    return _roll_arg_extreme(x1, window, min_periods, reverse, True)
 
 
 @jit(nopython=True, nogil=True, cache=True)
 def roll_argmin(x1, window, min_periods, reverse):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
+    return _roll_arg_extreme(x1, window, min_periods, reverse, False)
 
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1[-min_periods:]).any():
-            continue
-        if reverse:
-            v1 = v1[::-1]
-        out1[i] = argmin(v1[~np.isnan(v1)])
 
-    return out1[:x1.shape[0]]
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _prod_update(s, c, a, cnt, v, sign):
+    """窗口加入(sign=1)或移出(sign=-1)一个非nan值
+
+    s, c为log|x|之和及其补偿，a为|log|x||之和。cnt为0、符号位、inf、有效值的个数，打包成整数元组
+    """
+    zeros, signs, infs, valid = cnt
+    valid += sign
+    # 与连乘一致，符号由符号位决定，-0.0也算
+    if np.copysign(1.0, v) < 0:
+        signs += sign
+    if v == 0:
+        zeros += sign
+    elif np.isinf(v):
+        infs += sign
+    else:
+        t = np.log(np.abs(v))
+        s, c = _neumaier_scalar(s, c, sign * t)
+        a += sign * abs(t)
+    return s, c, a, (zeros, signs, infs, valid)
 
 
 @jit(nopython=True, nogil=True, cache=True)
 def roll_prod(x1, window, min_periods):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1).all():
+    """滚动乘积，忽略nan。维护log|x|之和、符号位个数与0的个数，每步O(1)
+
+    log|x|之和使用Neumaier补偿求和，每隔window步重新计算一次，防止长序列误差累积。
+    |log|x||之和超过700时中间积可能上溢或下溢，窗口中有inf时可能出现0*inf，这两种情况直接连乘窗口，与nanprod一致。
+    累加器都是标量，留在寄存器中
+    """
+    out1 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    s, c, a = 0.0, 0.0, 0.0
+    cnt = (0, 0, 0, 0)
+    for i in range(x1.shape[0]):
+        if i % window == 0:
+            # 重新计算
+            s, c, a = 0.0, 0.0, 0.0
+            cnt = (0, 0, 0, 0)
+            start = max(i - window + 1, 0)
+        else:
+            start = i
+            if i >= window and not np.isnan(x1[i - window]):
+                s, c, a, cnt = _prod_update(s, c, a, cnt, x1[i - window], -1)
+        for j in range(start, i + 1):
+            if not np.isnan(x1[j]):
+                s, c, a, cnt = _prod_update(s, c, a, cnt, x1[j], 1)
+
+        zeros, signs, infs, valid1 = cnt
+        if valid1 == 0 or valid1 < min_periods:
             continue
-        out1[i] = nanprod(v1)
-    return out1[:x1.shape[0]]
+        if infs > 0 or a > 700:
+            result = 1.0
+            for j in range(max(i - window + 1, 0), i + 1):
+                if not np.isnan(x1[j]):
+                    result *= x1[j]
+            out1[i] = result
+            continue
+        sign = -1.0 if signs % 2 else 1.0
+        out1[i] = sign * 0.0 if zeros > 0 else sign * np.exp(s + c)
+    return out1
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _co_kurtosis(a1, a2):
-    t1 = a1 - nanmean(a1)
-    t2 = a2 - nanmean(a2)
-    t3 = nanstd(a1)
-    t4 = nanstd(a2)
-    return nanmean(t1 * (t2 ** 3)) / (t3 * (t4 ** 3))
+def _moment_update(s, c, d, k, sign):
+    """累加或移除一个观测的1到k次幂"""
+    t = sign
+    for p in range(1, k + 1):
+        t *= d
+        _neumaier_add(s, c, p, t)
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def roll_co_kurtosis(x1, x2, window, min_periods):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2) in enumerate(zip(a1, a2)):
-        if np.isnan(v1).all():
-            continue
-        if np.isnan(v2).all():
+def _moment_reset(x1, i, window, k, s, c):
+    """以窗口均值为锚点重新计算幂和，返回新的锚点"""
+    anchor = _nanmean_range(x1, i - window + 1, i + 1)
+    s[:] = 0.0
+    c[:] = 0.0
+    for j in range(max(i - window + 1, 0), i + 1):
+        if not np.isnan(x1[j]):
+            _moment_update(s, c, x1[j] - anchor, k, 1.0)
+    return anchor
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_moment(x1, window, min_periods, k):
+    """滚动k阶中心矩。维护平移后的幂和，每步O(k)
+
+    幂和使用Neumaier补偿求和，每隔window步以窗口均值为锚点重新计算一次，防止长序列误差累积。
+    锚点与窗口均值的距离超过窗口标准差时也重新计算，否则价格这类漂移的序列在小窗口下幂和相减会严重抵消
+    """
+    out1 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    s = np.zeros(k + 1, dtype=np.float64)
+    c = np.zeros(k + 1, dtype=np.float64)
+    anchor = 0.0
+    valid1 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        if i % window == 0:
+            anchor = _moment_reset(x1, i, window, k, s, c)
+        elif valid1 == 1 and not np.isnan(x1[i]):
+            # 窗口中只有当前值，直接以它为锚点
+            anchor = x1[i]
+            s[:] = 0.0
+            c[:] = 0.0
+        else:
+            if i >= window and not np.isnan(x1[i - window]):
+                _moment_update(s, c, x1[i - window] - anchor, k, -1.0)
+            if not np.isnan(x1[i]):
+                _moment_update(s, c, x1[i] - anchor, k, 1.0)
+
+        if valid1 == 0 or valid1 < min_periods:
             continue
-        out1[i] = _co_kurtosis(v1, v2)
-    return out1[:x1.shape[0]]
+        mean = (s[1] + c[1]) / valid1
+        if k >= 2 and 2 * mean * mean > (s[2] + c[2]) / valid1:
+            anchor = _moment_reset(x1, i, window, k, s, c)
+            mean = (s[1] + c[1]) / valid1
+        # 由原点矩展开为中心矩: sum(C(k,j) * m_j * (-mean)^(k-j))
+        result = 0.0
+        binom = 1.0
+        for j in range(k + 1):
+            m_j = 1.0 if j == 0 else (s[j] + c[j]) / valid1
+            result += binom * m_j * (-mean) ** (k - j)
+            binom = binom * (k - j) / (j + 1)
+        out1[i] = result
+    return out1
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _co_skewness(a1, a2):
-    t1 = a1 - nanmean(a1)
-    t2 = a2 - nanmean(a2)
-    t3 = nanstd(a1)
-    t4 = nanstd(a2)
-    return nanmean(t1 * (t2 ** 2)) / (t3 * (t4 ** 2))
+def _co_moment_update(s, c, dx, dy, m, sign):
+    """累加或移除一个观测。s的布局为
+
+    0: x的一次和, 1: x的二次和, 2: y的一次和, 3: y的二次和,
+    4+b: 同时有效时y的b次和, 5+m+b: 同时有效时x乘y的b次和, b=0..m
+    """
+    x_valid = not np.isnan(dx)
+    y_valid = not np.isnan(dy)
+    if x_valid:
+        _neumaier_add(s, c, 0, sign * dx)
+        _neumaier_add(s, c, 1, sign * dx * dx)
+    if y_valid:
+        _neumaier_add(s, c, 2, sign * dy)
+        _neumaier_add(s, c, 3, sign * dy * dy)
+    if x_valid and y_valid:
+        t = sign
+        for b in range(m + 1):
+            _neumaier_add(s, c, 4 + b, t)
+            _neumaier_add(s, c, 5 + m + b, t * dx)
+            t *= dy
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def roll_co_skewness(x1, x2, window, min_periods):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2) in enumerate(zip(a1, a2)):
-        if np.isnan(v1).all():
+def _co_moment_reset(x1, x2, i, window, m, s, c):
+    """以窗口均值为锚点重新计算，返回新的锚点"""
+    ax = _nanmean_range(x1, i - window + 1, i + 1)
+    ay = _nanmean_range(x2, i - window + 1, i + 1)
+    s[:] = 0.0
+    c[:] = 0.0
+    for j in range(max(i - window + 1, 0), i + 1):
+        _co_moment_update(s, c, x1[j] - ax, x2[j] - ay, m, 1.0)
+    return ax, ay
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _roll_co_moment(x1, x2, window, min_periods, m):
+    """滚动协矩 mean((x-mean(x))*(y-mean(y))**m) / (std(x)*std(y)**m)
+
+    均值与标准差按各自的有效值计算，协矩按同时有效的值计算，与nanmean/nanstd的逐窗口写法一致。
+    使用Neumaier补偿求和，每隔window步或锚点偏离窗口均值超过一个标准差时重新锚定
+    """
+    out1 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    s = np.zeros(6 + 2 * m, dtype=np.float64)
+    c = np.zeros(6 + 2 * m, dtype=np.float64)
+    ax = 0.0
+    ay = 0.0
+    valid1 = 0
+    valid2 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        valid2 = _update_valid(x2, i, window, valid2)
+        if i % window == 0:
+            ax, ay = _co_moment_reset(x1, x2, i, window, m, s, c)
+        else:
+            if i >= window:
+                _co_moment_update(s, c, x1[i - window] - ax, x2[i - window] - ay, m, -1.0)
+            # 窗口中只有当前值时，直接以它为锚点。此时同时有效的累加和必为空
+            if valid1 == 1 and not np.isnan(x1[i]):
+                ax = x1[i]
+                s[0:2] = 0.0
+                c[0:2] = 0.0
+                s[4:] = 0.0
+                c[4:] = 0.0
+            if valid2 == 1 and not np.isnan(x2[i]):
+                ay = x2[i]
+                s[2:] = 0.0
+                c[2:] = 0.0
+            _co_moment_update(s, c, x1[i] - ax, x2[i] - ay, m, 1.0)
+
+        if valid1 == 0 or valid1 < min_periods:
+            continue
+        if valid2 == 0 or valid2 < min_periods:
             continue
-        if np.isnan(v2).all():
+        n12 = s[4] + c[4]
+        if n12 < 0.5:
             continue
-        out1[i] = _co_skewness(v1, v2)
-    return out1[:x1.shape[0]]
+        mx = (s[0] + c[0]) / valid1
+        my = (s[2] + c[2]) / valid2
+        if 2 * mx * mx > (s[1] + c[1]) / valid1 or 2 * my * my > (s[3] + c[3]) / valid2:
+            # 锚点偏离窗口均值超过一个标准差，重新锚定
+            ax, ay = _co_moment_reset(x1, x2, i, window, m, s, c)
+            mx = (s[0] + c[0]) / valid1
+            my = (s[2] + c[2]) / valid2
+        vx = max((s[1] + c[1]) / valid1 - mx * mx, 0.0)
+        vy = max((s[3] + c[3]) / valid2 - my * my, 0.0)
+        denominator = vx ** 0.5 * vy ** (m / 2)
+        if denominator == 0:
+            continue
+        # sum((dx-mx)*(dy-my)**m) = sum(C(m,b)*(-my)^(m-b)*(sum(dx*dy^b)-mx*sum(dy^b)))
+        numerator = 0.0
+        binom = 1.0
+        for b in range(m + 1):
+            t = (s[5 + m + b] + c[5 + m + b]) - mx * (s[4 + b] + c[4 + b])
+            numerator += binom * (-my) ** (m - b) * t
+            binom = binom * (m - b) / (b + 1)
+        out1[i] = numerator / n12 / denominator
+    return out1
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _moment(a1, k):
-    """centeral moment
-    中心矩阵"""
-    return nanmean((a1 - nanmean(a1)) ** k)
+def roll_co_kurtosis(x1, x2, window, min_periods):
+    return _roll_co_moment(x1, x2, window, min_periods, 3)
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def roll_moment(x1, window, min_periods, k):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1).all():
-            continue
-        out1[i] = _moment(v1, k)
-    return out1[:x1.shape[0]]
+def roll_co_skewness(x1, x2, window, min_periods):
+    return _roll_co_moment(x1, x2, window, min_periods, 2)
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _trivariate_update(s, c, dx, dy, dz, sign):
+    """累加或移除一个观测。s的布局为
+
+    0-5: x,y,z各自有效值的一次和与二次和,
+    6-16: 三者同时有效时的 n, x, y, z, xx, yy, zz, xy, xz, yz, xyz
+    """
+    x_valid = not np.isnan(dx)
+    y_valid = not np.isnan(dy)
+    z_valid = not np.isnan(dz)
+    if x_valid:
+        _neumaier_add(s, c, 0, sign * dx)
+        _neumaier_add(s, c, 1, sign * dx * dx)
+    if y_valid:
+        _neumaier_add(s, c, 2, sign * dy)
+        _neumaier_add(s, c, 3, sign * dy * dy)
+    if z_valid:
+        _neumaier_add(s, c, 4, sign * dz)
+        _neumaier_add(s, c, 5, sign * dz * dz)
+    if x_valid and y_valid and z_valid:
+        _neumaier_add(s, c, 6, sign)
+        _neumaier_add(s, c, 7, sign * dx)
+        _neumaier_add(s, c, 8, sign * dy)
+        _neumaier_add(s, c, 9, sign * dz)
+        _neumaier_add(s, c, 10, sign * dx * dx)
+        _neumaier_add(s, c, 11, sign * dy * dy)
+        _neumaier_add(s, c, 12, sign * dz * dz)
+        _neumaier_add(s, c, 13, sign * dx * dy)
+        _neumaier_add(s, c, 14, sign * dx * dz)
+        _neumaier_add(s, c, 15, sign * dy * dz)
+        _neumaier_add(s, c, 16, sign * dx * dy * dz)
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _partial_corr(a1, a2, a3):
-    """TODO 不知是否正确，需要检查"""
-    c = corrcoef(vstack((a1, a2, a3)))
-    rxy = c[0, 1]
-    rxz = c[0, 2]
-    ryz = c[1, 2]
-    t1 = rxy - rxz * ryz
-    t2 = (1 - rxz ** 2) ** 0.5
-    t3 = (1 - ryz ** 2) ** 0.5
-    return t1 / (t2 * t3)
+def _trivariate_reset(x1, x2, x3, i, window, s, c):
+    """以窗口均值为锚点重新计算，返回新的锚点"""
+    ax = _nanmean_range(x1, i - window + 1, i + 1)
+    ay = _nanmean_range(x2, i - window + 1, i + 1)
+    az = _nanmean_range(x3, i - window + 1, i + 1)
+    s[:] = 0.0
+    c[:] = 0.0
+    for j in range(max(i - window + 1, 0), i + 1):
+        _trivariate_update(s, c, x1[j] - ax, x2[j] - ay, x3[j] - az, 1.0)
+    return ax, ay, az
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def roll_partial_corr(x1, x2, x3, window, min_periods):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    out3 = full_with_window_size(x3, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    a3 = sliding_window_with_min_periods(out3, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2, v3) in enumerate(zip(a1, a2, a3)):
-        if np.isnan(v1).all():
+def _roll_trivariate(x1, x2, x3, window, min_periods, partial):
+    """滚动三元统计量，维护充分统计量，每步O(1)
+
+    partial=True为偏相关，与corrcoef一致，窗口内有任何nan都输出nan；
+    partial=False为三元相关，均值与标准差按各自的有效值计算，乘积按同时有效的值计算。
+    使用Neumaier补偿求和，每隔window步或锚点偏离窗口均值超过一个标准差时重新锚定
+    """
+    out1 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    s = np.zeros(17, dtype=np.float64)
+    c = np.zeros(17, dtype=np.float64)
+    ax = 0.0
+    ay = 0.0
+    az = 0.0
+    valid1 = 0
+    valid2 = 0
+    valid3 = 0
+    for i in range(x1.shape[0]):
+        valid1 = _update_valid(x1, i, window, valid1)
+        valid2 = _update_valid(x2, i, window, valid2)
+        valid3 = _update_valid(x3, i, window, valid3)
+        if i % window == 0:
+            ax, ay, az = _trivariate_reset(x1, x2, x3, i, window, s, c)
+        else:
+            if i >= window:
+                _trivariate_update(s, c, x1[i - window] - ax, x2[i - window] - ay, x3[i - window] - az, -1.0)
+            # 窗口中只有当前值时，直接以它为锚点。此时同时有效的累加和必为空
+            if valid1 == 1 and not np.isnan(x1[i]):
+                ax = x1[i]
+                s[0:2] = 0.0
+                c[0:2] = 0.0
+                s[6:] = 0.0
+                c[6:] = 0.0
+            if valid2 == 1 and not np.isnan(x2[i]):
+                ay = x2[i]
+                s[2:4] = 0.0
+                c[2:4] = 0.0
+                s[6:] = 0.0
+                c[6:] = 0.0
+            if valid3 == 1 and not np.isnan(x3[i]):
+                az = x3[i]
+                s[4:] = 0.0
+                c[4:] = 0.0
+            _trivariate_update(s, c, x1[i] - ax, x2[i] - ay, x3[i] - az, 1.0)
+
+        if valid1 == 0 or valid1 < min_periods:
             continue
-        if np.isnan(v2).all():
+        if valid2 == 0 or valid2 < min_periods:
             continue
-        if np.isnan(v3).all():
+        if valid3 == 0 or valid3 < min_periods:
             continue
-        out1[i] = _partial_corr(v1, v2, v3)
-    return out1[:x1.shape[0]]
+        if 2 * (s[0] + c[0]) ** 2 > (s[1] + c[1]) * valid1 \
+                or 2 * (s[2] + c[2]) ** 2 > (s[3] + c[3]) * valid2 \
+                or 2 * (s[4] + c[4]) ** 2 > (s[5] + c[5]) * valid3:
+            # 锚点偏离窗口均值超过一个标准差，重新锚定
+            ax, ay, az = _trivariate_reset(x1, x2, x3, i, window, s, c)
+        n = s[6] + c[6]
+        if partial:
+            if i < window - 1 or n < window - 0.5:
+                continue
+            mx = (s[7] + c[7]) / n
+            my = (s[8] + c[8]) / n
+            mz = (s[9] + c[9]) / n
+            vx = (s[10] + c[10]) / n - mx * mx
+            vy = (s[11] + c[11]) / n - my * my
+            vz = (s[12] + c[12]) / n - mz * mz
+            if vx <= 0 or vy <= 0 or vz <= 0:
+                continue
+            # 舍入误差可能使相关系数略超出[-1, 1]
+            rxy = min(max(((s[13] + c[13]) / n - mx * my) / (vx * vy) ** 0.5, -1.0), 1.0)
+            rxz = min(max(((s[14] + c[14]) / n - mx * mz) / (vx * vz) ** 0.5, -1.0), 1.0)
+            ryz = min(max(((s[15] + c[15]) / n - my * mz) / (vy * vz) ** 0.5, -1.0), 1.0)
+            t1 = rxy - rxz * ryz
+            t2 = (1 - rxz ** 2) * (1 - ryz ** 2)
+            if t2 <= 0:
+                continue
+            out1[i] = min(max(t1 / t2 ** 0.5, -1.0), 1.0)
+        else:
+            if n < 0.5:
+                continue
+            mx = (s[0] + c[0]) / valid1
+            my = (s[2] + c[2]) / valid2
+            mz = (s[4] + c[4]) / valid3
+            vx = max((s[1] + c[1]) / valid1 - mx * mx, 0.0)
+            vy = max((s[3] + c[3]) / valid2 - my * my, 0.0)
+            vz = max((s[5] + c[5]) / valid3 - mz * mz, 0.0)
+            denominator = (vx * vy * vz) ** 0.5
+            if denominator == 0:
+                continue
+            # sum((dx-mx)*(dy-my)*(dz-mz))展开
+            numerator = (s[16] + c[16]) \
+                        - mx * (s[15] + c[15]) - my * (s[14] + c[14]) - mz * (s[13] + c[13]) \
+                        + mx * my * (s[9] + c[9]) + mx * mz * (s[8] + c[8]) + my * mz * (s[7] + c[7]) \
+                        - mx * my * mz * n
+            out1[i] = numerator / n / denominator
+    return out1
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _triple_corr(a1, a2, a3):
-    t1 = a1 - nanmean(a1)
-    t2 = a2 - nanmean(a2)
-    t3 = a3 - nanmean(a3)
-    t4 = nanstd(a1)
-    t5 = nanstd(a2)
-    t6 = nanstd(a3)
-    return nanmean(t1 * t2 * t3) / (t4 * t5 * t6)
+def roll_partial_corr(x1, x2, x3, window, min_periods):
+    return _roll_trivariate(x1, x2, x3, window, min_periods, True)
 
 
 @jit(nopython=True, nogil=True, cache=True)
 def roll_triple_corr(x1, x2, x3, window, min_periods):
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    out2 = full_with_window_size(x2, np.nan, dtype=np.float64, window_size=window)
-    out3 = full_with_window_size(x3, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    a2 = sliding_window_with_min_periods(out2, window, min_periods)
-    a3 = sliding_window_with_min_periods(out3, window, min_periods)
-    out1[:] = np.nan
-    for i, (v1, v2, v3) in enumerate(zip(a1, a2, a3)):
-        if np.isnan(v1).all():
-            continue
-        if np.isnan(v2).all():
-            continue
-        if np.isnan(v3).all():
-            continue
-        out1[i] = _triple_corr(v1, v2, v3)
-    return out1[:x1.shape[0]]
+    return _roll_trivariate(x1, x2, x3, window, min_periods, False)
 
 
 @jit(nopython=True, nogil=True, fastmath=True, cache=True)
 def _cum_prod_by(r, by):
-    out = full(by.shape, 0, dtype=np.float64)
-    out[:] = by
-    for i in range(1, r.shape[0]):
-        if isnan(out[i]):
-            out[i] = r[i] * out[i - 1]
+    out = full(by.shape, 0, dtype=by.dtype)
+    last = 0.0
+    for i in range(r.shape[0]):
+        curr = float(by[i])
+        if i > 0 and isnan(curr):
+            curr = r[i] * last
+        out[i] = curr
+        last = curr
     return out
 
 
 @jit(nopython=True, nogil=True, fastmath=True, cache=True)
 def _cum_sum_by(r, by):
-    out = full(by.shape, 0, dtype=np.float64)
-    out[:] = by
-    for i in range(1, r.shape[0]):
-        if isnan(out[i]):
-            out[i] = r[i] + out[i - 1]
+    out = full(by.shape, 0, dtype=by.dtype)
+    last = 0.0
+    for i in range(r.shape[0]):
+        curr = float(by[i])
+        if i > 0 and isnan(curr):
+            curr = r[i] + last
+        out[i] = curr
+        last = curr
     return out
 
 
 @jit(nopython=True, nogil=True, fastmath=True, cache=True)
 def _cum_sum_reset(a):
-    last = 0
-    out = full(a.shape, 0, dtype=np.float64)
+    last = 0.0
+    out = full(a.shape, 0, dtype=a.dtype)
     for i in range(0, a.shape[0]):
-        curr = 0 if isnan(a[i]) else a[i]
+        curr = 0.0 if isnan(a[i]) else float(a[i])
 
         if curr == 0:
-            out[i] = 0
+            last = 0.0
         elif curr > 0:
             if last <= 0:
-                out[i] = curr
+                last = curr
             else:
-                out[i] = curr + last
+                last = curr + last
         elif curr < 0:
             if last >= 0:
-                out[i] = curr
+                last = curr
             else:
-                out[i] = curr + last
+                last = curr + last
 
-        last = out[i]
+        out[i] = last
     return out
 
 
-@jit(nopython=True, nogil=True, cache=True)
-def _sum_split_by(x1, x2, window=10, n=2):
-    out1 = np.full(x1.shape[0], np.nan, dtype=np.float64)
-    out2 = np.full(x1.shape[0], np.nan, dtype=np.float64)
-    if len(x1) < window:
-        return out1, out2
-    a1 = sliding_window_view(x1, window)
-    a2 = sliding_window_view(x2, window)
-    for i, (v1, v2) in enumerate(zip(a1, a2)):
-        # 排序两次，解决nan的问题
-        b1 = np.argsort(v2)[:n]
-        b2 = np.argsort(-v2)[:n]
-        out1[i + window - 1] = np.sum(v1[b1])
-        out2[i + window - 1] = np.sum(v1[b2])
-    return out1, out2
-
-
 @jit(float64[:](boolean[:], boolean[:], boolean[:], boolean[:], boolean, boolean),
      nopython=True, nogil=True, cache=True)
 def _signals_to_size(is_long_entry: np.ndarray, is_long_exit: np.ndarray,
@@ -318,42 +599,703 @@ def _signals_to_size(is_long_entry: np.ndarray, is_long_exit: np.ndarray,
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _roll_decay_linear(x1, window, min_periods):
+def roll_decay_linear(x1, windows, min_periods):
+    """线性衰减移动平均，权重为1..d，最新的值权重最大。一次计算多个窗口，每步O(1)
+
+    递推: W' = W - S + d * x_new, S' = S + x_new - x_old。每隔d步由窗口重新计算一次，防止误差累积
+
+    与`rolling_mean(weights=...)`一致：
+    1. 序列开头不满d行时，权重靠右对齐，除以用到的权重之和。行数不足min_periods时为nan
+    2. 窗口中有nan时为nan
+
+    Parameters
+    ----------
+    windows
+        多个窗口大小
+    min_periods
+        与windows一一对应
+
+    Returns
+    -------
+    np.ndarray
+        二维数组，每行对应一个窗口
+
     """
-    def ts_decay_linear(x: Expr, d: int = 30, min_samples: Optional[int] = None) -> Expr:
-        minp = min_samples or polars_ta.MIN_SAMPLES or d
-        return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _roll_decay_linear, d, minp), return_dtype=Float64)
+    n = x1.shape[0]
+    out = np.full((windows.shape[0], n), np.nan, dtype=x1.dtype)
+    for k in range(windows.shape[0]):
+        d = windows[k]
+        s = 0.0
+        w = 0.0
+        nans = 0
+        for i in range(n):
+            if i % d == 0:
+                # 重新计算
+                s = 0.0
+                w = 0.0
+                nans = 0
+                for j in range(max(i - d + 1, 0), i + 1):
+                    if np.isnan(x1[j]):
+                        nans += 1
+                    else:
+                        s += x1[j]
+                        w += (d - i + j) * x1[j]
+            else:
+                # 所有权重减1，最旧的值权重变为0后移出
+                w -= s
+                if i >= d:
+                    if np.isnan(x1[i - d]):
+                        nans -= 1
+                    else:
+                        s -= x1[i - d]
+                if np.isnan(x1[i]):
+                    nans += 1
+                else:
+                    s += x1[i]
+                    w += d * x1[i]
+
+            m = min(i + 1, d)
+            if nans > 0 or m < min_periods[k]:
+                continue
+            # d + (d-1) + ... + (d-m+1)
+            out[k, i] = w / (m * (2 * d - m + 1) / 2)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_exp_moments(x1, window, min_periods, factor):
+    """截断指数加权的滚动均值、和、方差、标准差，一次扫描，每步O(1)
 
+    最新值权重为1，往前依次乘factor。NaN跳过，不参与加权，权重按剩下的有效值归一化。
+    递推时所有累加量乘factor，再减去移出窗口的项(权重factor**window)。
+    每window步按当前窗口重新计算一次，并把均值作为中心，避免误差累积与方差相减时的抵消
+
+    Returns
+    -------
+    out
+        二维数组，四行依次为均值、加权和、方差、标准差。方差为总体方差，与polars带权重时一致
     """
-    weights = np.arange(1., window + 1)
+    n = x1.shape[0]
+    out = np.full((4, n), np.nan, dtype=np.float64)
+    fd = factor ** window
+
+    c = 0.0  # 中心
+    a = 0.0  # 权重和
+    b = 0.0  # 加权(x-c)和
+    q = 0.0  # 加权(x-c)**2和
+    valid = 0
+    for i in range(n):
+        # 移出inf时减法得到nan，也重新计算
+        if i % window == 0 or (i >= window and np.isinf(float(x1[i - window]))):
+            # 重新计算。先求均值作为新的中心
+            start = max(i - window + 1, 0)
+            a = 0.0
+            b = 0.0
+            valid = 0
+            w = 1.0
+            for j in range(i, start - 1, -1):
+                v = float(x1[j])
+                if not np.isnan(v):
+                    a += w
+                    b += w * v
+                    valid += 1
+                w *= factor
+            c = b / a if a > 0 else 0.0
+            b = 0.0
+            q = 0.0
+            w = 1.0
+            for j in range(i, start - 1, -1):
+                v = float(x1[j]) - c
+                if not np.isnan(v):
+                    b += w * v
+                    q += w * v * v
+                w *= factor
+        else:
+            a *= factor
+            b *= factor
+            q *= factor
+            if i >= window:
+                v = float(x1[i - window]) - c
+                if not np.isnan(v):
+                    a -= fd
+                    b -= fd * v
+                    q -= fd * v * v
+                    valid -= 1
+            v = float(x1[i]) - c
+            if not np.isnan(v):
+                a += 1.0
+                b += v
+                q += v * v
+                valid += 1
 
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1).all():
+        if valid == 0 or valid < min_periods or a <= 0:
             continue
-        mask = ~np.isnan(v1)
-        out1[i] = np.average(v1[mask], weights=weights[mask])
-    return out1[:x1.shape[0]]
+        m = b / a
+        var = max(q / a - m * m, 0.0)
+        out[0, i] = c + m
+        out[1, i] = b + c * a
+        out[2, i] = var
+        out[3, i] = np.sqrt(var)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _ols_row(y, xx, j, cx, cy, z, one):
+    """第j行减去中心后写入z，最后一位为截距项，有截距时one=1，否则one=0。返回减去中心的y，y或任一x为nan时返回nan"""
+    p = xx.shape[0]
+    for r in range(p):
+        z[r] = float(xx[r, j]) - cx[r]
+        if np.isnan(z[r]):
+            return np.nan
+    z[p] = one
+    return float(y[j]) - cy
+
+
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _ols_row_inf(y, xx, j):
+    """第j行的y或x中是否有inf"""
+    if np.isinf(float(y[j])):
+        return True
+    for r in range(xx.shape[0]):
+        if np.isinf(float(xx[r, j])):
+            return True
+    return False
+
+
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _ols_add(m, v, z, yt, w):
+    """加权累加z·z'与z·y，返回w·y**2。w为负时移出"""
+    k = z.shape[0]
+    for r in range(k):
+        wz = w * z[r]
+        v[r] += wz * yt
+        for c in range(k):
+            m[r, c] += wz * z[c]
+    return w * yt * yt
 
 
 @jit(nopython=True, nogil=True, cache=True)
-def _roll_decay_exp_window(x1, window, min_periods, factor):
+def _solve(m, v, a, k):
+    """部分主元高斯-约当消元，只用m与v的前k行k列，m与v不变
+
+    a的前k行2k+1列为工作区，消元后第k列为m·beta=v的解，后k列为m的逆。主元相对原对角线过小时视为奇异，返回False
     """
-    def ts_decay_exp_window(x: Expr, d: int = 30, factor: float = 1.0, min_samples: Optional[int] = None) -> Expr:
-        minp = min_samples or polars_ta.MIN_SAMPLES or d
-        return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _roll_decay_exp_window, d, minp, factor), return_dtype=Float64)
+    for r in range(k):
+        for c in range(k):
+            a[r, c] = m[r, c]
+            a[r, k + 1 + c] = 0.0
+        a[r, k] = v[r]
+        a[r, k + 1 + r] = 1.0
+    for c in range(k):
+        p = c
+        for r in range(c + 1, k):
+            if abs(a[r, c]) > abs(a[p, c]):
+                p = r
+        if not abs(a[p, c]) > 1e-10 * abs(m[c, c]):
+            return False
+        if p != c:
+            for t in range(c, 2 * k + 1):
+                a[c, t], a[p, t] = a[p, t], a[c, t]
+        f = a[c, c]
+        for t in range(c, 2 * k + 1):
+            a[c, t] /= f
+        for r in range(k):
+            f = a[r, c]
+            if r == c or f == 0:
+                continue
+            for t in range(c, 2 * k + 1):
+                a[r, t] -= f * a[c, t]
+    return True
+
 
+@jit(nopython=True, nogil=True, cache=True, inline='always')
+def _t_value(b, var):
+    """系数除以标准误。完全拟合时方差为0，与numpy一致得到±inf，系数也为0时为nan，不抛ZeroDivisionError"""
+    if var > 0:
+        return b / np.sqrt(var)
+    if var == 0 and b != 0:
+        return np.inf if b > 0 else -np.inf
+    return np.nan
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_ols(y, xx, window, min_periods, factor, add_intercept):
+    """滚动最小二乘，可带指数衰减的权重。每步O(p**2)更新加权的充分统计量，再解k元方程组，k为x的个数加截距
+
+    最新一行权重为1，往前依次乘factor，factor=1时为普通最小二乘。y或任一x为nan的行跳过。
+    与roll_exp_moments一样，递推时累加量乘factor并减去移出窗口的行，每window步重新计算。
+    有截距时以加权均值为中心，避免误差累积与相减时的抵消
+
+    Parameters
+    ----------
+    y
+    xx
+        二维数组，每行一个自变量
+    window
+    min_periods
+        窗口内有效行的最少数量，至少为k
+    factor
+        衰减系数
+    add_intercept
+        是否带截距
+
+    Returns
+    -------
+    out
+        二维数组，共2p+5行。前p行为斜率，之后依次为截距、当前行的残差、当前行的预测值、R²，
+        最后p+1行为斜率与截距的t值。方差按加权残差平方和除以(有效行数-k)估计，与WLS一致，完全拟合时t值为±inf。
+        无截距时截距为0、其t值为nan、R²不减均值。自变量共线时都为nan，当前行y或x为nan时残差与预测值为nan
     """
-    weights = factor ** np.arange(window - 1, -1, -1)
+    p = xx.shape[0]
+    # 累加量总是多留截距一位，无截距时这一位恒为0，解方程时只用前p行p列
+    k = p + 1 if add_intercept else p
+    one = 1.0 if add_intercept else 0.0
+    n = y.shape[0]
+    out = np.full((2 * p + 5, n), np.nan, dtype=np.float64)
+    fd = factor ** window
+    min_periods = max(min_periods, k)
+
+    cx = np.zeros(p, dtype=np.float64)
+    cy = 0.0
+    m = np.zeros((p + 1, p + 1), dtype=np.float64)  # 加权z·z'，有截距时m[p, p]为权重和
+    v = np.zeros(p + 1, dtype=np.float64)  # 加权z·y，有截距时v[p]为加权y和
+    syy = 0.0  # 加权y**2和
+    z = np.empty(p + 1, dtype=np.float64)
+    a = np.empty((p + 1, 2 * p + 3), dtype=np.float64)
+    valid = 0
+    for i in range(n):
+        # 移出inf时减法得到nan，也重新计算
+        if i % window == 0 or (i >= window and _ols_row_inf(y, xx, i - window)):
+            start = max(i - window + 1, 0)
+            if add_intercept:
+                # 先求加权均值作为新的中心，x的加权和暂存在m[p]
+                cx[:] = 0.0
+                cy = 0.0
+                m[p, :] = 0.0
+                sw = 0.0
+                sy = 0.0
+                w = 1.0
+                for j in range(i, start - 1, -1):
+                    yt = _ols_row(y, xx, j, cx, cy, z, one)
+                    if not np.isnan(yt):
+                        for r in range(p):
+                            m[p, r] += w * z[r]
+                        sw += w
+                        sy += w * yt
+                    w *= factor
+                for r in range(p):
+                    cx[r] = m[p, r] / sw if sw > 0 else 0.0
+                cy = sy / sw if sw > 0 else 0.0
 
-    out1 = full_with_window_size(x1, np.nan, dtype=np.float64, window_size=window)
-    a1 = sliding_window_with_min_periods(out1, window, min_periods)
-    out1[:] = np.nan
-    for i, v1 in enumerate(a1):
-        if np.isnan(v1).all():
+            m[:, :] = 0.0
+            v[:] = 0.0
+            syy = 0.0
+            valid = 0
+            w = 1.0
+            for j in range(i, start - 1, -1):
+                yt = _ols_row(y, xx, j, cx, cy, z, one)
+                if not np.isnan(yt):
+                    syy += _ols_add(m, v, z, yt, w)
+                    valid += 1
+                w *= factor
+        else:
+            m *= factor
+            v *= factor
+            syy *= factor
+            if i >= window:
+                yt = _ols_row(y, xx, i - window, cx, cy, z, one)
+                if not np.isnan(yt):
+                    syy += _ols_add(m, v, z, yt, -fd)
+                    valid -= 1
+            yt = _ols_row(y, xx, i, cx, cy, z, one)
+            if not np.isnan(yt):
+                syy += _ols_add(m, v, z, yt, 1.0)
+                valid += 1
+
+        if valid < min_periods or not _solve(m, v, a, k):
             continue
-        mask = ~np.isnan(v1)
-        out1[i] = np.average(v1[mask], weights=weights[mask])
-    return out1[:x1.shape[0]]
+        ssr = syy
+        for r in range(k):
+            ssr -= a[r, k] * v[r]
+        ssr = max(ssr, 0.0)
+        sst = syy - v[p] * v[p] / m[p, p] if add_intercept else syy
+        if sst > 0:
+            out[p + 3, i] = 1.0 - ssr / sst
+        s2 = ssr / (valid - k) if valid > k else np.nan
+
+        # 中心化的截距换算回原坐标，方差为c'·inv(m)·c，c = (-cx, 1)
+        intercept = 0.0
+        if add_intercept:
+            intercept = a[p, k] + cy
+            q = a[p, k + 1 + p]
+            for r in range(p):
+                intercept -= a[r, k] * cx[r]
+                q -= 2 * cx[r] * a[r, k + 1 + p]
+                for c in range(p):
+                    q += cx[r] * cx[c] * a[r, k + 1 + c]
+            out[2 * p + 4, i] = _t_value(intercept, s2 * q)
+        out[p, i] = intercept
+        for r in range(p):
+            out[r, i] = a[r, k]
+            out[p + 4 + r, i] = _t_value(a[r, k], s2 * a[r, k + 1 + r])
+
+        yt = _ols_row(y, xx, i, cx, cy, z, one)
+        if not np.isnan(yt):
+            pred = intercept
+            for r in range(p):
+                pred += a[r, k] * float(xx[r, i])
+            out[p + 2, i] = pred
+            out[p + 1, i] = float(y[i]) - pred
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _fenwick_add(tree, i, v):
+    i += 1
+    while i < tree.shape[0]:
+        tree[i] += v
+        i += i & -i
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _fenwick_sum(tree, i):
+    """前i个位置的计数"""
+    s = 0
+    while i > 0:
+        s += tree[i]
+        i -= i & -i
+    return s
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _fenwick_kth(tree, k, step):
+    """第k小(从1开始)所在的位置。step为不超过树大小的最大2的幂"""
+    pos = 0
+    while step > 0:
+        if pos + step < tree.shape[0] and tree[pos + step] < k:
+            pos += step
+            k -= tree[pos]
+        step >>= 1
+    return pos
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def roll_rank_quantile(x1, orders, window, min_periods, qs, method, rank):
+    """滚动排名与分位数，一次遍历得到多个输出
+
+    序列分块处理，每块连同前面window-1个值在块内排序。窗口内的值在树状数组(Fenwick)中按排序位置计数，
+    进出窗口、求排名、求第k小都是O(log w)，树很小，常驻缓存
+
+    Parameters
+    ----------
+    x1
+        前面补window-1个nan，后面用nan补齐整块
+    orders
+        第b行为第b块`x1[b*block:b*block+window-1+block]`的argsort，nan排在最后。
+        numba的argsort比numpy慢数倍，所以在外面用numpy按行排序后传入
+    qs
+        分位数数组，0~1
+    method
+        分位数插值方法。0:nearest 1:lower 2:higher 3:midpoint 4:linear。与polars一致
+    rank
+        是否输出排名。排名为平均排名除以窗口内有效值个数，当前值为nan时为nan
+
+    Returns
+    -------
+    np.ndarray
+        二维数组，长度为补齐整块后的长度。有rank时第0行为排名，之后每行对应一个分位数
+
+    """
+    size = orders.shape[1]
+    block = size - window + 1
+    k = qs.shape[0]
+    r = 1 if rank else 0
+    out = np.full((r + k, orders.shape[0] * block), np.nan, dtype=x1.dtype)
+
+    tree = np.zeros(size + 1, dtype=np.int64)
+    lo = np.empty(size, dtype=np.int64)
+    step = 1
+    while step * 2 <= size:
+        step *= 2
+
+    for b in range(orders.shape[0]):
+        seg = x1[b * block:b * block + size]
+        order = orders[b]
+        # 相同值都计在排序后第一次出现的位置
+        j = 0
+        for t in range(size):
+            if seg[order[t]] != seg[order[j]]:
+                j = t
+            lo[order[t]] = j
+
+        tree[:] = 0
+        cnt = 0
+        for t in range(window - 1):
+            if not np.isnan(seg[t]):
+                _fenwick_add(tree, lo[t], 1)
+                cnt += 1
+
+        for t in range(window - 1, size):
+            v = seg[t]
+            if not np.isnan(v):
+                _fenwick_add(tree, lo[t], 1)
+                cnt += 1
+            if t >= window and not np.isnan(seg[t - window]):
+                _fenwick_add(tree, lo[t - window], -1)
+                cnt -= 1
+            if cnt == 0 or cnt < min_periods:
+                continue
+
+            i = b * block + t - window + 1
+            if rank and not np.isnan(v):
+                less = _fenwick_sum(tree, lo[t])
+                equal = _fenwick_sum(tree, lo[t] + 1) - less
+                out[0, i] = (less + (equal + 1) / 2) / cnt
+
+            for q in range(k):
+                f = (cnt - 1) * qs[q]
+                a = int(np.floor(f))
+                if method == 0:
+                    a = int(np.floor(f + 0.5))
+                elif method == 2:
+                    a = int(np.ceil(f))
+                lower = seg[order[_fenwick_kth(tree, a + 1, step)]]
+                if method <= 2 or a == f:
+                    out[r + q, i] = lower
+                    continue
+                upper = seg[order[_fenwick_kth(tree, a + 2, step)]]
+                if method == 3:
+                    out[r + q, i] = (lower + upper) / 2
+                else:
+                    out[r + q, i] = lower + (f - a) * (upper - lower)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _sum_split_by(x1, x2, orders, window, n):
+    """切割论求和。窗口内by(x2)最小的n个与最大的n个对应位置的x(x1)之和
+
+    与`roll_rank_quantile`一样分块处理，窗口内的值按排序位置计入树状数组，
+    第n小、第n大的定位与区间求和都是O(log w)
+
+    Parameters
+    ----------
+    x1, x2
+        前面补window-1个nan，后面用nan补齐整块
+    orders
+        第b块x2的稳定排序(argsort)，nan排在最后。by相同时，最小的n个优先取先进入窗口的行，最大的n个优先取后进入窗口的行
+    window
+    n
+
+    Notes
+    -----
+    1. by为nan的行不参与排序。窗口内有效的by不足n个时输出nan
+    2. 选中的行中x有nan时，对应的和为nan
+    3. 窗口不满window行时输出nan
+
+    """
+    size = orders.shape[1]
+    block = size - window + 1
+    out1 = np.full(orders.shape[0] * block, np.nan, dtype=x1.dtype)
+    out2 = np.full(orders.shape[0] * block, np.nan, dtype=x1.dtype)
+
+    # 个数、x之和、x为nan的个数
+    count = np.zeros(size + 1, dtype=np.int64)
+    total = np.zeros(size + 1, dtype=np.float64)
+    nans = np.zeros(size + 1, dtype=np.int64)
+    pos = np.empty(size, dtype=np.int64)
+    step = 1
+    while step * 2 <= size:
+        step *= 2
+
+    for b in range(orders.shape[0]):
+        s1 = x1[b * block:b * block + size]
+        s2 = x2[b * block:b * block + size]
+        order = orders[b]
+        for t in range(size):
+            pos[order[t]] = t
+
+        count[:] = 0
+        total[:] = 0
+        nans[:] = 0
+        cnt = 0
+        for t in range(size):
+            for u, sign in ((t, 1), (t - window, -1)):
+                if u < 0 or np.isnan(s2[u]):
+                    continue
+                _fenwick_add(count, pos[u], sign)
+                if np.isnan(s1[u]):
+                    _fenwick_add(nans, pos[u], sign)
+                else:
+                    _fenwick_add(total, pos[u], sign * s1[u])
+                cnt += sign
+            if t < window - 1:
+                continue
+            # 原序列中的位置，窗口需满window行
+            i = b * block + t - window + 1
+            if i < window - 1 or cnt < n or n <= 0:
+                continue
+
+            # 最小的n个
+            p = _fenwick_kth(count, n, step) + 1
+            if _fenwick_sum(nans, p) == 0:
+                out1[i] = _fenwick_sum(total, p)
+            # 最大的n个，用全部减去前cnt-n个
+            p = _fenwick_kth(count, cnt - n + 1, step)
+            if _fenwick_sum(nans, size) - _fenwick_sum(nans, p) == 0:
+                out2[i] = _fenwick_sum(total, size) - _fenwick_sum(total, p)
+    return out1, out2
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def cs_rank_zscore_qcut(xx, orders, how, q, ddof):
+    """截面上每行一次扫描，得到dense排名、排名百分比、zscore与等频分箱
+
+    xx为(k, n)，每行一个因子。orders为每行的排序，nan排在最后，只要zscore时可为(k, 0)。
+    how为需要的结果：0排名，1百分比，2zscore，3分箱。返回(len(how), k, n)，nan为缺失值
+    """
+    k, n = xx.shape
+    out = np.full((len(how), k, n), np.nan)
+    need_sort = orders.shape[1] > 0
+    d = 0
+    rank = np.empty(n)
+    bins = np.empty(n)
+    breaks = np.empty(q - 1)
+    for j in range(k):
+        x = xx[j]
+        m = 0
+        s = 0.0
+        for i in range(n):
+            if not np.isnan(x[i]):
+                m += 1
+                s += x[i]
+        if m == 0:
+            continue
+        if need_sort:
+            # 前m个为有效值
+            order = orders[j]
+            d = 0
+            rank[order[0]] = 0
+            for i in range(1, m):
+                if x[order[i]] != x[order[i - 1]]:
+                    d += 1
+                rank[order[i]] = d
+            # 与polars的qcut相同，分割点为线性插值的分位数，箱号为小于x的分割点个数
+            for b in range(1, q):
+                pos = b / q * (m - 1)
+                lo = int(np.floor(pos))
+                hi = int(np.ceil(pos))
+                breaks[b - 1] = x[order[lo]] + (x[order[hi]] - x[order[lo]]) * (pos - lo)
+            c = 0
+            for i in range(m):
+                while c < q - 1 and breaks[c] < x[order[i]]:
+                    c += 1
+                bins[order[i]] = c
+        mean = s / m
+        ss = 0.0
+        for i in range(n):
+            if not np.isnan(x[i]):
+                ss += (x[i] - mean) ** 2
+        std = np.sqrt(ss / (m - ddof)) if m > ddof else np.nan
+        for t in range(len(how)):
+            h = how[t]
+            o = out[t, j]
+            for i in range(n):
+                if np.isnan(x[i]):
+                    continue
+                if h == 0:
+                    o[i] = rank[i] + 1
+                elif h == 1:
+                    o[i] = rank[i] / max(d, 1)
+                elif h == 2:
+                    if std > 0:
+                        o[i] = (x[i] - mean) / std
+                else:
+                    o[i] = bins[i]
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _kth_distinct(v, k):
+    """v中第k小的不同值，不足k个时取最大值。先选出最小的m个再排序，不同值不足k个时m加倍"""
+    n = v.shape[0]
+    m = min(k, n)
+    while True:
+        part = np.sort(np.partition(v, m - 1)[:m])
+        d = 1
+        if d == k:
+            return part[0]
+        for i in range(1, m):
+            if part[i] != part[i - 1]:
+                d += 1
+                if d == k:
+                    return part[i]
+        if m == n:
+            return part[m - 1]
+        m = min(2 * m, n)
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def cs_top_bottom(x1, k, ties, weight):
+    """截面上选出最大与最小的k个，不做全排序，期望O(n)
+
+    ties: 0按不同值计数，1并列的都选上，2并列时按出现顺序只选够k个。
+    最大的标记为1，最小的标记为-1，同时入选的为0。weight=True时改为多空各自等权，多头和为1，空头和为-1
+    """
+    n = x1.shape[0]
+    out = np.full(n, np.nan, dtype=np.float64)
+    v = np.empty(n, dtype=np.float64)
+    m = 0
+    for i in range(n):
+        if not np.isnan(x1[i]):
+            v[m] = x1[i]
+            m += 1
+    if m == 0:
+        return out
+    v = v[:m]
+    kk = min(k, m)
+    if kk <= 0:
+        lo = -np.inf
+        hi = np.inf
+    elif ties == 0:
+        lo = _kth_distinct(v, kk)
+        hi = -_kth_distinct(-v, kk)
+    else:
+        lo = np.partition(v, kk - 1)[kk - 1]
+        hi = -np.partition(-v, kk - 1)[kk - 1]
+
+    # 并列时还能选几个
+    n_lo = kk
+    n_hi = kk
+    if ties == 2:
+        for i in range(m):
+            if v[i] < lo:
+                n_lo -= 1
+            if v[i] > hi:
+                n_hi -= 1
+
+    bottom = np.zeros(n, dtype=np.bool_)
+    top = np.zeros(n, dtype=np.bool_)
+    c_lo = 0
+    c_hi = 0
+    for i in range(n):
+        x = x1[i]
+        if np.isnan(x):
+            continue
+        if x < lo or (x == lo and (ties != 2 or n_lo > 0)):
+            bottom[i] = True
+            c_lo += 1
+            if x == lo:
+                n_lo -= 1
+        if x > hi or (x == hi and (ties != 2 or n_hi > 0)):
+            top[i] = True
+            c_hi += 1
+            if x == hi:
+                n_hi -= 1
+
+    a = 1.0 / c_hi if weight and c_hi > 0 else 1.0
+    b = 1.0 / c_lo if weight and c_lo > 0 else 1.0
+    for i in range(n):
+        if not np.isnan(x1[i]):
+            out[i] = a * top[i] - b * bottom[i]
+    return out
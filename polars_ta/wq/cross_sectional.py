@@ -4,16 +4,27 @@
 由于截面与时序的使用方式不同，在自动化工具中如果不在名字上做区分就得手工注册，反而要麻烦些
 
 """
-import polars_ols as pls
-from polars import Expr, when, max_horizontal, UInt16, Int8, Utf8
-from polars_ols import OLSKwargs
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+from polars import Expr, Series, when, max_horizontal, UInt16, UInt32, Int8, Float64, Utf8, struct, Struct, Field
+
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, expr_names, float_dtype, numpy_to_struct, series_to_numpy, struct_with_partition, struct_to_offsets
+
+# 首次使用时才导入
+pls = lazy_import('polars_ols')
+_nb = lazy_import('polars_ta.wq._nb')
 
 # In the original version, the function names are not prefixed with `cs_`,
 # here we add it to prevent confusion
 # 原版函数名都没有加`cs_`, 这里统一加一防止混淆
 
 
-_ols_kwargs = OLSKwargs(null_policy='drop', solve_method='svd')
+@lru_cache
+def _ols_kwargs():
+    return pls.OLSKwargs(null_policy='drop', solve_method='svd')
 
 
 def cs_one_side(x: Expr, is_long: bool = True) -> Expr:
@@ -230,12 +241,12 @@ def cs_fill_null(x: Expr, value: float = 0) -> Expr:
 
 def cs_regression_neut(y: Expr, x: Expr) -> Expr:
     """横截面上，一元回归残差"""
-    return pls.compute_least_squares(y, x, add_intercept=True, mode='residuals', ols_kwargs=_ols_kwargs)
+    return pls.compute_least_squares(y, x, add_intercept=True, mode='residuals', ols_kwargs=_ols_kwargs())
 
 
 def cs_regression_proj(y: Expr, x: Expr) -> Expr:
     """横截面上，一元回归预测"""
-    return pls.compute_least_squares(y, x, add_intercept=True, mode='predictions', ols_kwargs=_ols_kwargs)
+    return pls.compute_least_squares(y, x, add_intercept=True, mode='predictions', ols_kwargs=_ols_kwargs())
 
 
 def cs_rank(x: Expr, pct: bool = True) -> Expr:
@@ -436,6 +447,8 @@ def cs_qcut(x: Expr, q: int = 10) -> Expr:
 def cs_top_bottom(x: Expr, k: int = 10) -> Expr:
     """横截面上，排名。前K标记成-1，后K标记成1
 
+    k远小于资产数时，可用不做全排序的`cs_top_bottom_k`
+
     Examples
     --------
     ```python
@@ -469,3 +482,125 @@ def cs_top_bottom(x: Expr, k: int = 10) -> Expr:
     a = x.rank(method='dense')
     b = a.max() - a
     return (b < k).cast(Int8) - (a <= k).cast(Int8)
+
+
+# 并列值的处理方式
+_TIES = {'dense': 0, 'min': 1, 'ordinal': 2}
+
+
+def cs_top_bottom_k(x: Expr, k: int = 10, ties: str = 'dense', weight: bool = False, partition_by: Optional[Expr] = None) -> Expr:
+    """横截面上，选出最大与最小的k个，最大的标记成1，最小的标记成-1
+
+    用部分选择(partition)代替全排序，期望O(n)。k远小于资产数时比`cs_top_bottom`快
+
+    Parameters
+    ----------
+    x
+    k
+    ties
+        并列值的处理方式
+
+        * 'dense': 按不同值计数，取最大与最小的k个不同值，与`cs_top_bottom`相同
+        * 'min': 排名`rank(method='min')`不超过k的都选上，并列时可能多于k个
+        * 'ordinal': 正好k个，并列时取先出现的
+    weight
+        * False: 标记，Int8
+        * True: 多空各自等权的权重，多头和为1，空头和为-1
+    partition_by
+        分组列，一般为日期。数据需按日期排序，所有日期一次计算，不必再套用over或group_by
+
+    Examples
+    --------
+    ```python
+    df = df.sort('date', 'asset').with_columns(
+        cs_top_bottom_k(pl.col('alpha'), 50, ties='ordinal', weight=True, partition_by=pl.col('date')).alias('weight')
+    )
+    ```
+
+    Notes
+    -----
+    同一资产同时入选多头与空头时(资产数不足2k)，标记为0，权重为两边之和
+
+    """
+    dtype = float_dtype() if weight else Int8
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, Float64), _nb.cs_top_bottom, k, _TIES[ties], weight, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], Float64), _nb.cs_top_bottom, k, _TIES[ties], weight, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
+
+
+def cs_transform_multi(xs: Sequence[Expr], how: Sequence[str] = ('pct', 'zscore', 'qcut'), q: int = 10, ddof: int = 0) -> Expr:
+    """横截面上，多个因子一起排名、标准化、分箱。每个截面只切分一次，每列只排序一次
+
+    代替对每个因子逐个调用`cs_rank`、`cs_zscore`、`cs_qcut`。需配合`over`或`group_by`按日期使用
+
+    Parameters
+    ----------
+    xs
+        多个因子
+    how
+        需要的结果，可多选
+
+        * 'rank': dense排名，同`cs_rank(x, False)`。范围：[1,+inf)
+        * 'pct': 排名百分比，同`cs_rank(x, True)`。范围：[0,1]
+        * 'zscore': 同`cs_zscore(x, ddof)`
+        * 'qcut': 等频分箱，同`cs_qcut(x, q)`
+    q
+        按频率分成`q`份
+    ddof
+        zscore的标准差自由度
+
+    Returns
+    -------
+    Expr
+        Struct。按`how`的顺序，每种结果依次给出所有因子，共`len(how)*len(xs)`个字段，
+        字段名为`因子列名_how`，如`f1_pct`，列名无法确定或重名时因子名为`column_0`、`column_1`...。
+        'rank'为UInt32，'qcut'为UInt16。
+        x为null或nan的行结果为null，截面上标准差为0时zscore为null
+
+    Examples
+    --------
+    ```python
+    # 得到f1_pct、f2_pct、f3_pct、f1_zscore、f2_zscore、f3_zscore六列
+    factors = ['f1', 'f2', 'f3']
+    df = df.with_columns(
+        cs_transform_multi([pl.col(f) for f in factors], how=('pct', 'zscore'))
+        .over('date').alias('cs')
+    ).unnest('cs')
+    ```
+
+    """
+    k = len(xs)
+    ftype = float_dtype()
+    types = {'rank': UInt32, 'pct': ftype, 'zscore': ftype, 'qcut': UInt16}
+    names = [(f"{name}_{h}", h) for h in how for name in expr_names(xs)]
+    dtype = Struct([Field(name, types[h]) for name, h in names])
+    codes = np.array([list(types).index(h) for h in how])
+    need_sort = any(h != 'zscore' for h in how)
+
+    def func(xx):
+        if len(xx) == 0:
+            # 空表或空分组，与cs_rank等一致返回空列
+            return Series(dtype=dtype)
+        # 一次转成二维数组，null转成nan。转置后每行一个因子
+        arr = np.ascontiguousarray(xx.struct.unnest().to_numpy().astype(np.float64, copy=False).T)
+        # numba的argsort比numpy慢数倍，在kernel外排序
+        orders = np.argsort(arr, axis=1) if need_sort else np.empty((arr.shape[0], 0), dtype=np.int64)
+        out = _nb.cs_rank_zscore_qcut(arr, orders, codes, q, ddof)
+        return numpy_to_struct([o for o in out.reshape(-1, arr.shape[1])], [name for name, _ in names], ftype).cast(dtype)
+
+    return struct(**{f"f{i}": x for i, x in enumerate(xs)}).map_batches(func, return_dtype=dtype)
+
+
+def cs_rank_multi(xs: Sequence[Expr], pct: bool = True) -> Expr:
+    """横截面上，多个因子一起排名。见`cs_transform_multi`"""
+    return cs_transform_multi(xs, ('pct',) if pct else ('rank',))
+
+
+def cs_zscore_multi(xs: Sequence[Expr], ddof: int = 0) -> Expr:
+    """横截面上，多个因子一起zscore标准化。见`cs_transform_multi`"""
+    return cs_transform_multi(xs, ('zscore',), ddof=ddof)
+
+
+def cs_qcut_multi(xs: Sequence[Expr], q: int = 10) -> Expr:
+    """横截面上，多个因子一起等频分箱。见`cs_transform_multi`"""
+    return cs_transform_multi(xs, ('qcut',), q=q)
@@ -1,26 +1,125 @@
-import numpy as np
-from polars import Expr
+from typing import Optional
 
-from polars_ta.utils.numba_ import get_exponent_weights
+from polars import Expr, Struct, Field
 
+import polars_ta
+from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o2, float_dtype, series_to_numpy, struct_to_numpy, struct_with_partition, struct_to_offsets
+from polars_ta.wq.time_series import _roll_exp_moment, _roll_exp_moments, _roll_ols, _ols_names
 
-def ts_mean_hl(x: Expr, d: int, half_life: int):
+
+def _hl(x: Expr, d: int, half_life: int, min_samples: Optional[int], partition_by: Optional[Expr], row: int) -> Expr:
+    """半衰期转成衰减系数，取kernel的第row个输出"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    factor = 0.5 ** (1 / half_life)
+    dtype = float_dtype()
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _roll_exp_moment, d, minp, factor, row, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _roll_exp_moment, d, minp, factor, row, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
+
+
+def ts_mean_hl(x: Expr, d: int, half_life: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """滚动均值。带半衰期"""
-    return x.fill_null(np.nan).rolling_mean(d, weights=get_exponent_weights(d, half_life)).fill_nan(None)
+    return _hl(x, d, half_life, min_samples, partition_by, 0)
 
 
-def ts_sum_hl(x: Expr, d: int, half_life: int):
+def ts_sum_hl(x: Expr, d: int, half_life: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """滚动求和。带半衰期"""
-    return x.fill_null(np.nan).rolling_sum(d, weights=get_exponent_weights(d, half_life)).fill_nan(None)
+    return _hl(x, d, half_life, min_samples, partition_by, 1)
+
 
+def ts_var_hl(x: Expr, d: int, half_life: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """滚动方差。带半衰期。总体方差，与polars带权重的rolling_var一致"""
+    return _hl(x, d, half_life, min_samples, partition_by, 2)
 
-def ts_std_hl(x: Expr, d: int, half_life: int):
+
+def ts_std_hl(x: Expr, d: int, half_life: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """滚动标准差。带半衰期"""
-    return x.fill_null(np.nan).rolling_std(d, weights=get_exponent_weights(d, half_life)).fill_nan(None)
+    return _hl(x, d, half_life, min_samples, partition_by, 3)
+
+
+def ts_moments_hl(x: Expr, d: int, half_life: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """带半衰期的滚动均值、和、方差、标准差，一次扫描得到
+
+    最新值权重为1，每往前half_life天权重减半，超过d天的值不参与。null跳过，权重按窗口内的有效值归一化
+
+    Parameters
+    ----------
+    x
+    d
+    half_life
+        半衰期
+    min_samples
+        窗口内有效值的最少数量。为None时要求满窗口，窗口中有null时结果为null
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
+
+    Returns
+    -------
+    Expr
+        Struct。字段`mean`、`sum`、`var`、`std`依次为均值、和、方差、标准差
+
+    Examples
+    --------
+    ```python
+    # 得到a_mean、a_sum、a_var、a_std四列
+    df = df.with_columns(
+        ts_moments_hl(pl.col('a'), 20, 5).struct.unnest().name.prefix('a_')
+    )
+    ```
+
+    """
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    factor = 0.5 ** (1 / half_life)
+    ftype = float_dtype()
+    names = ['mean', 'sum', 'var', 'std']
+    dtype = Struct([Field(name, ftype) for name in names])
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, ftype), _roll_exp_moments, d, minp, factor, dtype=ftype, names=names), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], ftype), _roll_exp_moments, d, minp, factor, dtype=ftype, offsets=struct_to_offsets(xx, 1), names=names), return_dtype=dtype)
+
+
+def ts_regression_hl(y: Expr, *more_x: Expr, d: int = 252, half_life: int = 63, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """带半衰期的时序滚动回归，带截距。斜率、截距、残差、预测值、R²一次得到
+
+    权重与`ts_mean_hl`相同，其它与`ts_regression`相同
+
+    Parameters
+    ----------
+    y
+    *more_x
+        多个x
+    d
+    half_life
+        半衰期
+    min_samples
+        窗口内有效行的最少数量。为None时要求满窗口
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
+    Returns
+    -------
+    Expr
+        Struct。字段与`ts_regression`相同，依次为斜率`slope`(多个x时为`slope_0`、`slope_1`...)、`intercept`、
+        `resid`、`pred`、加权R²`r2`，以及各斜率与截距的t值`t_slope`...`t_intercept`。
+        窗口内x共线时都为null，当前行y或x为null时残差与预测值为null
 
-def ts_var_hl(x: Expr, d: int, half_life: int):
-    """滚动方差。带半衰期"""
-    return x.fill_null(np.nan).rolling_var(d, weights=get_exponent_weights(d, half_life)).fill_nan(None)
+    Examples
+    --------
+    ```python
+    # Barra的BETA(slope)与残差(resid)。个股收益对指数收益，窗口252天，半衰期63天
+    df = df.with_columns(
+        ts_regression_hl(pl.col('ret'), pl.col('index_ret'), d=252, half_life=63, partition_by=pl.col('asset')).alias('reg')
+    ).unnest('reg')
+    ```
 
-# TODO 混动时序回归，带半衰期
+    """
+    p = len(more_x)
+    if p == 0:
+        raise ValueError('ts_regression_hl requires at least one x')
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    factor = 0.5 ** (1 / half_life)
+    ftype = float_dtype()
+    names = _ols_names(p)
+    dtype = Struct([Field(name, ftype) for name in names])
+    named = {f"f{i}": x for i, x in enumerate((y, *more_x))}
+    return struct_with_partition(partition_by, **named).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, p + 1, ftype), _roll_ols, d, minp, factor, True, dtype=ftype, offsets=struct_to_offsets(xx, p + 1), names=names), return_dtype=dtype)
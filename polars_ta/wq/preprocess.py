@@ -9,10 +9,21 @@ MC_NORM = cs_zscore(MC_LOG)
 # 对数市值。行业中性化。直接作为因子使用
 MC_NEUT = cs_zscore(cs_resid(MC_NORM, CS_SW_L1, ONE))
 
+# 大量因子一起预处理，每个截面只切分一次。见cs_preprocess_multi
+cs_preprocess_multi([F1, F2, F3], MC_NORM, group=SW_L1, steps=['mad', 'zscore', 'resid', 'zscore'])
+
 """
-import polars_ols as pls
-from polars import Expr, when
-from polars_ols.least_squares import OLSKwargs
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+from polars import Expr, when, struct, Struct, Field, Int64
+
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import expr_names, float_dtype, numpy_to_struct
+
+# 首次使用时才导入
+pls = lazy_import('polars_ols')
 
 
 # ======================
@@ -88,12 +99,14 @@ def cs_demean(x: Expr) -> Expr:
 
 # ======================
 # neutralize
-_ols_kwargs = OLSKwargs(null_policy='drop', solve_method='svd')
+@lru_cache
+def _ols_kwargs():
+    return pls.OLSKwargs(null_policy='drop', solve_method='svd')
 
 
 def cs_resid(y: Expr, *more_x: Expr) -> Expr:
-    """横截面多元回归取残差"""
-    return pls.compute_least_squares(y, *more_x, mode='residuals', ols_kwargs=_ols_kwargs)
+    """横截面多元回归取残差。多个y对同一组x时用`cs_resid_multi`，x只分解一次"""
+    return pls.compute_least_squares(y, *more_x, mode='residuals', ols_kwargs=_ols_kwargs())
 
 
 def cs_zscore_resid(y: Expr, *more_x: Expr) -> Expr:
@@ -117,7 +130,7 @@ def cs_mad_zscore_resid(y: Expr, *more_x: Expr) -> Expr:
 
 
 def cs_mad_zscore_resid_zscore(y: Expr, *more_x: Expr) -> Expr:
-    """横截面去MAD极值、标准化、中性化、二次标准化"""
+    """横截面去MAD极值、标准化、中性化、二次标准化。多个因子用`cs_preprocess_multi`一次处理"""
     return cs_zscore(cs_resid(cs_zscore(cs_mad(y)), *more_x))
 
 
@@ -132,4 +145,315 @@ def cs_resid_w(w: Expr, y: Expr, *more_x: Expr) -> Expr:
 
     Barra中权重采用流通市值的平方根
     """
-    return pls.compute_least_squares(y, *more_x, sample_weights=w, mode='residuals', ols_kwargs=_ols_kwargs)
+    return pls.compute_least_squares(y, *more_x, sample_weights=w, mode='residuals', ols_kwargs=_ols_kwargs())
+
+
+def _group_demean(a: np.ndarray, codes: np.ndarray, w: Optional[np.ndarray]) -> np.ndarray:
+    """每列按组减去(加权)均值。所有列的组内求和合并成一次bincount，计算量与组数无关"""
+    g = codes.max() + 1
+    # 按列展开，第j列第i行的组号为codes[i] + g*j
+    index = (codes[None, :] + g * np.arange(a.shape[1])[:, None]).ravel()
+    at = a.T
+    if w is None:
+        sums = np.bincount(index, at.ravel(), minlength=g * a.shape[1]).reshape(-1, g)
+        counts = np.bincount(codes, minlength=g)
+    else:
+        sums = np.bincount(index, (at * w).ravel(), minlength=g * a.shape[1]).reshape(-1, g)
+        counts = np.bincount(codes, w, minlength=g)
+    means = sums / np.where(counts > 0, counts, 1)
+    return (at - means[:, codes]).T
+
+
+def _resid_multi(yy: np.ndarray, xx: np.ndarray, w: Optional[np.ndarray], codes: Optional[np.ndarray] = None) -> np.ndarray:
+    """多个y对同一组x回归取残差
+
+    x或w为nan的行都不参与。y的有效行相同的列分为一组，每组x只做一次SVD，所有列一起求解。
+    行业哑变量加常数项时x不满秩，SVD取最小范数解，残差仍是到x列空间的投影残差。
+
+    指定codes时相当于x中还有每组一列的哑变量。按Frisch-Waugh-Lovell定理，先在组内减去y与x的(加权)均值，
+    再对剩下的x回归，残差与哑变量回归相同，不必展开哑变量
+
+    Parameters
+    ----------
+    yy
+        n行k列
+    xx
+        n行p列
+    w
+        权重。None时不加权
+    codes
+        分组编号，小于0表示缺失。None时不分组
+
+    Returns
+    -------
+    np.ndarray
+        k行n列，每行为一个y的残差
+    """
+    out = np.full((yy.shape[1], yy.shape[0]), np.nan, dtype=np.float64)
+    rows = ~np.isnan(xx).any(axis=1)
+    if w is not None:
+        rows &= ~np.isnan(w)
+    if codes is not None:
+        rows &= codes >= 0
+    masks = ~np.isnan(yy) & rows[:, None]
+    if masks.shape[1] == 0:
+        return out
+    # 通常所有y的有效行相同，只需一组
+    if (masks == masks[:, :1]).all():
+        patterns, inverse = masks[:, :1], np.zeros(masks.shape[1], dtype=np.int64)
+    else:
+        patterns, inverse = np.unique(masks, axis=1, return_inverse=True)
+    for j in range(patterns.shape[1]):
+        mask = patterns[:, j]
+        if not mask.any():
+            continue
+        cols = np.flatnonzero(inverse.ravel() == j)
+        # 全部有效时不用花式索引，省去复制
+        full = patterns.shape[1] == 1 and mask.all()
+        x = xx if full else xx[mask]
+        y = yy if full else yy[np.ix_(mask, cols)]
+        if codes is not None:
+            x = _group_demean(x, codes[mask], None if w is None else w[mask])
+            y = _group_demean(y, codes[mask], None if w is None else w[mask])
+        if w is None:
+            xs, ys = x, y
+        else:
+            s = np.sqrt(w[mask])[:, None]
+            xs, ys = x * s, y * s
+        # 与lstsq相同的截断，丢弃过小的奇异值。直接对多列右端调用lstsq会对每列重复Householder变换，慢得多
+        u, sv, vt = np.linalg.svd(xs, full_matrices=False)
+        r = sv > sv[0] * max(xs.shape) * np.finfo(np.float64).eps if sv.size > 0 else sv > 0
+        beta = vt[r].T @ ((u[:, r].T @ ys) / sv[r, None])
+        if full:
+            out[:] = (y - x @ beta).T
+        else:
+            out[np.ix_(cols, np.flatnonzero(mask))] = (y - x @ beta).T
+    return out
+
+
+def _struct_to_array(xx):
+    """struct一次转成二维数组，null转成nan。有'group'字段时另外转成从0开始的编号，null为-1"""
+    df = xx.struct.unnest()
+    codes = None
+    if 'group' in df.columns:
+        codes = df.get_column('group').rank('dense').fill_null(0).cast(Int64).to_numpy() - 1
+        df = df.drop('group')
+    return df.to_numpy().astype(np.float64, copy=False), codes
+
+
+def cs_resid_multi(ys: Sequence[Expr], *more_x: Expr, w: Optional[Expr] = None, group: Optional[Expr] = None, add_intercept: bool = False) -> Expr:
+    """横截面上，多个y对同一组x回归取残差。同一组x只分解一次，所有y一起求解
+
+    大量因子对同样的行业哑变量与市值中性化时，代替逐个调用`cs_resid`。需配合`over`或`group_by`按日期使用
+
+    Parameters
+    ----------
+    ys
+        多个y
+    *more_x
+        多个x
+    w
+        权重。None时不加权，与`cs_resid`一致；指定时与`cs_resid_w`一致。Barra中采用流通市值的平方根
+    group
+        分类列，如行业。等价于对每个类别的哑变量回归，但不展开哑变量，先在组内去均值再回归其它x。
+        内存与计算量都与类别数无关。指定时常数项已被组均值吸收，不必再加
+    add_intercept
+        是否添加常数项。为False时可自行传入常数列
+
+    Returns
+    -------
+    Expr
+        Struct。每个y一个字段，字段名为y的列名，无法确定或重名时为`column_0`、`column_1`...。
+        x、w或group为null的行，以及y为null的行，残差为null
+
+    Examples
+    --------
+    ```python
+    df = with_industry(df, 'sw_l1', drop_first=False, keep_col=True)
+    industry = [pl.col(c) for c in df.columns if c.startswith('sw_l1_')]
+    factors = ['f1', 'f2', 'f3']
+
+    df = df.with_columns(
+        cs_resid_multi([cs_zscore(pl.col(f)) for f in factors], pl.col('MC_NORM'), *industry)
+        .over('date').alias('resid')
+    ).unnest('resid')
+
+    # 不展开哑变量，结果相同
+    df = df.with_columns(
+        cs_resid_multi([cs_zscore(pl.col(f)) for f in factors], pl.col('MC_NORM'), group=pl.col('sw_l1'))
+        .over('date').alias('resid')
+    ).unnest('resid')
+    ```
+
+    """
+    k = len(ys)
+    p = len(more_x)
+    exprs = [*ys, *more_x] if w is None else [*ys, *more_x, w]
+    named = {f"f{i}": e for i, e in enumerate(exprs)}
+    if group is not None:
+        named['group'] = group
+    ftype = float_dtype()
+    names = expr_names(ys)
+    dtype = Struct([Field(name, ftype) for name in names])
+
+    def func(xx):
+        arr, codes = _struct_to_array(xx)
+        x = arr[:, k:k + p]
+        if add_intercept and group is None:
+            x = np.column_stack([x, np.ones(len(xx))])
+        out = _resid_multi(arr[:, :k], x, arr[:, k + p] if w is not None else None, codes)
+        return numpy_to_struct(list(out), names, ftype)
+
+    return struct(**named).map_batches(func, return_dtype=dtype)
+
+
+def cs_resid_group(y: Expr, group: Expr, *more_x: Expr, w: Optional[Expr] = None) -> Expr:
+    """横截面上，对分类列(如行业)与其它x回归取残差，不展开哑变量
+
+    与`cs_resid(y, *dummies, *more_x)`结果相同，dummies为group的全部哑变量。先在组内去均值，再对more_x回归
+
+    Parameters
+    ----------
+    y
+    group
+        分类列
+    *more_x
+        其它连续暴露，如市值
+    w
+        权重。None时不加权
+
+    """
+    return cs_resid_multi([y], *more_x, w=w, group=group).struct[0]
+
+
+def _nanquantile(a: np.ndarray, qs: Sequence[float], interpolation: str) -> np.ndarray:
+    """每列的分位数，nan不参与。有效值个数相同的列一起partition，不做全排序
+
+    interpolation与polars一致，'nearest'取第floor(q*(m-1)+0.5)个，'midpoint'取两侧的平均。返回len(qs)行k列
+    """
+    m = (~np.isnan(a)).sum(axis=0)
+    out = np.full((len(qs), a.shape[1]), np.nan)
+    for c in np.unique(m):
+        if c == 0:
+            continue
+        pos = np.asarray(qs) * (c - 1)
+        if interpolation == 'nearest':
+            lo = hi = np.floor(pos + 0.5).astype(np.int64)
+        else:
+            lo, hi = np.floor(pos).astype(np.int64), np.ceil(pos).astype(np.int64)
+        # nan排在最后，前c个为有效值
+        cols = slice(None) if c == m[0] and (m == c).all() else np.flatnonzero(m == c)
+        # numpy一次传入多个kth时很慢。从大到小逐个partition，较小的kth只在前一次的左侧部分中找
+        part = a[:, cols]
+        values = {}
+        for kth in sorted(set(lo.tolist()) | set(hi.tolist()), reverse=True):
+            part = np.partition(part, kth, axis=0)
+            values[kth] = part[kth]
+            part = part[:kth]
+        out[:, cols] = [(values[i] + values[j]) / 2 for i, j in zip(lo, hi)]
+    return out
+
+
+def _mean_std(a: np.ndarray):
+    """每列的均值与总体标准差，nan不参与"""
+    valid = ~np.isnan(a)
+    cnt = valid.sum(axis=0)
+    mean = np.where(valid, a, 0).sum(axis=0) / cnt
+    d = np.where(valid, a - mean, 0)
+    return mean, np.sqrt((d * d).sum(axis=0) / cnt)
+
+
+def cs_preprocess_multi(ys: Sequence[Expr], *more_x: Expr, steps: Sequence[str] = ('mad', 'zscore', 'resid', 'zscore'),
+                        w: Optional[Expr] = None, group: Optional[Expr] = None, add_intercept: bool = False,
+                        n: float = 3., k: float = 1.4826, low_limit: float = 0.025, up_limit: float = 0.975) -> Expr:
+    """横截面上，多个因子一起去极值、标准化、中性化。每个截面只切分一次，转成二维数组后按steps依次处理
+
+    代替逐个因子调用`cs_mad_zscore_resid_zscore`等组合。中位数、分位数用部分选择得到，不做全排序，
+    中性化与`cs_resid_multi`相同，x只分解一次。需配合`over`或`group_by`按日期使用
+
+    Parameters
+    ----------
+    ys
+        多个因子
+    *more_x
+        中性化用的多个x
+    steps
+        处理步骤，按顺序执行，可重复
+
+        * 'mad': 同`cs_mad(y, n, k)`
+        * '3sigma': 同`cs_3sigma(y, n)`
+        * 'quantile': 同`cs_quantile(y, low_limit, up_limit)`
+        * 'zscore': 同`cs_zscore(y)`
+        * 'resid': 同`cs_resid_multi(ys, *more_x, w=w, group=group, add_intercept=add_intercept)`
+    w
+        中性化的权重
+    group
+        中性化的分类列，如行业
+    add_intercept
+        中性化时是否添加常数项
+    n
+        去极值的倍数
+    k
+        MAD的系数
+    low_limit
+        分位数去极值的下限
+    up_limit
+        分位数去极值的上限
+
+    Returns
+    -------
+    Expr
+        Struct。每个因子一个字段，字段名为因子的列名，无法确定或重名时为`column_0`、`column_1`...。
+        截面上标准差为0时zscore为null
+
+    Examples
+    --------
+    ```python
+    factors = ['f1', 'f2', 'f3']
+    df = df.with_columns(
+        cs_preprocess_multi([pl.col(f) for f in factors], pl.col('MC_NORM'), group=pl.col('sw_l1'),
+                            steps=['mad', 'zscore', 'resid', 'zscore'])
+        .over('date').alias('pre')
+    ).unnest('pre')
+    ```
+
+    """
+    unknown = set(steps) - {'mad', '3sigma', 'quantile', 'zscore', 'resid'}
+    if unknown:
+        raise ValueError(f"unknown steps: {unknown}")
+    n_y = len(ys)
+    p = len(more_x)
+    exprs = [*ys, *more_x] if w is None else [*ys, *more_x, w]
+    named = {f"f{i}": e for i, e in enumerate(exprs)}
+    if group is not None and 'resid' in steps:
+        named['group'] = group
+    ftype = float_dtype()
+    names = expr_names(ys)
+    dtype = Struct([Field(name, ftype) for name in names])
+
+    def func(xx):
+        arr, codes = _struct_to_array(xx)
+        a = arr[:, :n_y]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for step in steps:
+                if step == 'mad':
+                    med = _nanquantile(a, [0.5], 'midpoint')[0]
+                    b = (n * k) * _nanquantile(np.abs(a - med), [0.5], 'midpoint')[0]
+                    a = np.clip(a, med - b, med + b)
+                elif step == '3sigma':
+                    mean, std = _mean_std(a)
+                    a = np.clip(a, mean - n * std, mean + n * std)
+                elif step == 'quantile':
+                    lo, hi = _nanquantile(a, [low_limit, up_limit], 'nearest')
+                    a = np.clip(a, lo, hi)
+                elif step == 'zscore':
+                    mean, std = _mean_std(a)
+                    a = (a - mean) / std
+                else:
+                    x = arr[:, n_y:n_y + p]
+                    if add_intercept and codes is None:
+                        x = np.column_stack([x, np.ones(len(xx))])
+                    a = _resid_multi(a, x, arr[:, n_y + p] if w is not None else None, codes).T
+        return numpy_to_struct(list(a.T), names, ftype)
+
+    return struct(**named).map_batches(func, return_dtype=dtype)
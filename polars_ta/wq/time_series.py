@@ -1,20 +1,99 @@
 import itertools
-from typing import Optional
+from typing import Optional, Sequence
 
-import more_itertools
 import numpy as np
-import polars_ols as pls
-from polars import Expr, UInt16, struct, when, Struct, Field, Float64, Boolean, UInt32, all_horizontal, any_horizontal
+from numpy.lib.stride_tricks import sliding_window_view
+from polars import Expr, UInt16, when, Struct, Field, Float64, Boolean, UInt32, all_horizontal, any_horizontal
 from polars import rolling_corr, rolling_cov
-from polars_ols import RollingKwargs
 
 import polars_ta
-from polars_ta.utils.numba_ import batches_i1_o1, batches_i2_o1, batches_i2_o2, struct_to_numpy
-from polars_ta.wq._nb import roll_argmax, roll_argmin, roll_co_kurtosis, roll_co_skewness, roll_moment, roll_partial_corr, roll_triple_corr, _cum_prod_by, _cum_sum_by, _signals_to_size, \
-    _cum_sum_reset, _sum_split_by, roll_prod
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1, batches_i2_o2, float_dtype, series_to_numpy, struct_to_numpy, struct_with_partition, struct_to_offsets
 
+# 首次使用时才导入
+_nb = lazy_import('polars_ta.wq._nb')
+more_itertools = lazy_import('more_itertools')
 
-def ts_arg_max(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None) -> Expr:
+# 分位数插值方法，与polars的interpolation一致
+_INTERPOLATION = {'nearest': 0, 'lower': 1, 'higher': 2, 'midpoint': 3, 'linear': 4}
+
+
+def _sorted_blocks(window: int, by: np.ndarray, *xx: np.ndarray):
+    """分块排序，供树状数组实现的滚动kernel使用
+
+    输入前面补window-1个nan，后面用nan补齐整块。每块连同前面window-1个值按by稳定排序，nan排在最后。
+    numba的argsort比numpy慢数倍，所以在kernel外用numpy按行排序
+
+    Returns
+    -------
+    orders
+        每块的排序，二维数组
+    by, *xx
+        补齐后的输入
+    """
+    n = by.shape[0]
+    # 块太小时排序次数多，块太大时树变大
+    block = max(window, 512)
+    count = max(-(-n // block), 1)
+    padded = [np.concatenate([np.full(window - 1, np.nan, dtype=x.dtype), x, np.full(count * block - n, np.nan, dtype=x.dtype)]) for x in (by, *xx)]
+    orders = np.argsort(sliding_window_view(padded[0], block + window - 1)[::block], axis=1, kind='stable')
+    return orders, *padded
+
+
+def _roll_rank_quantiles(x1, window, min_periods, qs, interpolation, rank):
+    """排名与分位数共用一个kernel。kernel输出二维数组，按行拆成多个输出，不复制"""
+    n = x1.shape[0]
+    orders, x1 = _sorted_blocks(window, x1)
+    out = _nb.roll_rank_quantile(x1, orders, window, min_periods, np.asarray(qs, dtype=np.float64), _INTERPOLATION[interpolation], rank)
+    return tuple(out[:, :n])
+
+
+def _roll_rank_quantile(x1, window, min_periods, qs, interpolation, rank):
+    """只有一个输出时使用"""
+    return _roll_rank_quantiles(x1, window, min_periods, qs, interpolation, rank)[0]
+
+
+def _roll_decay_linears(x1, windows, min_periods):
+    """kernel输出二维数组，按行拆成多个输出，不复制"""
+    return tuple(_nb.roll_decay_linear(x1, np.asarray(windows, dtype=np.int64), np.asarray(min_periods, dtype=np.int64)))
+
+
+def _roll_decay_linear(x1, windows, min_periods):
+    """只有一个输出时使用"""
+    return _roll_decay_linears(x1, windows, min_periods)[0]
+
+
+def _roll_exp_moments(x1, window, min_periods, factor):
+    """截断指数加权的均值、和、方差、标准差。kernel输出二维数组，按行拆成多个输出，不复制"""
+    return tuple(_nb.roll_exp_moments(x1, window, min_periods, factor))
+
+
+def _roll_exp_moment(x1, window, min_periods, factor, row):
+    """只取其中一个输出。0均值、1和、2方差、3标准差"""
+    return _nb.roll_exp_moments(x1, window, min_periods, factor)[row]
+
+
+def _roll_ols(*args):
+    """y与多个x，最后四个参数为window、min_periods、factor、add_intercept。x拼成二维数组交给kernel，输出按行拆开，不复制"""
+    y, *xs, window, min_periods, factor, add_intercept = args
+    return tuple(_nb.roll_ols(y, np.vstack(xs), window, min_periods, factor, add_intercept))
+
+
+def _ols_names(p):
+    """回归结果的字段名。一个x时为slope，多个x时为slope_0、slope_1..."""
+    slopes = ['slope'] if p == 1 else [f"slope_{i}" for i in range(p)]
+    return [*slopes, 'intercept', 'resid', 'pred', 'r2', *[f"t_{name}" for name in slopes], 't_intercept']
+
+
+def _sum_split_by(x1, x2, window, n):
+    """by(x2)分块排序后交给kernel"""
+    size = x1.shape[0]
+    orders, x2, x1 = _sorted_blocks(window, x2, x1)
+    out1, out2 = _nb._sum_split_by(x1, x2, orders, window, n)
+    return out1[:size], out2[:size]
+
+
+def ts_arg_max(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """最大值相对位置
 
     最近的一天记为第 0 天，最远的一天为第 d-1 天
@@ -30,6 +109,8 @@ def ts_arg_max(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[
     reverse
         反向
     min_samples
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     See Also
     --------
@@ -67,10 +148,12 @@ def ts_arg_max(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[
 
     """
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_argmax, d, minp, reverse, dtype=UInt16), return_dtype=UInt16)
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), _nb.roll_argmax, d, minp, reverse, dtype=UInt16), return_dtype=UInt16)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(xx.struct[0].to_numpy(), _nb.roll_argmax, d, minp, reverse, dtype=UInt16, offsets=struct_to_offsets(xx, 1)), return_dtype=UInt16)
 
 
-def ts_arg_min(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None) -> Expr:
+def ts_arg_min(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """最小值相对位置
 
     最近的一天记为第 0 天，最远的一天为第 d-1 天
@@ -82,6 +165,8 @@ def ts_arg_min(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[
     reverse
         反向
     min_samples
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     See Also
     --------
@@ -119,19 +204,23 @@ def ts_arg_min(x: Expr, d: int = 5, reverse: bool = True, min_samples: Optional[
 
     """
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_argmin, d, minp, reverse, dtype=UInt16), return_dtype=UInt16)
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), _nb.roll_argmin, d, minp, reverse, dtype=UInt16), return_dtype=UInt16)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(xx.struct[0].to_numpy(), _nb.roll_argmin, d, minp, reverse, dtype=UInt16, offsets=struct_to_offsets(xx, 1)), return_dtype=UInt16)
 
 
-def ts_co_kurtosis(x: Expr, y: Expr, d: int = 5, ddof: int = 0, min_samples: Optional[int] = None) -> Expr:
+def ts_co_kurtosis(x: Expr, y: Expr, d: int = 5, ddof: int = 0, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """计算两个序列在滚动窗口内联合分布的协峰度"""
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return struct(f0=x, f1=y).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), roll_co_kurtosis, d, minp), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=x, f1=y).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=dtype), _nb.roll_co_kurtosis, d, minp, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def ts_co_skewness(x: Expr, y: Expr, d: int = 5, ddof: int = 0, min_samples: Optional[int] = None) -> Expr:
+def ts_co_skewness(x: Expr, y: Expr, d: int = 5, ddof: int = 0, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """计算两个序列在滚动窗口内联合分布的协偏度"""
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return struct(f0=x, f1=y).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), roll_co_skewness, d, minp), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=x, f1=y).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=dtype), _nb.roll_co_skewness, d, minp, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
 def ts_corr(x: Expr, y: Expr, d: int = 5, ddof: int = 1, min_samples: Optional[int] = None) -> Expr:
@@ -437,7 +526,7 @@ def ts_cum_sum(x: Expr) -> Expr:
     return x.cum_sum()
 
 
-def ts_cum_sum_reset(x: Expr) -> Expr:
+def ts_cum_sum_reset(x: Expr, partition_by: Optional[Expr] = None) -> Expr:
     """时序累加。遇到0、nan、相反符号时重置
 
     Examples
@@ -469,11 +558,16 @@ def ts_cum_sum_reset(x: Expr) -> Expr:
     ```
 
     """
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), _cum_sum_reset), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _nb._cum_sum_reset, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _nb._cum_sum_reset, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
+
 
+def ts_decay_exp_window(x: Expr, d: int = 30, factor: float = 1.0, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """指数衰减移动平均。递推计算，每步O(1)
 
-def ts_decay_exp_window(x: Expr, d: int = 30, factor: float = 1.0, min_samples: Optional[int] = None) -> Expr:
-    """指数衰减移动平均
+    null跳过，权重按窗口内的有效值归一化。`min_samples`为None时要求满窗口，窗口中有null时结果为null
 
     Examples
     --------
@@ -508,21 +602,26 @@ def ts_decay_exp_window(x: Expr, d: int = 30, factor: float = 1.0, min_samples:
     factor
         衰减系数
     min_samples
+        窗口内有效值的最少数量
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     References
     ----------
     https://platform.worldquantbrain.com/learn/operators/detailed-operator-descriptions#ts_decay_exp_windowx-d-factor-10-nan-true
 
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES
-    weights = np.repeat(factor, d) ** np.arange(d - 1, -1, -1)
-    # print(weights)
-    # pyo3_runtime.PanicException: weights not yet supported on array with null values
-    return x.fill_null(np.nan).rolling_mean(d, weights=weights, min_samples=minp).fill_nan(None)
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    dtype = float_dtype()
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _roll_exp_moment, d, minp, factor, 0, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _roll_exp_moment, d, minp, factor, 0, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ts_decay_linear(x: Expr, d: int = 30, min_samples: Optional[int] = None) -> Expr:
-    """线性衰减移动平均
+def ts_decay_linear(x: Expr, d: int = 30, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """线性衰减移动平均。递推计算，每步O(1)
+
+    窗口中有null时结果为null。需要多个窗口时用`ts_decay_linear_multi`
 
     Examples
     --------
@@ -557,12 +656,49 @@ def ts_decay_linear(x: Expr, d: int = 30, min_samples: Optional[int] = None) ->
     https://platform.worldquantbrain.com/learn/operators/detailed-operator-descriptions#ts_decay_linearx-d-dense-false
 
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES
-    weights = np.arange(1, d + 1)
-    # print(weights)
-    # pyo3_runtime.PanicException: weights not yet supported on array with null values
-    # null换成NaN就不报错了，再换回来
-    return x.fill_null(np.nan).rolling_mean(d, weights=weights, min_samples=minp).fill_nan(None)
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    dtype = float_dtype()
+    if partition_by is None:
+        # 不分组时直接map_batches，支持pl.col(['a', 'b'])这类多列表达式
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _roll_decay_linear, (d,), (minp,), dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _roll_decay_linear, (d,), (minp,), dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
+
+
+def ts_decay_linear_multi(x: Expr, ds: Sequence[int] = (5, 10, 20, 60, 120, 250), min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """多个窗口的线性衰减移动平均，一次调用得到所有结果
+
+    Parameters
+    ----------
+    x
+    ds
+        多个窗口大小
+    min_samples
+        为None时各窗口都要求满窗口
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
+
+    Returns
+    -------
+    Expr
+        Struct。每个窗口一个字段，字段名为`d_5`、`d_20`...
+
+    Examples
+    --------
+    ```python
+    # 得到a_d_5、a_d_20两列
+    df = df.with_columns(
+        ts_decay_linear_multi(pl.col('a'), (5, 20)).struct.unnest().name.prefix('a_')
+    )
+    ```
+
+    """
+    minp = [min_samples or polars_ta.MIN_SAMPLES or d for d in ds]
+    ftype = float_dtype()
+    names = [f"d_{d}" for d in ds]
+    dtype = Struct([Field(name, ftype) for name in names])
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, ftype), _roll_decay_linears, ds, minp, dtype=ftype, names=names), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], ftype), _roll_decay_linears, ds, minp, dtype=ftype, offsets=struct_to_offsets(xx, 1), names=names), return_dtype=dtype)
 
 
 def ts_delay(x: Expr, d: int = 1, fill_value: float = None) -> Expr:
@@ -748,7 +884,7 @@ def ts_min_max_diff(x: Expr, d: int, f: float = 0.5, min_samples: Optional[int]
     return x - f * (ts_min(x, d, min_samples) + ts_max(x, d, min_samples))
 
 
-def ts_moment(x: Expr, d: int, k: int = 0, min_samples: Optional[int] = None) -> Expr:
+def ts_moment(x: Expr, d: int, k: int = 0, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """滚动k阶中心距
 
     Returns K-th central moment of x for the past d days.
@@ -760,19 +896,25 @@ def ts_moment(x: Expr, d: int, k: int = 0, min_samples: Optional[int] = None) ->
     k
     min_samples
 
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
     """
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_moment, d, minp, k), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _nb.roll_moment, d, minp, k, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _nb.roll_moment, d, minp, k, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ts_partial_corr(x: Expr, y: Expr, z: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
+def ts_partial_corr(x: Expr, y: Expr, z: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """滚动偏相关
 
     Returns partial correlation of x, y, z for the past d days.
 
     """
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return struct(f0=x, f1=y, f2=z).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3), roll_partial_corr, d, minp), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=x, f1=y, f2=z).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=dtype), _nb.roll_partial_corr, d, minp, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
 def ts_percentage(x: Expr, d: int, percentage: float = 0.5, min_samples: Optional[int] = None) -> Expr:
@@ -787,21 +929,73 @@ def ts_percentage(x: Expr, d: int, percentage: float = 0.5, min_samples: Optiona
     percentage
     min_samples
 
+    Notes
+    -----
+    需要多个百分位数时用`ts_percentages`，一次遍历得到所有结果
+
     """
     minp = min_samples or polars_ta.MIN_SAMPLES
     return x.rolling_quantile(percentage, window_size=d, min_samples=minp)
 
 
-def ts_product(x: Expr, d: int = 5, min_samples: Optional[int] = None) -> Expr:
+def ts_percentages(x: Expr, d: int, percentages: Sequence[float] = (0.25, 0.5, 0.75), min_samples: Optional[int] = None, interpolation: str = 'nearest', rank: bool = False, partition_by: Optional[Expr] = None) -> Expr:
+    """滚动多个百分位数，一次遍历得到所有结果
+
+    Parameters
+    ----------
+    x
+    d
+    percentages
+        多个百分位数
+    min_samples
+    interpolation
+        插值方法。nearest、lower、higher、midpoint、linear，与polars一致
+    rank
+        是否同时输出`ts_rank`。为True时放在第一个字段
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
+
+    Returns
+    -------
+    Expr
+        Struct。字段依次为`rank`(可选)与各百分位数`q_0.1`、`q_0.5`...
+
+    Examples
+    --------
+    ```python
+    # 得到a_rank、a_q_0.1、a_q_0.5、a_q_0.9四列
+    df = df.with_columns(
+        ts_percentages(pl.col('a'), 250, (0.1, 0.5, 0.9), rank=True).struct.unnest().name.prefix('a_')
+    )
+    ```
+
+    """
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    ftype = float_dtype()
+    names = ['rank'] * rank + [f"q_{q}" for q in percentages]
+    dtype = Struct([Field(name, ftype) for name in names])
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, ftype), _roll_rank_quantiles, d, minp, percentages, interpolation, rank, dtype=ftype, names=names), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], ftype), _roll_rank_quantiles, d, minp, percentages, interpolation, rank, dtype=ftype, offsets=struct_to_offsets(xx, 1), names=names), return_dtype=dtype)
+
+
+def ts_product(x: Expr, d: int = 5, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """时序滚动乘"""
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return x.map_batches(lambda x1: batches_i1_o1(x1.to_numpy(), roll_prod, d, minp), return_dtype=Float64)
+    dtype = float_dtype()
+    if partition_by is None:
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _nb.roll_prod, d, minp, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _nb.roll_prod, d, minp, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
-def ts_rank(x: Expr, d: int = 5, min_samples: Optional[int] = None) -> Expr:
-    """时序滚动排名"""
-    minp = min_samples or polars_ta.MIN_SAMPLES
-    return x.rolling_rank(d, min_samples=minp) / x.is_not_null().cast(UInt32).rolling_sum(d, min_samples=minp)
+def ts_rank(x: Expr, d: int = 5, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """时序滚动排名。平均排名除以窗口内有效值个数，范围(0,1]"""
+    minp = min_samples or polars_ta.MIN_SAMPLES or d
+    dtype = float_dtype()
+    if partition_by is None:
+        # 不分组时直接map_batches，支持pl.col(['a', 'b'])这类多列表达式
+        return x.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, dtype), _roll_rank_quantile, d, minp, (), 'nearest', True, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0=x).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], dtype), _roll_rank_quantile, d, minp, (), 'nearest', True, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 
 
 def ts_realized_volatility(close: Expr, d: int = 5, min_samples: Optional[int] = None) -> Expr:
@@ -1005,7 +1199,7 @@ def ts_sum(x: Expr, d: int = 30, min_samples: Optional[int] = None) -> Expr:
     return x.rolling_sum(d, min_samples=minp)
 
 
-def ts_sum_split_by(x: Expr, by: Expr, d: int = 30, k: int = 10) -> Expr:
+def ts_sum_split_by(x: Expr, by: Expr, d: int = 30, k: int = 10, partition_by: Optional[Expr] = None) -> Expr:
     """切割论求和。在d窗口范围内以by为依据进行从小到大排序。取最大的N个和最小的N个对应位置的x的和
 
     Parameters
@@ -1016,12 +1210,20 @@ def ts_sum_split_by(x: Expr, by: Expr, d: int = 30, k: int = 10) -> Expr:
         窗口大小
     k
         最大最小的k个
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Returns
     -------
     Expr
-        * top_k
-        * bottom_k
+        * by最小的k个对应的x之和
+        * by最大的k个对应的x之和
+
+    Notes
+    -----
+    1. by为null的行不参与排序。窗口内有效的by不足k个时结果为null
+    2. 选中的行中x有null时，对应的和为null
+    3. by相同时，最小的k个优先取较早的行，最大的k个优先取较晚的行
 
     Examples
     --------
@@ -1054,18 +1256,20 @@ def ts_sum_split_by(x: Expr, by: Expr, d: int = 30, k: int = 10) -> Expr:
     ```
 
     """
-    dtype = Struct([Field(f"column_{i}", Float64) for i in range(2)])
-    return struct(f0=x, f1=by).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 2), _sum_split_by, d, k), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{i}", ftype) for i in range(2)])
+    return struct_with_partition(partition_by, f0=x, f1=by).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, 2, dtype=ftype), _sum_split_by, d, k, dtype=ftype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def ts_triple_corr(x: Expr, y: Expr, z: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
+def ts_triple_corr(x: Expr, y: Expr, z: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """时序滚动三重相关系数
 
     Returns triple correlation of x, y, z for the past d days.
 
     """
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return struct(f0=x, f1=y, f2=z).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3), roll_triple_corr, d, minp), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=x, f1=y, f2=z).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 3, dtype=dtype), _nb.roll_triple_corr, d, minp, dtype=dtype, offsets=struct_to_offsets(xx, 3)), return_dtype=dtype)
 
 
 def ts_weighted_decay(x: Expr, k: float = 0.5, min_samples: Optional[int] = None) -> Expr:
@@ -1091,7 +1295,7 @@ def ts_zscore(x: Expr, d: int = 5, min_samples: Optional[int] = None) -> Expr:
     return (x - ts_mean(x, d, min_samples)) / ts_std_dev(x, d, 0, min_samples)
 
 
-def ts_cum_prod_by(r: Expr, v: Expr) -> Expr:
+def ts_cum_prod_by(r: Expr, v: Expr, partition_by: Optional[Expr] = None) -> Expr:
     """带设置的累乘
 
     可用于市值累乘日收益率得到新市值的需求
@@ -1107,6 +1311,8 @@ def ts_cum_prod_by(r: Expr, v: Expr) -> Expr:
 
         * 如果非`null`，直接返回`v`
         * 如果`null`，返回`V[-1]*r`
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Returns
     -------
@@ -1142,10 +1348,11 @@ def ts_cum_prod_by(r: Expr, v: Expr) -> Expr:
 
 
     """
-    return struct(f0=r, f1=v).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), _cum_prod_by), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=r, f1=v).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=dtype), _nb._cum_prod_by, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def ts_cum_sum_by(r: Expr, v: Expr) -> Expr:
+def ts_cum_sum_by(r: Expr, v: Expr, partition_by: Optional[Expr] = None) -> Expr:
     """带设置的累加
 
     可用于市值累加日收益得到新市值的需求
@@ -1161,6 +1368,8 @@ def ts_cum_sum_by(r: Expr, v: Expr) -> Expr:
 
         * 如果非`null`，直接返回`v`
         * 如果`null`，返回`V[-1]+r`
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
 
     Examples
     --------
@@ -1191,37 +1400,81 @@ def ts_cum_sum_by(r: Expr, v: Expr) -> Expr:
     ```
 
     """
-    return struct(f0=r, f1=v).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2), _cum_sum_by), return_dtype=Float64)
+    dtype = float_dtype()
+    return struct_with_partition(partition_by, f0=r, f1=v).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, 2, dtype=dtype), _nb._cum_sum_by, dtype=dtype, offsets=struct_to_offsets(xx, 2)), return_dtype=dtype)
 
 
-def ts_regression_resid(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
-    """时序滚动回归取残差"""
+def ts_regression(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = None, add_intercept: bool = True, partition_by: Optional[Expr] = None) -> Expr:
+    """时序滚动回归。斜率、截距、残差、预测值、R²、t值一次得到
+
+    递推更新X'X与X'y，每步O(p²)。y或任一x为null的行跳过。
+    `ts_regression_slope`等函数只是从这里取一个字段，需要多个输出时直接调用本函数，只回归一次
+
+    Parameters
+    ----------
+    y
+    *more_x
+        多个x
+    d
+    min_samples
+        窗口内有效行的最少数量。为None时要求满窗口，窗口中有null时结果为null
+    add_intercept
+        是否带截距
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
+
+    Returns
+    -------
+    Expr
+        Struct。有p个x时共2p+5个字段，依次为各x的斜率`slope`(多个x时为`slope_0`、`slope_1`...)、
+        截距`intercept`、当前行的残差`resid`、当前行的预测值`pred`、`r2`，以及各斜率与截距的t值`t_slope`...`t_intercept`。
+        无截距时截距为0、其t值为null、R²不减均值。窗口内x共线时都为null，当前行y或x为null时残差与预测值为null。
+        窗口内y为常数时R²为null。完全拟合时t值为±inf，系数为0时t值为null
+
+    Examples
+    --------
+    ```python
+    df = df.with_columns(
+        ts_regression(pl.col('y'), pl.col('x'), d=20).alias('reg')
+    ).unnest('reg')
+    ```
+
+    """
+    p = len(more_x)
+    if p == 0:
+        raise ValueError('ts_regression requires at least one x')
     minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, x, mode='residuals', add_intercept=True, rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp))
+    ftype = float_dtype()
+    names = _ols_names(p)
+    dtype = Struct([Field(name, ftype) for name in names])
+    named = {f"f{i}": x for i, x in enumerate((y, *more_x))}
+    return struct_with_partition(partition_by, **named).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, p + 1, ftype), _roll_ols, d, minp, 1.0, add_intercept, dtype=ftype, offsets=struct_to_offsets(xx, p + 1), names=names), return_dtype=dtype)
+
 
+def ts_regression_resid(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """时序滚动回归取残差"""
+    return ts_regression(y, x, d=d, min_samples=min_samples, partition_by=partition_by).struct.field('resid').name.keep()
 
-def ts_regression_pred(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
+
+def ts_regression_pred(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """时序滚动回归取y的预测值
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, x, mode='predictions', add_intercept=True, rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp))
+    return ts_regression(y, x, d=d, min_samples=min_samples, partition_by=partition_by).struct.field('pred').name.keep()
 
 
-def ts_regression_intercept(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
+def ts_regression_intercept(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """时序滚动回归取截距
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, x, mode='coefficients', add_intercept=True, rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp)).struct[1]
+    return ts_regression(y, x, d=d, min_samples=min_samples, partition_by=partition_by).struct.field('intercept').name.keep()
 
 
-def ts_regression_slope(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
+def ts_regression_slope(y: Expr, x: Expr, d: int, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
     """时序滚动回归取斜率"""
-    minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, x, mode='coefficients', add_intercept=True, rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp)).struct[0]
+    return ts_regression(y, x, d=d, min_samples=min_samples, partition_by=partition_by).struct.field('slope').name.keep()
 
 
-def ts_resid(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = None) -> Expr:
-    """多元时序滚动回归取残差
+def ts_resid(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """多元时序滚动回归取残差。不带截距
 
     Parameters
     ----------
@@ -1230,14 +1483,14 @@ def ts_resid(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = N
         多个x
     d
     min_samples
+    partition_by
 
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, *more_x, mode='residuals', rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp))
+    return ts_regression(y, *more_x, d=d, min_samples=min_samples, add_intercept=False, partition_by=partition_by).struct.field('resid').name.keep()
 
 
-def ts_pred(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = None) -> Expr:
-    """多元时序滚动回归预测
+def ts_pred(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = None, partition_by: Optional[Expr] = None) -> Expr:
+    """多元时序滚动回归预测。不带截距
 
     Parameters
     ----------
@@ -1246,10 +1499,10 @@ def ts_pred(y: Expr, *more_x: Expr, d: int = 30, min_samples: Optional[int] = No
         多个x
     d
     min_samples
+    partition_by
 
     """
-    minp = min_samples or polars_ta.MIN_SAMPLES or d
-    return pls.compute_rolling_least_squares(y, *more_x, mode='predictions', rolling_kwargs=RollingKwargs(window_size=d, min_periods=minp))
+    return ts_regression(y, *more_x, d=d, min_samples=min_samples, add_intercept=False, partition_by=partition_by).struct.field('pred').name.keep()
 
 
 def ts_weighted_mean(x: Expr, w: Expr, d: int, min_samples: Optional[int] = None) -> Expr:
@@ -1267,7 +1520,7 @@ def ts_weighted_sum(x: Expr, w: Expr, d: int, min_samples: Optional[int] = None)
 def ts_signals_to_size(long_entry: Expr, long_exit: Expr,
                        short_entry: Expr, short_exit: Expr,
                        accumulate: bool = False,
-                       action: bool = False) -> Expr:
+                       action: bool = False, partition_by: Optional[Expr] = None) -> Expr:
     """多空信号转持仓。参考于`vectorbt`
 
     Parameters
@@ -1285,6 +1538,8 @@ def ts_signals_to_size(long_entry: Expr, long_exit: Expr,
     action
         返回持仓状态还是下单操作
 
+    partition_by
+        分组列。数据需按分组、时间排序，所有分组一次计算，不必再套用over或group_by
     """
-    return struct(f0=long_entry, f1=long_exit, f2=short_entry, f3=short_exit).map_batches(
-        lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=float), _signals_to_size, accumulate, action), return_dtype=Float64)
+    return struct_with_partition(partition_by, f0=long_entry, f1=long_exit, f2=short_entry, f3=short_exit).map_batches(
+        lambda xx: batches_i2_o1(struct_to_numpy(xx, 4, dtype=bool), _nb._signals_to_size, accumulate, action, offsets=struct_to_offsets(xx, 4)), return_dtype=Float64)
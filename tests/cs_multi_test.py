@@ -0,0 +1,38 @@
+"""
+横截面排名、标准化、分箱的速度对比。大量因子按日期分别处理
+
+1. polars：每个因子各自`over('date')`
+2. numpy：所有因子一次`over('date')`，每个截面转成二维数组，每列只排序一次
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.wq.cross_sectional import cs_rank, cs_qcut, cs_transform_multi
+from polars_ta.wq.preprocess import cs_zscore
+
+if __name__ == '__main__':
+    n_date, n_asset, n_factor = 20, 5000, 300
+    df = pl.DataFrame({
+        'date': np.repeat(np.arange(n_date), n_asset),
+        **{f'f{i}': np.random.randn(n_date * n_asset) for i in range(n_factor)},
+    })
+    factors = [pl.col(f'f{i}') for i in range(n_factor)]
+
+    t0 = time.perf_counter()
+    df.select(*[cs_rank(f).over('date').alias(f'p{i}') for i, f in enumerate(factors)])
+    t1 = time.perf_counter()
+    df.select(cs_transform_multi(factors, ('pct',)).over('date'))
+    t2 = time.perf_counter()
+    df.select(
+        *[cs_rank(f).over('date').alias(f'p{i}') for i, f in enumerate(factors)],
+        *[cs_zscore(f).over('date').alias(f'z{i}') for i, f in enumerate(factors)],
+        *[cs_qcut(f).over('date').alias(f'q{i}') for i, f in enumerate(factors)],
+    )
+    t3 = time.perf_counter()
+    df.select(cs_transform_multi(factors, ('pct', 'zscore', 'qcut')).over('date'))
+    t4 = time.perf_counter()
+    print(f'rank: polars {t1 - t0:.3f}s, numpy {t2 - t1:.3f}s')
+    print(f'rank+zscore+qcut: polars {t3 - t2:.3f}s, numpy {t4 - t3:.3f}s')
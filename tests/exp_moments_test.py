@@ -0,0 +1,35 @@
+"""
+半衰期加权的滚动统计速度对比
+
+1. polars：fill_null(nan)、带权重的rolling、fill_nan(None)，每个统计量各自一次O(n·w)的遍历
+2. numba：指数权重递推，均值、和、方差、标准差一次O(n)遍历得到
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.utils._nb import get_exponent_weights
+from polars_ta.wq.half_life import ts_mean_hl, ts_moments_hl
+
+
+def timeit(df, *exprs, n=3):
+    df.select(*exprs)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        df.select(*exprs)
+    return (time.perf_counter() - t0) / n
+
+
+if __name__ == '__main__':
+    d, half_life = 250, 60
+    df = pl.DataFrame({'a': np.random.rand(1_000_000)})
+    a = pl.col('a')
+    b = a.fill_null(np.nan)
+    w = get_exponent_weights(d, half_life)
+
+    print('mean polars', timeit(df, b.rolling_mean(d, weights=w).fill_nan(None)))
+    print('mean numba ', timeit(df, ts_mean_hl(a, d, half_life)))
+    print('mean+sum+var+std polars', timeit(df, *[f(b, d, weights=w).fill_nan(None).alias(str(i)) for i, f in enumerate((pl.Expr.rolling_mean, pl.Expr.rolling_sum, pl.Expr.rolling_var, pl.Expr.rolling_std))]))
+    print('mean+sum+var+std numba ', timeit(df, ts_moments_hl(a, d, half_life)))
@@ -0,0 +1,37 @@
+"""
+冷启动导入耗时，取`python -X importtime`最后一行的累计时间
+
+包的`__init__`与`prefix`模块都是延迟导入，numba、talib、polars_ols在首次使用时才导入
+
+"""
+import subprocess
+import sys
+
+
+def import_time(code: str) -> float:
+    """在新进程中执行code，返回导入耗时，单位秒"""
+    r = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True)
+    # 顶层导入的累计时间之和，单位微秒
+    total = 0
+    for line in r.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            total += int(cumulative)
+    return total / 1e6
+
+
+if __name__ == '__main__':
+    for code in (
+            'import polars',
+            'import polars_ta.wq',
+            'import polars_ta.tdx',
+            'import polars_ta.talib',
+            'import polars_ta.prefix.wq',
+            'import polars_ta.prefix.tdx',
+            'from polars_ta.prefix.wq import *',
+            'from polars_ta.wq import cs_rank',
+            'from polars_ta.wq import ts_mean',
+    ):
+        print(f'{code:40s}{import_time(code):.3f}s')
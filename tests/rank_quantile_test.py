@@ -0,0 +1,38 @@
+"""
+滚动排名与分位数的速度对比
+
+1. polars：rolling_rank除以rolling_sum，rolling_quantile、rolling_median各自一次遍历
+2. numba：树状数组维护窗口内的排序，排名与多个分位数一次遍历得到。单个分位数也用`ts_percentages`，
+   `ts_percentage`、`ts_median`仍是polars的rolling_quantile、rolling_median
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.wq.time_series import ts_rank, ts_percentages
+
+
+def timeit(df, *exprs, n=3):
+    df.select(*exprs)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        df.select(*exprs)
+    return (time.perf_counter() - t0) / n
+
+
+if __name__ == '__main__':
+    d = 250
+    df = pl.DataFrame({'a': np.random.rand(1_000_000)})
+    a = pl.col('a')
+    qs = (0.1, 0.5, 0.9)
+
+    print('rank polars', timeit(df, a.rolling_rank(d) / a.is_not_null().cast(pl.UInt32).rolling_sum(d)))
+    print('rank numba ', timeit(df, ts_rank(a, d)))
+    print('quantile polars', timeit(df, a.rolling_quantile(0.1, window_size=d)))
+    print('quantile numba ', timeit(df, ts_percentages(a, d, (0.1,))))
+    print('median polars', timeit(df, a.rolling_median(d)))
+    print('median numba ', timeit(df, ts_percentages(a, d, (0.5,))))
+    print('rank+3 quantiles polars', timeit(df, (a.rolling_rank(d) / a.is_not_null().cast(pl.UInt32).rolling_sum(d)).alias('r'), *[a.rolling_quantile(q, window_size=d).alias(str(q)) for q in qs]))
+    print('rank+3 quantiles numba ', timeit(df, ts_percentages(a, d, qs, rank=True)))
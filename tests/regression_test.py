@@ -0,0 +1,37 @@
+"""
+滚动回归的速度对比
+
+1. polars_ols：compute_rolling_least_squares，斜率、截距、残差各自一次滚动回归
+2. numba：递推更新充分统计量，斜率、截距、残差、预测值、R²、t值一次遍历得到，可带半衰期
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+import polars_ols as pls
+
+from polars_ta.wq.half_life import ts_regression_hl
+from polars_ta.wq.time_series import ts_regression
+
+
+def timeit(df, *exprs, n=3):
+    df.select(*exprs)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        df.select(*exprs)
+    return (time.perf_counter() - t0) / n
+
+
+if __name__ == '__main__':
+    d, half_life = 252, 63
+    df = pl.DataFrame({'y': np.random.rand(1_000_000), 'x': np.random.rand(1_000_000)})
+    y, x = pl.col('y'), pl.col('x')
+    kwargs = pls.RollingKwargs(window_size=d, min_periods=d)
+
+    print('slope+intercept+resid polars_ols', timeit(df,
+                                                     pls.compute_rolling_least_squares(y, x, mode='coefficients', add_intercept=True, rolling_kwargs=kwargs).struct[0].alias('a'),
+                                                     pls.compute_rolling_least_squares(y, x, mode='coefficients', add_intercept=True, rolling_kwargs=kwargs).struct[1].alias('b'),
+                                                     pls.compute_rolling_least_squares(y, x, mode='residuals', add_intercept=True, rolling_kwargs=kwargs).alias('c')))
+    print('all numba                      ', timeit(df, ts_regression(y, x, d=d)))
+    print('all numba half_life            ', timeit(df, ts_regression_hl(y, x, d=d, half_life=half_life)))
@@ -0,0 +1,35 @@
+"""
+横截面中性化的速度对比。大量因子对同一组行业哑变量与市值回归
+
+1. polars_ols：每个因子每个日期各自回归一次
+2. numpy：每个日期x只做一次SVD，所有因子一起求解
+3. numpy：行业不展开哑变量，组内去均值后只对市值回归
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.wq.preprocess import cs_resid, cs_resid_multi
+
+if __name__ == '__main__':
+    n_date, n_asset, n_factor, n_industry = 20, 5000, 300, 31
+    df = pl.DataFrame({
+        'date': np.repeat(np.arange(n_date), n_asset),
+        'size': np.random.randn(n_date * n_asset),
+        'industry': np.random.randint(0, n_industry, n_date * n_asset),
+        **{f'f{i}': np.random.randn(n_date * n_asset) for i in range(n_factor)},
+    })
+    df = df.with_columns(df.to_dummies('industry'))
+    factors = [pl.col(f'f{i}') for i in range(n_factor)]
+    x = [pl.col('size'), *[pl.col(f'industry_{i}') for i in range(n_industry)]]
+
+    t0 = time.perf_counter()
+    df.select(*[cs_resid(f, *x).over('date') for f in factors])
+    t1 = time.perf_counter()
+    df.select(cs_resid_multi(factors, *x).over('date'))
+    t2 = time.perf_counter()
+    df.select(cs_resid_multi(factors, pl.col('size'), group=pl.col('industry')).over('date'))
+    t3 = time.perf_counter()
+    print(f'polars_ols {t1 - t0:.3f}s, numpy {t2 - t1:.3f}s, numpy group {t3 - t2:.3f}s')
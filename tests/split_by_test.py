@@ -0,0 +1,49 @@
+"""
+ts_sum_split_by的速度对比
+
+1. 旧写法：每个窗口两次argsort，O(n·w·log w)
+2. 新写法：分块排序，窗口内的值计入树状数组，O(n·log w)
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+from numba import jit
+from numpy.lib.stride_tricks import sliding_window_view
+
+from polars_ta.wq.time_series import ts_sum_split_by
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _sum_split_by_v1(x1, x2, window=10, n=2):
+    out1 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    out2 = np.full(x1.shape[0], np.nan, dtype=x1.dtype)
+    if len(x1) < window:
+        return out1, out2
+    a1 = sliding_window_view(x1, window)
+    a2 = sliding_window_view(x2, window)
+    for i, (v1, v2) in enumerate(zip(a1, a2)):
+        b1 = np.argsort(v2)[:n]
+        b2 = np.argsort(-v2)[:n]
+        out1[i + window - 1] = np.sum(v1[b1])
+        out2[i + window - 1] = np.sum(v1[b2])
+    return out1, out2
+
+
+if __name__ == '__main__':
+    x = np.random.rand(1_000_000)
+    by = np.random.rand(1_000_000)
+    df = pl.DataFrame({'x': x, 'by': by})
+    for d, k in ((20, 5), (60, 10), (250, 10)):
+        _sum_split_by_v1(x, by, d, k)
+        t0 = time.perf_counter()
+        r1, r2 = _sum_split_by_v1(x, by, d, k)
+        t1 = time.perf_counter()
+        df.select(ts_sum_split_by(pl.col('x'), pl.col('by'), d, k))
+        t2 = time.perf_counter()
+        result = df.select(ts_sum_split_by(pl.col('x'), pl.col('by'), d, k).alias('a')).unnest('a')
+        t3 = time.perf_counter()
+        assert np.allclose(result['column_0'].to_numpy(), r1, equal_nan=True)
+        assert np.allclose(result['column_1'].to_numpy(), r2, equal_nan=True)
+        print(f'd={d} k={k} v1 {t1 - t0:.3f}s new {t3 - t2:.3f}s')
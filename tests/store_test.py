@@ -0,0 +1,41 @@
+"""
+加载面板的速度对比。每个研究进程启动时都要执行一次
+
+1. parquet：读取长表，再`to_wide`
+2. 内存映射：`load_panel`，首次访问时才从页缓存映射
+
+"""
+import tempfile
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.wide import load_panel, save_panel, to_wide, ts_mean
+
+if __name__ == '__main__':
+    n_date, n_asset = 2500, 5000
+    fields = ['OPEN', 'HIGH', 'LOW', 'CLOSE', 'VOLUME']
+    df = pl.DataFrame({
+        'date': np.repeat(np.arange(n_date), n_asset),
+        'asset': np.tile(np.arange(n_asset), n_date),
+        **{f: np.random.rand(n_date * n_asset) for f in fields},
+    })
+    with tempfile.TemporaryDirectory() as path:
+        df.write_parquet(f'{path}/panel.parquet')
+        save_panel(f'{path}/panel', *to_wide(df, fields))
+        # 两种方式都先读一遍，文件进入页缓存
+        pl.read_parquet(f'{path}/panel.parquet')
+        load_panel(f'{path}/panel')[0]['CLOSE'].sum()
+        ts_mean(np.ones((10, 2)), 20)
+
+        t0 = time.perf_counter()
+        arrays, dates, assets = to_wide(pl.read_parquet(f'{path}/panel.parquet'), fields)
+        t1 = time.perf_counter()
+        ts_mean(arrays['CLOSE'], 20)
+        t2 = time.perf_counter()
+        arrays, dates, assets = load_panel(f'{path}/panel')
+        t3 = time.perf_counter()
+        ts_mean(arrays['CLOSE'], 20)
+        t4 = time.perf_counter()
+        print(f'parquet: load {t1 - t0:.3f}s, ts_mean {t2 - t1:.3f}s. mmap: load {t3 - t2:.3f}s, ts_mean {t4 - t3:.3f}s')
@@ -0,0 +1,41 @@
+"""
+多输出kernel拼Struct的速度对比
+
+1. 旧写法：DataFrame(tuple, nan_to_null=True).to_struct()
+2. 旧写法v2：先填二维数组，再arr.to_struct()
+3. 新写法：numpy_to_struct，每个输出单独转Series后组装
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.utils.numba_ import numpy_to_struct
+
+
+def to_struct_df(outs):
+    return pl.DataFrame(outs, nan_to_null=True).to_struct()
+
+
+def to_struct_arr(outs):
+    arr = np.empty((outs[0].shape[0], len(outs)), dtype=float)
+    for i, x in enumerate(outs):
+        arr[:, i] = x
+    return pl.Series(arr, nan_to_null=True).arr.to_struct()
+
+
+if __name__ == '__main__':
+    outs = tuple(np.random.rand(1_000_000) for _ in range(3))
+    for x in outs:
+        x[::11] = np.nan
+
+    assert to_struct_df(outs).equals(numpy_to_struct(outs))
+    assert to_struct_arr(outs).struct.unnest().equals(numpy_to_struct(outs).struct.unnest().rename(lambda x: x.replace('column_', 'field_')))
+
+    for func in (to_struct_df, to_struct_arr, numpy_to_struct):
+        t1 = time.perf_counter()
+        for i in range(20):
+            func(outs)
+        t2 = time.perf_counter()
+        print(func.__name__, t2 - t1)
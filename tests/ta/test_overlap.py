@@ -125,3 +125,14 @@ class TestDemoClass:
         result3 = result2['high'].to_numpy()
 
         assert np.allclose(result1, result3, equal_nan=True)
+
+    def test_talib_partition_by(self):
+        import polars_ta.talib as ta
+
+        df = self.df_pl.with_columns(asset=np.repeat(['A', 'B', 'C', 'D'], 25))
+        for func in (lambda **kw: ta.SMA(pl.col('close'), 5, **kw),
+                     lambda **kw: ta.ATR(pl.col('high'), pl.col('low'), pl.col('close'), 5, **kw),
+                     lambda **kw: ta.MINMAX(pl.col('close'), 5, **kw)):
+            result1 = df.select(func().over('asset')).to_series()
+            result2 = df.select(func(partition_by=pl.col('asset'))).to_series()
+            assert result1.equals(result2)
@@ -0,0 +1,33 @@
+"""
+截面选出前后k个的速度对比。k远小于资产数
+
+1. polars：`cs_top_bottom`每个日期全排名
+2. numba：部分选择，`over('date')`
+3. numba：部分选择，`partition_by`一次计算所有日期
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.wq.cross_sectional import cs_top_bottom, cs_top_bottom_k
+
+if __name__ == '__main__':
+    n_date, n_asset, k = 2500, 5000, 50
+    df = pl.DataFrame({
+        'date': np.repeat(np.arange(n_date), n_asset),
+        'alpha': np.random.randn(n_date * n_asset),
+    })
+    df.select(cs_top_bottom_k(pl.col('alpha'), k, partition_by=pl.col('date')))
+
+    t0 = time.perf_counter()
+    df.select(cs_top_bottom(pl.col('alpha'), k).over('date'))
+    t1 = time.perf_counter()
+    df.select(cs_top_bottom_k(pl.col('alpha'), k).over('date'))
+    t2 = time.perf_counter()
+    df.select(cs_top_bottom_k(pl.col('alpha'), k, partition_by=pl.col('date')))
+    t3 = time.perf_counter()
+    df.select(cs_top_bottom_k(pl.col('alpha'), k, ties='ordinal', partition_by=pl.col('date')))
+    t4 = time.perf_counter()
+    print(f'polars {t1 - t0:.3f}s, numba over {t2 - t1:.3f}s, numba partition_by {t3 - t2:.3f}s, ordinal {t4 - t3:.3f}s')
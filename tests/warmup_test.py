@@ -0,0 +1,32 @@
+"""
+kernel预热。新进程中后台预热与计算并行，报告未命中缓存的签名
+
+第一次运行会编译所有签名并写入缓存，之后的运行都从缓存加载
+
+"""
+import time
+
+import numpy as np
+import polars as pl
+
+from polars_ta.utils.warmup import warmup
+from polars_ta.wq import ts_co_skewness, ts_product
+
+if __name__ == '__main__':
+    t0 = time.perf_counter()
+    future = warmup(background=True)
+
+    df = pl.DataFrame({'a': np.random.rand(100_000), 'b': np.random.rand(100_000)})
+    df = df.with_columns(
+        x=ts_co_skewness(pl.col('a'), pl.col('b'), 20),
+        y=ts_product(pl.col('a'), 20),
+    )
+    t1 = time.perf_counter()
+
+    report = future.result()
+    t2 = time.perf_counter()
+
+    for name, v in report.items():
+        for sig in v['misses']:
+            print('miss', name, sig)
+    print(f'first compute {t1 - t0:.3f}s, warmup done {t2 - t0:.3f}s')
@@ -0,0 +1,82 @@
+import numpy as np
+import polars as pl
+import pytest
+
+
+class TestDemoClass:
+
+    def _df(self, dates, assets):
+        df = pl.DataFrame({'date': dates}).join(pl.DataFrame({'asset': assets}), how='cross')
+        return df.with_columns(
+            CLOSE=pl.Series(np.random.rand(len(df))),
+            HIGH=pl.Series(np.random.rand(len(df))),
+        ).sample(fraction=1, shuffle=True)
+
+    def test_append(self, tmp_path):
+        from polars_ta.wide import append_panel, load_panel, save_panel, to_wide
+
+        path = str(tmp_path / 'panel')
+        fields = ['CLOSE', 'HIGH']
+        df1 = self._df(np.arange(10), ['a', 'b', 'c'])
+        # 新资产d，缺少资产b
+        df2 = self._df(np.arange(10, 12), ['d', 'a', 'c'])
+        # 只有已有资产
+        df3 = self._df(np.arange(12, 15), ['c', 'd'])
+        save_panel(path, *to_wide(df1, fields))
+        append_panel(path, *to_wide(df2, fields))
+        append_panel(path, *to_wide(df3, fields))
+
+        arrays, dates, assets = load_panel(path)
+        assert sorted(arrays) == fields
+        assert dates.to_list() == list(range(15))
+        assert assets.to_list() == ['a', 'b', 'c', 'd']
+        assert isinstance(arrays['CLOSE'], np.memmap)
+        assert not arrays['CLOSE'].flags.writeable
+        # 扩充资产后只剩新列数的文件
+        assert sorted(p.name for p in (tmp_path / 'panel').glob('*.f64')) == ['CLOSE.4.f64', 'HIGH.4.f64']
+
+        expected, _, _ = to_wide(pl.concat([df1, df2, df3]), fields)
+        for field in fields:
+            np.testing.assert_array_equal(arrays[field], expected[field])
+
+        with pytest.raises(ValueError):
+            append_panel(path, *to_wide(df3, fields))
+        with pytest.raises(ValueError):
+            append_panel(path, *to_wide(self._df(np.arange(20, 21), ['a']), ['CLOSE']))
+        with pytest.raises(FileExistsError):
+            save_panel(path, *to_wide(df1, fields))
+
+    def test_interrupted(self, tmp_path):
+        from polars_ta.wide import append_panel, load_panel, save_panel, to_wide
+
+        path = str(tmp_path / 'panel')
+        df1 = self._df(np.arange(5), ['a', 'b'])
+        df2 = self._df(np.arange(5, 8), ['a', 'b'])
+        save_panel(path, *to_wide(df1, ['CLOSE']))
+        # 模拟写了一半的行
+        with open(tmp_path / 'panel' / 'CLOSE.2.f64', 'ab') as f:
+            f.write(b'\0' * 12)
+        arrays, dates, _ = load_panel(path)
+        assert arrays['CLOSE'].shape == (5, 2)
+
+        append_panel(path, *to_wide(df2, ['CLOSE']))
+        arrays, dates, _ = load_panel(path, ['CLOSE'], mode='c')
+        expected, _, _ = to_wide(pl.concat([df1, df2]), ['CLOSE'])
+        np.testing.assert_array_equal(arrays['CLOSE'], expected['CLOSE'])
+        # 写时复制，不写回文件
+        arrays['CLOSE'][:] = 0
+        np.testing.assert_array_equal(load_panel(path)[0]['CLOSE'], expected['CLOSE'])
+
+    def test_cross_section(self, tmp_path):
+        from polars_ta.wide import cross_section, load_panel, save_panel, to_wide, ts_mean
+
+        path = str(tmp_path / 'panel')
+        df = self._df(np.arange(30), ['a', 'b', 'c'])
+        save_panel(path, *to_wide(df, ['CLOSE', 'HIGH']))
+        arrays, dates, assets = load_panel(path)
+
+        cs = cross_section(arrays, assets, 3)
+        assert np.shares_memory(cs['CLOSE'].to_numpy(), arrays['CLOSE'])
+        assert cs['CLOSE'].to_list() == arrays['CLOSE'][3].tolist()
+        # 只读的映射可直接传给算子
+        np.testing.assert_allclose(ts_mean(arrays['CLOSE'], 5)[4:], ts_mean(np.array(arrays['CLOSE']), 5)[4:])
@@ -0,0 +1,97 @@
+import numpy as np
+import polars as pl
+
+
+class TestDemoClass:
+    n = 300
+    k = 20
+    arrays = None
+    df_pl = None
+
+    def setup_class(self):
+        from polars_ta.wide.convert import to_long
+
+        close = 10 + np.random.randn(self.n, self.k).cumsum(axis=0)
+        high = close + np.random.rand(self.n, self.k)
+        low = close - np.random.rand(self.n, self.k)
+        y = np.random.randn(self.n, self.k)
+        # 上市前全为缺失，中间有零星缺失
+        for j in range(self.k):
+            close[:j * 7, j] = np.nan
+        close[np.random.rand(self.n, self.k) < 0.02] = np.nan
+        y[np.random.rand(self.n, self.k) < 0.05] = np.nan
+        # 价格很大时检查滚动方差的精度
+        close[:, 0] += 1e6
+        self.arrays = {'close': close, 'high': high, 'low': low, 'y': y}
+        self.df_pl = to_long(self.arrays, pl.Series('date', np.arange(self.n)), pl.Series('asset', np.arange(self.k)))
+
+    def _long(self, expr):
+        """长表按资产分组计算，再转回宽表"""
+        out = self.df_pl.select(expr.over('asset').alias('out'))['out'].cast(pl.Float64).to_numpy()
+        return out.reshape((self.n, self.k), order='F')
+
+    def test_single(self):
+        import polars_ta.wq as wq
+        import polars_ta.wide as wide
+
+        c = self.arrays['close']
+        x = pl.col('close')
+        n = c.shape[0]
+        cases = [
+            (wq.ts_sum(x, 10), wide.ts_sum(c, 10)),
+            (wq.ts_mean(x, 10, 3), wide.ts_mean(c, 10, 3)),
+            (wq.ts_std_dev(x, 10), wide.ts_std_dev(c, 10)),
+            (wq.ts_std_dev(x, 10, 1, 2), wide.ts_std_dev(c, 10, 1, 2)),
+            (wq.ts_max(x, 10), wide.ts_max(c, 10)),
+            (wq.ts_min(x, 10, 1), wide.ts_min(c, 10, 1)),
+            (wq.ts_delay(x, 3), wide.ts_delay(c, 3)),
+            (wq.ts_delay(x, -2), wide.ts_delay(c, -2)),
+            (wq.ts_delta(x, 2), wide.ts_delta(c, 2)),
+            (wq.ts_returns(x, 1), wide.ts_returns(c, 1)),
+            # 移动超过总行数时全为nan，与长表一致
+            (wq.ts_delay(x, n + 5), wide.ts_delay(c, n + 5)),
+            (wq.ts_delay(x, -n), wide.ts_delay(c, -n)),
+            (wq.ts_returns(x, n), wide.ts_returns(c, n)),
+            (wq.ts_arg_max(x, 10), wide.ts_arg_max(c, 10)),
+            (wq.ts_arg_min(x, 10, min_samples=3), wide.ts_arg_min(np.ascontiguousarray(c), 10, min_samples=3)),
+            (wq.ts_decay_linear(x, 10), wide.ts_decay_linear(c, 10)),
+            (wq.ts_rank(x, 10, 5), wide.ts_rank(c, 10, 5)),
+            (wq.ts_product(x, 5), wide.ts_product(c, 5)),
+        ]
+        for expr, result in cases:
+            np.testing.assert_allclose(self._long(expr), result, rtol=1e-9, atol=1e-9)
+
+    def test_tdx(self):
+        import polars_ta.tdx as tdx
+        import polars_ta.wide as wide
+
+        a = self.arrays
+        np.testing.assert_allclose(self._long(tdx.RSI(pl.col('close'), 6)), wide.ts_RSI(a['close'], 6), rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(self._long(tdx.ATR(pl.col('high'), pl.col('low'), pl.col('close'), 5)), wide.ts_ATR(a['high'], a['low'], a['close'], 5), rtol=1e-9)
+
+    def test_cov_corr(self):
+        import polars_ta.wide as wide
+
+        # 逐个窗口只取x、y都有效的行计算
+        x, y = self.arrays['close'], self.arrays['y']
+        cov = wide.ts_covariance(x, y, 10, min_samples=4)
+        corr = wide.ts_corr(x, y, 10)
+        for j in range(self.k):
+            for i in range(self.n):
+                a, b = x[max(0, i - 9):i + 1, j], y[max(0, i - 9):i + 1, j]
+                m = ~np.isnan(a) & ~np.isnan(b)
+                expected = np.cov(a[m], b[m])[0, 1] if m.sum() >= 4 else np.nan
+                np.testing.assert_allclose(cov[i, j], expected, rtol=1e-9, atol=1e-12)
+                expected = np.corrcoef(a[m], b[m])[0, 1] if m.sum() >= 10 else np.nan
+                np.testing.assert_allclose(corr[i, j], expected, rtol=1e-9, atol=1e-12)
+
+    def test_convert(self):
+        from polars_ta.wide.convert import to_wide, to_long
+
+        df = self.df_pl.drop_nulls('close').sample(fraction=1, shuffle=True)
+        arrays, dates, assets = to_wide(df, ['close', 'y'], order='F')
+        assert arrays['close'].flags.f_contiguous
+        # 没有任何有效值的日期不出现在宽表中
+        np.testing.assert_array_equal(arrays['close'], self.arrays['close'][dates.to_numpy()])
+        df2 = to_long({'close': arrays['close']}, dates, assets, drop_nulls=True)
+        assert df2.equals(df.select('date', 'asset', 'close').sort('asset', 'date'))
@@ -0,0 +1,80 @@
+import numpy as np
+import polars as pl
+
+
+class TestDemoClass:
+    df_pl = None
+
+    def setup_class(self):
+        n = 600
+        self.df_pl = pl.DataFrame({
+            'date': np.repeat(np.arange(6), n // 6),
+            # 有大量重复值，检查并列排名
+            'x0': np.random.randint(0, 30, n),
+            **{f'x{i}': np.random.randn(n) for i in range(1, 4)},
+        })
+        self.df_pl = self.df_pl.with_columns(
+            pl.when(pl.int_range(pl.len()) % 13 == 2).then(None).otherwise(pl.col('x1')).alias('x1'),
+            # 某天全为null
+            pl.when(pl.col('date') == 3).then(None).otherwise(pl.col('x2')).alias('x2'),
+        )
+
+    def test_cs_transform_multi(self):
+        from polars_ta.wq.cross_sectional import cs_rank, cs_qcut, cs_transform_multi, cs_rank_multi
+        from polars_ta.wq.preprocess import cs_zscore
+
+        df = self.df_pl
+        xs = [pl.col(f'x{i}') for i in range(4)]
+        result1 = df.select(
+            *[cs_rank(x, False).over('date').alias(f'r{i}') for i, x in enumerate(xs)],
+            *[cs_rank(x, True).over('date').alias(f'p{i}') for i, x in enumerate(xs)],
+            *[cs_zscore(x, 1).over('date').alias(f'z{i}') for i, x in enumerate(xs)],
+            *[cs_qcut(x, 5).over('date').alias(f'q{i}') for i, x in enumerate(xs)],
+        )
+        result2 = df.select(cs_transform_multi(xs, ('rank', 'pct', 'zscore', 'qcut'), q=5, ddof=1).over('date').alias('r')).unnest('r')
+        assert result2.dtypes[0] == pl.UInt32 and result2.dtypes[-1] == pl.UInt16
+        assert result2.columns == [f'x{i}_{h}' for h in ('rank', 'pct', 'zscore', 'qcut') for i in range(4)]
+        np.testing.assert_allclose(result1.to_numpy().astype(float), result2.to_numpy().astype(float), atol=1e-12)
+
+        result3 = df.select(cs_rank_multi(xs).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result2[:, 4:8].to_numpy(), result3.to_numpy(), atol=1e-12)
+
+        # 空表
+        empty = df.clear()
+        result4 = empty.select(cs_transform_multi(xs, ('rank', 'pct', 'zscore', 'qcut'), q=5).alias('r')).unnest('r')
+        assert result4.shape == (0, 16) and result4.dtypes == result2.dtypes
+        result5 = empty.group_by('date').agg(cs_transform_multi(xs).alias('r'))
+        assert len(result5) == 0
+
+    def test_cs_top_bottom_k(self):
+        from polars_ta.wq.cross_sectional import cs_top_bottom, cs_top_bottom_k
+
+        df = self.df_pl
+        for x in ('x0', 'x1', 'x2'):
+            x = pl.col(x)
+            for k in (0, 1, 3, 40, 200):
+                result1 = df.select(
+                    cs_top_bottom(x, k).over('date').alias('dense'),
+                    ((x.rank('min', descending=True) <= k).cast(pl.Int8) - (x.rank('min') <= k).cast(pl.Int8)).over('date').alias('min'),
+                    ((x.rank('ordinal', descending=True) <= k).cast(pl.Int8) - (x.rank('ordinal') <= k).cast(pl.Int8)).over('date').alias('ordinal'),
+                )
+                result2 = df.select(
+                    *[cs_top_bottom_k(x, k, ties, partition_by=pl.col('date')).alias(ties) for ties in ('dense', 'min', 'ordinal')]
+                )
+                assert result1.rows() == result2.rows()
+
+        # 多空各自等权
+        result = df.select('date', w=cs_top_bottom_k(pl.col('x0'), 3, 'min', weight=True).over('date'))
+        s = result.group_by('date').agg(long=pl.col('w').filter(pl.col('w') > 0).sum(), short=pl.col('w').filter(pl.col('w') < 0).sum())
+        np.testing.assert_allclose(s['long'].to_numpy(), 1)
+        np.testing.assert_allclose(s['short'].to_numpy(), -1)
+
+        # k=1时只选最大值与最小值，并列的都选上
+        x = pl.col('x0')
+        top, bottom = (x == x.max()).cast(pl.Float64), (x == x.min()).cast(pl.Float64)
+        result = df.select(
+            w1=cs_top_bottom_k(x, 1, weight=True, partition_by=pl.col('date')),
+            w2=(top / top.sum() - bottom / bottom.sum()).over('date'),
+        )
+        assert (result['w1'] != 0).any()
+        np.testing.assert_allclose(result['w1'].to_numpy(), result['w2'].to_numpy())
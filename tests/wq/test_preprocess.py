@@ -0,0 +1,87 @@
+import numpy as np
+import polars as pl
+
+
+class TestDemoClass:
+    df_pl = None
+
+    def setup_class(self):
+        n = 600
+        self.df_pl = pl.DataFrame({
+            'date': np.repeat(np.arange(6), n // 6),
+            'size': np.random.randn(n),
+            'w': np.random.rand(n) + 0.5,
+            'one': np.ones(n),
+            'industry': np.random.randint(0, 4, n),
+            **{f'y{i}': np.random.randn(n) for i in range(5)},
+        })
+        self.df_pl = self.df_pl.with_columns(
+            # 不同的y有不同的null
+            pl.when(pl.int_range(pl.len()) % 17 == 3).then(None).otherwise(pl.col('y1')).alias('y1'),
+            pl.when(pl.int_range(pl.len()) == 5).then(None).otherwise(pl.col('size')).alias('size'),
+        ).with_columns(self.df_pl.to_dummies('industry'))
+
+    def test_cs_resid_multi(self):
+        from polars_ta.wq.preprocess import cs_resid, cs_resid_w, cs_resid_multi
+
+        df = self.df_pl
+        ys = [pl.col(f'y{i}') for i in range(5)]
+        x = [pl.col('size'), pl.col('one'), *[pl.col(f'industry_{i}') for i in range(1, 4)]]
+        result1 = df.select(*[cs_resid(y, *x).over('date') for y in ys])
+        result2 = df.select(cs_resid_multi(ys, *x).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+        # 字段名取y的列名，重名时退回column_i
+        assert result2.columns == ['y0', 'y1', 'y2', 'y3', 'y4']
+        assert df.select(cs_resid_multi([ys[0], ys[0] * 2], *x).alias('r')).unnest('r').columns == ['column_0', 'column_1']
+
+        result1 = df.select(*[cs_resid_w(pl.col('w'), y, *x).over('date') for y in ys])
+        result2 = df.select(cs_resid_multi(ys, *x, w=pl.col('w')).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+
+        # 常数项加全部行业哑变量，x不满秩，残差与去掉一个行业时相同
+        x = [pl.col('size'), *[pl.col(f'industry_{i}') for i in range(4)]]
+        result3 = df.select(cs_resid_multi(ys, *x, w=pl.col('w'), add_intercept=True).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result2.to_numpy(), result3.to_numpy(), atol=1e-12)
+
+    def test_cs_resid_group(self):
+        from polars_ta.wq.preprocess import cs_resid_multi, cs_resid_group
+
+        df = self.df_pl.with_columns(
+            pl.when(pl.int_range(pl.len()) % 50 == 7).then(None).otherwise(pl.col('industry')).alias('industry'),
+        )
+        # 行业为null的行，哑变量也置为null
+        dummies = [pl.when(pl.col('industry').is_null()).then(None).otherwise(pl.col(f'industry_{i}')).alias(f'industry_{i}') for i in range(4)]
+        ys = [pl.col(f'y{i}') for i in range(5)]
+        for w in (None, pl.col('w')):
+            result1 = df.select(cs_resid_multi(ys, pl.col('size'), *dummies, w=w).over('date').alias('r')).unnest('r')
+            result2 = df.select(cs_resid_multi(ys, pl.col('size'), w=w, group=pl.col('industry')).over('date').alias('r')).unnest('r')
+            np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+
+        # 只有分类列时就是组内去均值
+        result1 = df.select(cs_resid_group(pl.col('y0'), pl.col('industry')).over('date'))
+        result2 = df.select(pl.when(pl.col('industry').is_not_null()).then(pl.col('y0') - pl.col('y0').mean().over('date', 'industry')))
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+
+    def test_cs_preprocess_multi(self):
+        from polars_ta.wq.preprocess import cs_mad, cs_3sigma, cs_quantile, cs_zscore, cs_resid, cs_resid_multi, cs_preprocess_multi
+
+        df = self.df_pl.with_columns(
+            # 有重复值，检查中位数与分位数
+            pl.col('y2').round(1),
+            pl.when(pl.col('date') == 2).then(None).otherwise(pl.col('y3')).alias('y3'),
+        )
+        ys = [pl.col(f'y{i}') for i in range(5)]
+        x = [pl.col('size'), pl.col('one'), *[pl.col(f'industry_{i}') for i in range(1, 4)]]
+
+        result1 = df.select(*[cs_zscore(cs_resid(cs_zscore(cs_mad(y)), *x)).over('date') for y in ys])
+        result2 = df.select(cs_preprocess_multi(ys, *x).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+        assert result2.columns == result1.columns
+
+        result1 = df.select(*[cs_zscore(cs_3sigma(cs_quantile(y, 0.1, 0.8))).over('date') for y in ys])
+        result2 = df.select(cs_preprocess_multi(ys, steps=['quantile', '3sigma', 'zscore'], low_limit=0.1, up_limit=0.8).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
+
+        result1 = df.select(cs_resid_multi([cs_zscore(cs_mad(y)) for y in ys], pl.col('size'), w=pl.col('w'), group=pl.col('industry')).over('date').alias('r')).unnest('r')
+        result2 = df.select(cs_preprocess_multi(ys, pl.col('size'), w=pl.col('w'), group=pl.col('industry'), steps=['mad', 'zscore', 'resid']).over('date').alias('r')).unnest('r')
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), atol=1e-12)
@@ -116,6 +116,177 @@ class TestDemoClass:
         t2 = time.perf_counter()
         print(t2 - t1)
 
+    def test_ts_arg_max_min_samples(self):
+        from polars_ta.wq.time_series import ts_arg_max, ts_arg_min
+
+        df = pl.DataFrame({'a': [0., 1., 0., np.nan, 1., 0.]})
+        result = df.select(
+            out3=ts_arg_max(pl.col('a'), 3),
+            out2=ts_arg_max(pl.col('a'), 3, min_samples=2),
+            out1=ts_arg_max(pl.col('a'), 3, min_samples=1),
+            out4=ts_arg_min(pl.col('a'), 3, min_samples=1),
+            out5=ts_arg_max(pl.col('a'), 3, reverse=False, min_samples=1),
+        )
+        assert result['out3'].to_list() == [None, None, 1, None, None, None]
+        assert result['out2'].to_list() == [None, 0, 1, None, None, 1]
+        assert result['out1'].to_list() == [0, 0, 1, None, 0, 1]
+        assert result['out4'].to_list() == [0, 1, 0, None, 1, 0]
+        assert result['out5'].to_list() == [0, 1, 1, None, 1, 0]
+
+    def test_ts_moment(self):
+        from polars_ta.wq.time_series import ts_moment
+
+        x = np.cumsum(np.random.randn(1000)) + 1000
+        x[np.random.rand(1000) < 0.1] = np.nan
+        df = pl.DataFrame({'a': x}).fill_nan(None)
+        result = df.select(
+            a1=ts_moment(pl.col('a'), 20, k=2),
+            a2=pl.col('a').rolling_var(20, ddof=0, min_samples=20),
+        )
+        np.testing.assert_allclose(result['a1'].to_numpy(), result['a2'].to_numpy(), rtol=1e-8)
+
+    def test_ts_moment_price_level(self):
+        from numpy.lib.stride_tricks import sliding_window_view
+        from polars_ta.wq.time_series import ts_co_kurtosis, ts_co_skewness, ts_moment
+
+        # 小窗口内价格的波动远小于价格本身，检查幂和相减的抵消
+        rng = np.random.default_rng(0)
+        x = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 2000)))
+        y = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, 2000)))
+        df = pl.DataFrame({'x': x, 'y': y})
+        for d in (2, 3):
+            wx = sliding_window_view(x, d)
+            wy = sliding_window_view(y, d)
+            tx = wx - wx.mean(axis=1, keepdims=True)
+            ty = wy - wy.mean(axis=1, keepdims=True)
+            sx = wx.std(axis=1)
+            sy = wy.std(axis=1)
+            result = df.select(
+                m3=ts_moment(pl.col('x'), d, k=3),
+                m4=ts_moment(pl.col('x'), d, k=4),
+                kurt=ts_co_kurtosis(pl.col('x'), pl.col('y'), d),
+                skew=ts_co_skewness(pl.col('x'), pl.col('y'), d),
+            )[d - 1:]
+            # 以窗口标准差为单位比较
+            np.testing.assert_allclose(result['m3'].to_numpy() / sx ** 3, (tx ** 3).mean(axis=1) / sx ** 3, atol=1e-7)
+            np.testing.assert_allclose(result['m4'].to_numpy() / sx ** 4, (tx ** 4).mean(axis=1) / sx ** 4, atol=1e-7)
+            np.testing.assert_allclose(result['kurt'].to_numpy(), (tx * ty ** 3).mean(axis=1) / (sx * sy ** 3), atol=1e-8)
+            np.testing.assert_allclose(result['skew'].to_numpy(), (tx * ty ** 2).mean(axis=1) / (sx * sy ** 2), atol=1e-8)
+
+    def test_ts_partial_corr_price_level(self):
+        from numpy.lib.stride_tricks import sliding_window_view
+        from polars_ta.wq.time_series import ts_partial_corr
+
+        rng = np.random.default_rng(0)
+        x, y, z = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (3, 2000)), axis=1))
+        df = pl.DataFrame({'x': x, 'y': y, 'z': z})
+        d = 3
+        c = np.array([np.corrcoef(w) for w in sliding_window_view(np.vstack((x, y, z)), d, axis=1).transpose(1, 0, 2)])
+        rxy, rxz, ryz = c[:, 0, 1], c[:, 0, 2], c[:, 1, 2]
+        expected = (rxy - rxz * ryz) / ((1 - rxz ** 2) * (1 - ryz ** 2)) ** 0.5
+        result = df.select(ts_partial_corr(pl.col('x'), pl.col('y'), pl.col('z'), d).alias('out'))['out'][d - 1:].to_numpy()
+        assert np.abs(result).max() <= 1
+        np.testing.assert_allclose(result, expected, atol=1e-8)
+
+    def test_partition_by(self):
+        from polars_ta.wq.time_series import ts_arg_max, ts_co_skewness, ts_sum_split_by
+
+        df = pl.DataFrame({
+            'asset': np.repeat(['A', 'B', 'C'], 30),
+            'a': np.random.rand(90),
+            'b': np.random.rand(90),
+        })
+        for func in (lambda **kw: ts_arg_max(pl.col('a'), 5, **kw),
+                     lambda **kw: ts_co_skewness(pl.col('a'), pl.col('b'), 5, **kw),
+                     lambda **kw: ts_sum_split_by(pl.col('a'), pl.col('b'), 5, 2, **kw)):
+            result1 = df.select(func().over('asset')).to_series()
+            result2 = df.select(func(partition_by=pl.col('asset'))).to_series()
+            assert result1.equals(result2)
+
+    def test_output_name(self):
+        import pytest
+        from polars_ta.wq.time_series import ts_arg_max, ts_co_kurtosis, ts_moment, ts_product
+
+        df = pl.DataFrame({
+            'asset': np.repeat(['A', 'B'], 10),
+            'a': np.random.rand(20),
+            'b': np.random.rand(20),
+        })
+        # 输出列名取输入列名，多列输入得到多列
+        assert df.select(ts_arg_max(pl.col('a'), 3)).columns == ['a']
+        assert df.select(ts_arg_max(pl.col('a'), 3, partition_by=pl.col('asset'))).columns == ['a']
+        assert df.select(ts_co_kurtosis(pl.col('a'), pl.col('b'), 3)).columns == ['a']
+        result = df.select(ts_product(pl.col(['a', 'b']), 2))
+        assert result.columns == ['a', 'b']
+        assert result['b'].equals(df.select(ts_product(pl.col('b'), 2))['b'])
+        assert df.select(ts_moment(pl.col(['a', 'b']), 3, k=3)).columns == ['a', 'b']
+        # 指定partition_by时不支持多列输入，构建表达式时就报错
+        with pytest.raises(ValueError):
+            ts_arg_max(pl.col('a', 'b'), 3, partition_by=pl.col('asset'))
+        result = df.select(ts_arg_max(pl.col('a', 'b'), 3).over('asset'))
+        assert result['b'].equals(df.select(ts_arg_max(pl.col('b'), 3, partition_by=pl.col('asset')))['b'])
+
+    def test_struct_field_names(self):
+        from polars_ta.wq.half_life import ts_moments_hl, ts_regression_hl
+        from polars_ta.wq.time_series import ts_decay_linear_multi, ts_percentages, ts_regression
+
+        df = pl.DataFrame({'a': np.random.rand(50), 'b': np.random.rand(50), 'c': np.random.rand(50)})
+        a, b, c = pl.col('a'), pl.col('b'), pl.col('c')
+
+        def fields(e):
+            return df.select(e).to_series().struct.fields
+
+        assert fields(ts_regression(a, b, d=10)) == ['slope', 'intercept', 'resid', 'pred', 'r2', 't_slope', 't_intercept']
+        assert fields(ts_regression_hl(a, b, c, d=10, half_life=5)) == ['slope_0', 'slope_1', 'intercept', 'resid', 'pred', 'r2', 't_slope_0', 't_slope_1', 't_intercept']
+        assert fields(ts_moments_hl(a, 10, 5)) == ['mean', 'sum', 'var', 'std']
+        assert fields(ts_percentages(a, 10, (0.25, 0.5), rank=True)) == ['rank', 'q_0.25', 'q_0.5']
+        assert fields(ts_decay_linear_multi(a, (5, 20), partition_by=pl.lit(0))) == ['d_5', 'd_20']
+        # 输出列名仍取输入列名
+        assert df.select(ts_regression(a, b, d=10)).columns == ['a']
+
+    def test_partition_by_threads(self):
+        import polars_ta
+        from polars_ta.wq.time_series import ts_arg_max
+
+        df = pl.DataFrame({
+            'asset': np.repeat(np.arange(50), 20),
+            'a': np.random.rand(1000),
+        })
+        result1 = df.select(ts_arg_max(pl.col('a'), 5, partition_by=pl.col('asset'))).to_series()
+        polars_ta.NUM_THREADS = 4
+        try:
+            result2 = df.select(ts_arg_max(pl.col('a'), 5, partition_by=pl.col('asset'))).to_series()
+        finally:
+            polars_ta.NUM_THREADS = 1
+        assert result1.equals(result2)
+
+    def test_partition_by_concurrent(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        import polars_ta
+        from polars_ta.wq.time_series import ts_arg_max
+
+        # 各线程的分组数不同，每次调用的并行度不同
+        dfs = [pl.DataFrame({
+            'asset': np.repeat(np.arange(n), 10),
+            'a': np.random.rand(n * 10),
+        }) for n in range(3, 23)]
+        expected = [df.select(ts_arg_max(pl.col('a'), 5).over('asset')).to_series() for df in dfs]
+
+        def run(i):
+            for j in range(50):
+                k = (i + j) % len(dfs)
+                result = dfs[k].select(ts_arg_max(pl.col('a'), 5, partition_by=pl.col('asset'))).to_series()
+                assert result.equals(expected[k])
+
+        polars_ta.NUM_THREADS = 8
+        try:
+            with ThreadPoolExecutor(6) as pool:
+                for f in [pool.submit(run, i) for i in range(6)]:
+                    f.result()
+        finally:
+            polars_ta.NUM_THREADS = 1
+
     def test_ts_product(self):
         from polars_ta.wq._slow import ts_product as func_slow
         from polars_ta.wq.time_series import ts_product as func_fast
@@ -141,3 +312,224 @@ class TestDemoClass:
             )
         t2 = time.perf_counter()
         print(t2 - t1)
+
+    def test_float32(self):
+        import polars_ta
+        from polars_ta.wq.time_series import ts_co_skewness, ts_cum_sum_reset
+
+        df = pl.DataFrame({'a': np.random.rand(100), 'b': np.random.rand(100)})
+        result1 = df.select(a1=ts_co_skewness(pl.col('a'), pl.col('b'), 10), a2=ts_cum_sum_reset(pl.col('a') - 0.5))
+        polars_ta.FLOAT32 = True
+        try:
+            result2 = df.select(a1=ts_co_skewness(pl.col('a'), pl.col('b'), 10), a2=ts_cum_sum_reset(pl.col('a') - 0.5))
+        finally:
+            polars_ta.FLOAT32 = False
+        assert result2.dtypes == [pl.Float32, pl.Float32]
+        assert_frame_equal(result1.to_pandas(), result2.cast(pl.Float64).to_pandas(), rtol=1e-4, atol=1e-4)
+
+    def test_ts_percentages(self):
+        from polars_ta.wq.time_series import ts_percentages, ts_rank
+
+        x = np.random.randint(0, 20, 1000).astype(float)
+        x[np.random.rand(1000) < 0.1] = np.nan
+        df = pl.DataFrame({'asset': np.repeat(['A', 'B'], 500), 'a': x}).fill_nan(None)
+        a = pl.col('a')
+        for d, minp in ((5, None), (250, 100)):
+            for interpolation in ('nearest', 'lower', 'higher', 'midpoint', 'linear'):
+                result1 = df.select(ts_percentages(a, d, (0, 0.1, 0.5, 0.9, 1), minp, interpolation, rank=True).alias('x')).unnest('x')
+                result2 = df.select(
+                    ts_rank(a, d, minp),
+                    *[a.rolling_quantile(q, interpolation, window_size=d, min_samples=minp or d).alias(str(q)) for q in (0, 0.1, 0.5, 0.9, 1)]
+                )
+                np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy())
+            result1 = df.select(ts_rank(a, d, minp))
+            result2 = df.select(a.rolling_rank(d, min_samples=minp or d) / a.is_not_null().cast(pl.UInt32).rolling_sum(d, min_samples=minp or d))
+            np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy())
+
+        result1 = df.select(ts_percentages(a, 20, (0.1, 0.5), rank=True).over('asset')).to_series()
+        result2 = df.select(ts_percentages(a, 20, (0.1, 0.5), rank=True, partition_by=pl.col('asset'))).to_series()
+        assert result1.equals(result2)
+
+    def test_ts_sum_split_by(self):
+        from polars_ta.wq.time_series import ts_sum_split_by
+
+        x = np.random.rand(300)
+        by = np.random.randint(0, 10, 300).astype(float)
+        by[np.random.rand(300) < 0.1] = np.nan
+        df = pl.DataFrame({'x': x, 'by': by}).fill_nan(None)
+        result = df.select(ts_sum_split_by(pl.col('x'), pl.col('by'), 20, 3).alias('a')).unnest('a').to_numpy()
+
+        # 逐个窗口稳定排序
+        expected = np.full((300, 2), np.nan)
+        for i in range(19, 300):
+            b = by[i - 19:i + 1]
+            idx = np.flatnonzero(~np.isnan(b))
+            if len(idx) < 3:
+                continue
+            idx = idx[np.argsort(b[idx], kind='stable')]
+            expected[i] = x[i - 19:i + 1][idx[:3]].sum(), x[i - 19:i + 1][idx[-3:]].sum()
+        np.testing.assert_allclose(result, expected)
+
+    def test_ts_product_special(self):
+        from polars_ta.wq.time_series import ts_product
+
+        x = np.random.normal(0, 3, 1000)
+        x[np.random.rand(1000) < 0.05] = np.nan
+        x[np.random.rand(1000) < 0.02] = 0
+        x[np.random.rand(1000) < 0.01] = np.exp(400)
+        df = pl.DataFrame({'a': x}).fill_nan(None)
+        result = df.select(ts_product(pl.col('a'), 20, 5)).to_series().to_numpy()
+
+        # 逐个窗口连乘
+        expected = np.full(1000, np.nan)
+        for i in range(1000):
+            v = x[max(i - 19, 0):i + 1]
+            if (~np.isnan(v)).sum() >= 5:
+                expected[i] = np.nanprod(v)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        assert np.array_equal(np.signbit(result[expected == 0]), np.signbit(expected[expected == 0]))
+
+    def test_ts_decay_linear_recursive(self):
+        from polars_ta.wq.time_series import ts_decay_linear, ts_decay_linear_multi
+
+        x = np.random.rand(1000)
+        x[np.random.rand(1000) < 0.01] = np.nan
+        df = pl.DataFrame({'a': x}).fill_nan(None)
+        a = pl.col('a')
+        for d, minp in ((5, None), (30, 3), (250, 100)):
+            # 原来的写法
+            result1 = df.select(a.fill_null(np.nan).rolling_mean(d, weights=np.arange(1, d + 1), min_samples=minp).fill_nan(None))
+            result2 = df.select(ts_decay_linear(a, d, minp))
+            np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), rtol=1e-10)
+
+        result1 = df.select(ts_decay_linear_multi(a, (5, 30)).alias('x')).unnest('x')
+        result2 = df.select(ts_decay_linear(a, 5), ts_decay_linear(a, 30).alias('b'))
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy())
+
+    def test_ts_exp_moments(self):
+        from polars_ta.utils._nb import get_exponent_weights
+        from polars_ta.wq.half_life import ts_mean_hl, ts_sum_hl, ts_var_hl, ts_std_hl, ts_moments_hl
+        from polars_ta.wq.time_series import ts_decay_exp_window
+
+        x = np.random.rand(1000) + 100
+        x[np.random.rand(1000) < 0.01] = np.nan
+        df = pl.DataFrame({'a': x}).fill_nan(None)
+        a = pl.col('a')
+        d, half_life = 20, 5
+        # 原来的写法。满窗口时窗口中有null结果为null，与跳过null的结果一致
+        w = get_exponent_weights(d, half_life)
+        b = a.fill_null(np.nan)
+        result1 = df.select(*[f(b, d, weights=w).fill_nan(None).alias(str(i)) for i, f in enumerate((pl.Expr.rolling_mean, pl.Expr.rolling_sum, pl.Expr.rolling_var, pl.Expr.rolling_std))])
+        result2 = df.select(*[f(a, d, half_life).alias(str(i)) for i, f in enumerate((ts_mean_hl, ts_sum_hl, ts_var_hl, ts_std_hl))])
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), rtol=1e-8)
+        result3 = df.select(ts_moments_hl(a, d, half_life).alias('x')).unnest('x')
+        np.testing.assert_allclose(result2.to_numpy(), result3.to_numpy())
+
+        # min_samples较小时跳过null，权重按有效值归一化
+        result1 = df.select(ts_decay_exp_window(a, d, 0.9, min_samples=3)).to_series().to_numpy()
+        weights = 0.9 ** np.arange(d - 1, -1, -1)
+        for i in range(d, 1000, 37):
+            v = x[i - d + 1:i + 1]
+            mask = ~np.isnan(v)
+            np.testing.assert_allclose(result1[i], np.average(v[mask], weights=weights[mask]))
+
+    def test_ts_regression_hl(self):
+        from polars_ta.wq.half_life import ts_regression_hl
+
+        n, d, half_life = 500, 60, 20
+        x1 = np.random.randn(n)
+        x2 = np.random.randn(n) + 5
+        y = 1.5 * x1 - 0.7 * x2 + 3 + np.random.randn(n) * 0.5
+        y[[10, 200, 201]] = np.nan
+        x2[300] = np.nan
+        df = pl.DataFrame({'y': y, 'x1': x1, 'x2': x2}).fill_nan(None)
+        result = df.select(ts_regression_hl(pl.col('y'), pl.col('x1'), pl.col('x2'), d=d, half_life=half_life, min_samples=30).alias('r')).unnest('r').to_numpy()
+
+        factor = 0.5 ** (1 / half_life)
+        for i in range(40, n, 13):
+            start = max(0, i - d + 1)
+            yy = y[start:i + 1]
+            xx = np.c_[x1[start:i + 1], x2[start:i + 1], np.ones(i + 1 - start)]
+            w = factor ** np.arange(i - start, -1, -1)
+            mask = ~np.isnan(yy) & ~np.isnan(xx).any(axis=1)
+            sw = np.sqrt(w[mask])
+            b = np.linalg.lstsq(xx[mask] * sw[:, None], yy[mask] * sw, rcond=None)[0]
+            resid = yy[mask] - xx[mask] @ b
+            r2 = 1 - (w[mask] * resid ** 2).sum() / (w[mask] * (yy[mask] - np.average(yy[mask], weights=w[mask])) ** 2).sum()
+            pred = xx[-1] @ b if mask[-1] else np.nan
+            # WLS的t值
+            s2 = (w[mask] * resid ** 2).sum() / (mask.sum() - 3)
+            t = b / np.sqrt(s2 * np.diag(np.linalg.inv((xx[mask] * w[mask, None]).T @ xx[mask])))
+            np.testing.assert_allclose(result[i], np.r_[b, y[i] - pred, pred, r2, t], rtol=1e-8, atol=1e-10)
+
+    def test_ts_regression(self):
+        import polars_ols as pls
+        from polars_ta.wq.time_series import ts_regression, ts_regression_slope, ts_regression_intercept, ts_regression_resid, ts_regression_pred, ts_resid, ts_pred
+
+        n, d = 500, 20
+        x1 = np.random.randn(n)
+        x2 = np.random.randn(n)
+        y = 2 * x1 - x2 + 1 + np.random.randn(n) * 0.3
+        df = pl.DataFrame({'y': y, 'x1': x1, 'x2': x2})
+        y_, x1_, x2_ = pl.col('y'), pl.col('x1'), pl.col('x2')
+        kwargs = pls.RollingKwargs(window_size=d, min_periods=d)
+        result1 = df.select(
+            pls.compute_rolling_least_squares(y_, x1_, mode='coefficients', add_intercept=True, rolling_kwargs=kwargs).struct[0].alias('a'),
+            pls.compute_rolling_least_squares(y_, x1_, mode='coefficients', add_intercept=True, rolling_kwargs=kwargs).struct[1].alias('b'),
+            pls.compute_rolling_least_squares(y_, x1_, mode='residuals', add_intercept=True, rolling_kwargs=kwargs).alias('c'),
+            pls.compute_rolling_least_squares(y_, x1_, mode='predictions', add_intercept=True, rolling_kwargs=kwargs).alias('d'),
+            pls.compute_rolling_least_squares(y_, x1_, x2_, mode='residuals', rolling_kwargs=kwargs).alias('e'),
+            pls.compute_rolling_least_squares(y_, x1_, x2_, mode='predictions', rolling_kwargs=kwargs).alias('f'),
+        )
+        result2 = df.select(
+            ts_regression_slope(y_, x1_, d).alias('a'),
+            ts_regression_intercept(y_, x1_, d).alias('b'),
+            ts_regression_resid(y_, x1_, d).alias('c'),
+            ts_regression_pred(y_, x1_, d).alias('d'),
+            ts_resid(y_, x1_, x2_, d=d).alias('e'),
+            ts_pred(y_, x1_, x2_, d=d).alias('f'),
+        )
+        np.testing.assert_allclose(result1.to_numpy(), result2.to_numpy(), rtol=1e-8, atol=1e-10)
+
+        # R²与t值
+        result = df.select(ts_regression(y_, x1_, x2_, d=d).alias('r')).unnest('r').to_numpy()
+        for i in range(d - 1, n, 37):
+            xx = np.c_[x1[i - d + 1:i + 1], x2[i - d + 1:i + 1], np.ones(d)]
+            yy = y[i - d + 1:i + 1]
+            b = np.linalg.solve(xx.T @ xx, xx.T @ yy)
+            resid = yy - xx @ b
+            t = b / np.sqrt(resid @ resid / (d - 3) * np.diag(np.linalg.inv(xx.T @ xx)))
+            r2 = 1 - resid @ resid / ((yy - yy.mean()) @ (yy - yy.mean()))
+            np.testing.assert_allclose(result[i, 5:], np.r_[r2, t], rtol=1e-8)
+
+    def test_ts_regression_exact_fit(self):
+        import pytest
+        from polars_ta.reports.cicc import ts_RSRS, ts_RSRS_R2
+        from polars_ta.wq.half_life import ts_regression_hl
+        from polars_ta.wq.time_series import ts_regression, ts_resid
+
+        # 前20行y为常数(停牌时收益为0)，后20行y与x完全线性
+        n, d = 40, 10
+        x = np.random.randn(n)
+        y = np.r_[np.zeros(20), 2 * x[20:] + 1]
+        df = pl.DataFrame({'y': y, 'x': x})
+        for reg in (ts_regression(pl.col('y'), pl.col('x'), d=d), ts_regression_hl(pl.col('y'), pl.col('x'), d=d, half_life=5)):
+            result = df.select(reg.alias('r')).unnest('r').to_numpy()
+            # 斜率、截距、残差、预测值、R²、t值
+            np.testing.assert_allclose(result[d - 1:20, :4], 0, atol=1e-12)
+            assert np.isnan(result[d - 1:20, 4:]).all()
+            np.testing.assert_allclose(result[20 + d - 1:, :3], np.broadcast_to([2, 1, 0], (20 - d + 1, 3)), atol=1e-10)
+            np.testing.assert_allclose(result[20 + d - 1:, 4], 1)
+            # 残差平方和为0时t值为inf，舍入误差下为很大的数
+            assert (result[20 + d - 1:, 5:] > 1e6).all()
+
+        df = df.with_columns(h=pl.col('y') + 1, l=pl.col('y'))
+        result = df.select(
+            ts_resid(pl.col('y'), pl.col('x'), d=d).alias('a'),
+            ts_RSRS(pl.col('h'), pl.col('l'), d, 2 * d).alias('b'),
+            ts_RSRS_R2(pl.col('h'), pl.col('l'), d, 2 * d).alias('c'),
+        )
+        assert len(result) == n
+
+        with pytest.raises(ValueError):
+            ts_regression(pl.col('y'), d=d)
@@ -20,24 +20,32 @@ def _codegen_func(name, input_names, parameters, output_names, doc):
     tpl11 = """
 def {name}({aa}) -> Expr:  # {output_names}
     \"\"\"{doc}\"\"\"
-    return {bb}.map_batches(lambda x1: batches_i1_o1(x1.to_numpy().astype(float), {cc}), return_dtype={return_dtype})
+    dtype = {return_dtype}
+    if partition_by is None:
+        return {bb}.map_batches(lambda x1: batches_i1_o1(series_to_numpy(x1, float), {cc}, dtype=dtype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0={bb}).map_batches(lambda xx: batches_i1_o1(series_to_numpy(xx.struct[0], float), {cc}, dtype=dtype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 """
     tpl12 = """
 def {name}({aa}) -> Expr:  # {output_names}
     \"\"\"{doc}\"\"\"
-    dtype = Struct([Field(f"column_{{i}}", Float64) for i in range({ee})])
-    return {bb}.map_batches(lambda x1: batches_i1_o2(x1.to_numpy().astype(float), {cc}), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{{i}}", ftype) for i in range({ee})])
+    if partition_by is None:
+        return {bb}.map_batches(lambda x1: batches_i1_o2(series_to_numpy(x1, float), {cc}, dtype=ftype), return_dtype=dtype)
+    return struct_with_partition(partition_by, f0={bb}).map_batches(lambda xx: batches_i1_o2(series_to_numpy(xx.struct[0], float), {cc}, dtype=ftype, offsets=struct_to_offsets(xx, 1)), return_dtype=dtype)
 """
     tpl21 = """
 def {name}({aa}) -> Expr:  # {output_names}
     \"\"\"{doc}\"\"\"
-    return struct({bb}).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, {dd}, dtype=float), {cc}), return_dtype={return_dtype})
+    dtype = {return_dtype}
+    return struct_with_partition(partition_by, {bb}).map_batches(lambda xx: batches_i2_o1(struct_to_numpy(xx, {dd}, dtype=float), {cc}, dtype=dtype, offsets=struct_to_offsets(xx, {dd})), return_dtype=dtype)
 """
     tpl22 = """
 def {name}({aa}) -> Expr:  # {output_names}
     \"\"\"{doc}\"\"\"
-    dtype = Struct([Field(f"column_{{i}}", Float64) for i in range({ee})])
-    return struct({bb}).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, {dd}, dtype=float), {cc}), return_dtype=dtype)
+    ftype = float_dtype()
+    dtype = Struct([Field(f"column_{{i}}", ftype) for i in range({ee})])
+    return struct_with_partition(partition_by, {bb}).map_batches(lambda xx: batches_i2_o2(struct_to_numpy(xx, {dd}, dtype=float), {cc}, dtype=ftype, offsets=struct_to_offsets(xx, {dd})), return_dtype=dtype)
 """
     if len(output_names) > 42:
         extra_args = {'ret_idx': len(output_names) - 1}
@@ -46,7 +54,9 @@ def {name}({aa}) -> Expr:  # {output_names}
     a1 = [f'{name}: Expr' for name in input_names]
     a2 = [f'{k}: {type(v).__name__} = {v}' for k, v in parameters.items()]
     a3 = [f'{k}: {type(v).__name__} = {v}' for k, v in extra_args.items()]
-    aa = ', '.join(a1 + a2 + a3)
+    # 分组列。数据需按分组、时间排序，所有分组一次计算
+    a4 = ['partition_by: Optional[Expr] = None']
+    aa = ', '.join(a1 + a2 + a3 + a4)
 
     bb = ', '.join(input_names)
     if len(input_names) > 1:
@@ -65,7 +75,7 @@ def {name}({aa}) -> Expr:  # {output_names}
     if output_names[0] == 'integer':
         return_dtype = 'Int32'
     else:
-        return_dtype = 'Float64'
+        return_dtype = 'float_dtype()'
 
     if len(input_names) == 1 and len(output_names) == 1:
         return tpl11.format(name=name, aa=aa, bb=bb, cc=cc, dd=len(input_names), ee=len(output_names), output_names=output_names, doc=doc, return_dtype=return_dtype)
@@ -77,15 +87,26 @@ def {name}({aa}) -> Expr:  # {output_names}
         return tpl22.format(name=name, aa=aa, bb=bb, cc=cc, dd=len(input_names), ee=len(output_names), output_names=output_names, doc=doc)
 
 
+def _codegen_all(names):
+    lines = ''.join(f"    '{name}',\n" for name in names)
+    return f"\n__all__ = [\n{lines}]\n"
+
+
 def codegen():
     head_v2 = """# generated by codegen_talib.py
-import talib as _ta
-from polars import Expr, struct, Struct, Field, Float64, Int32
+from typing import Optional
+
+from polars import Expr, Struct, Field, Int32
+
+from polars_ta.utils.lazy import lazy_import
+from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1, batches_i2_o2, float_dtype, series_to_numpy, struct_to_numpy, struct_to_offsets, struct_with_partition
 
-from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1, batches_i2_o2, struct_to_numpy
+# 首次使用时才导入talib
+_ta = lazy_import('talib')
 """
 
     txts = [head_v2]
+    names = []
     for i, func_name in enumerate(_talib.get_functions()):
         """talib遍历"""
         info = _abstract.Function(func_name).info
@@ -101,7 +122,10 @@ from polars_ta.utils.numba_ import batches_i1_o1, batches_i1_o2, batches_i2_o1,
         output_names = info['output_names']
         txt = _codegen_func(name, input_names, parameters, output_names, getattr(_talib, name).__doc__)
         txts.append(txt)
+        names.append(name)
 
+    # 只导出生成的函数，`from polars_ta.talib import *`不带出lazy_import、batches_*等工具
+    txts.append(_codegen_all(names))
     return txts
 
 
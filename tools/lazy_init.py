@@ -0,0 +1,25 @@
+"""
+生成各包的`__init__.py`，用模块级`__getattr__`延迟导入子模块
+
+原来的`from xxx import *`会一次导入所有子模块，以及numba、polars_ols等依赖。
+改成访问某个函数时才导入所在的子模块
+"""
+from tools.prefix import codegen_import_star, codegen_lazy, save
+
+packages = {
+    'polars_ta.candles': ['cdl1', 'cdl1_limit', 'cdl2'],
+    'polars_ta.labels': ['future'],
+    'polars_ta.reports': ['cicc'],
+    'polars_ta.ta': ['momentum', 'operators', 'overlap', 'price', 'statistic', 'transform', 'volatility', 'volume'],
+    'polars_ta.tdx': ['arithmetic', 'choice', 'energy', 'logical', 'moving_average', 'over_bought_over_sold', 'pattern', 'pattern_feature',
+                      'pressure_support', 'reference', 'statistic', 'times', 'trend', 'trend_feature', 'volume'],
+    'polars_ta.wide': ['convert', 'store', 'time_series'],
+    'polars_ta.wq': ['arithmetic', 'cross_sectional', 'half_life', 'logical', 'preprocess', 'time_series', 'transformational', 'vector'],
+}
+
+if __name__ == '__main__':
+    for package, modules in packages.items():
+        lines = ["""# this code is auto generated by tools/lazy_init.py
+"""]
+        lines += codegen_import_star([f'{package}.{m}' for m in modules])
+        save(codegen_lazy(lines), module=package, write=True)
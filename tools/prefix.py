@@ -1,4 +1,5 @@
 import inspect
+import re
 from typing import List, Optional
 
 
@@ -71,6 +72,58 @@ def codegen_import_as(module: str, prefix: str = 'ts_',
     return txts
 
 
+def codegen_lazy(txts: List[str]) -> List[str]:
+    """将`from module import name as alias`的代码转成延迟导入，访问时才导入来源模块
+
+    非导入的行(注释等)原样保留在开头。同名时后出现的覆盖先出现的，与逐行导入一致
+    """
+    head = []
+    names = {}
+    for txt in txts:
+        m = re.match(r'from (\S+) import (\S+)(?: as (\S+))?', txt.strip())
+        if m is None:
+            head.append(txt)
+            continue
+        module, name, alias = m.groups()
+        names.pop(alias or name, None)
+        names[alias or name] = (module, name if alias is None else f'{name} as {alias}')
+
+    imports = {}
+    for module, item in names.values():
+        imports.setdefault(module, []).append(item)
+
+    lines = head + ['from polars_ta.utils.lazy import lazy_getattr', '', '__getattr__, __dir__, __all__ = lazy_getattr(__name__, {']
+    for module, items in imports.items():
+        lines.append(f"    '{module}': [")
+        lines += [f"        '{item}'," for item in items]
+        lines.append('    ],')
+    lines.append('})')
+    lines.append('')
+    return lines
+
+
+def codegen_import_star(modules: List[str]) -> List[str]:
+    """模拟`from module import *`，列出各模块导出的polars_ta函数，生成逐个导入的代码
+
+    模块定义了`__all__`时以它为准。从`polars_ta.utils`导入的内部工具(batches_*、lazy_import等)不导出
+    """
+    txts = []
+    for module in modules:
+        m = __import__(module, fromlist=['*'])
+        names = getattr(m, '__all__', None)
+        if names is None:
+            names = [name for name in dir(m) if not name.startswith('_')]
+        for name in names:
+            obj = getattr(m, name)
+            if inspect.ismodule(obj):
+                continue
+            source = getattr(obj, '__module__', None) or ''
+            if not source.startswith('polars_ta') or source.startswith('polars_ta.utils'):
+                continue
+            txts.append(f'from {module} import {name}  # noqa')
+    return txts
+
+
 def save(txts, module, write=False):
     m = __import__(module, fromlist=['*'])
     file = m.__file__
@@ -1,4 +1,4 @@
-from tools.prefix import codegen_import_as, save
+from tools.prefix import codegen_import_as, codegen_lazy, save
 
 lines = ["""# this code is auto generated by tools/prefix_ta.py
 """]
@@ -10,4 +10,4 @@ lines += codegen_import_as('polars_ta.ta.statistic', include_modules=['polars_ta
 lines += codegen_import_as('polars_ta.ta.transform', include_modules=['polars_ta.wq.arithmetic'], include_parameter=['timeperiod', 'd'])
 lines += codegen_import_as('polars_ta.ta.volatility', include_func=['TRANGE'], include_parameter=['timeperiod'])
 lines += codegen_import_as('polars_ta.ta.volume', include_func=['AD', 'OBV'], include_parameter=['fastperiod'])
-save(lines, module='polars_ta.prefix.ta', write=True)
+save(codegen_lazy(lines), module='polars_ta.prefix.ta', write=True)
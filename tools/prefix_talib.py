@@ -5,7 +5,7 @@ Add prefix to talib functions
 import talib as _talib
 from talib import abstract as _abstract
 
-from tools.prefix import save
+from tools.prefix import codegen_lazy, save
 
 
 def codegen():
@@ -26,4 +26,4 @@ if __name__ == '__main__':
     txts = ["""# this code is auto generated by tools/prefix_talib.py
     """]
     txts += codegen()
-    save(txts, module='polars_ta.prefix.talib', write=True)
+    save(codegen_lazy(txts), module='polars_ta.prefix.talib', write=True)
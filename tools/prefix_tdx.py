@@ -1,4 +1,4 @@
-from tools.prefix import codegen_import_as, save
+from tools.prefix import codegen_import_as, codegen_lazy, save
 
 lines = ["""# this code is auto generated by tools/prefix_tdx.py
 """]
@@ -17,4 +17,4 @@ lines += codegen_import_as('polars_ta.tdx.times', include_parameter=[])
 lines += codegen_import_as('polars_ta.tdx.trend', include_parameter=['N'])
 lines += codegen_import_as('polars_ta.tdx.trend_feature', include_parameter=['N', 'M', 'N1'], include_func=['下跌多日再放量上涨', '价量渐低后阳包阴', '单日放量', '跳空高开或低开'])
 lines += codegen_import_as('polars_ta.tdx.volume', include_func=['OBV'], include_parameter=['N'])
-save(lines, module='polars_ta.prefix.tdx', write=True)
+save(codegen_lazy(lines), module='polars_ta.prefix.tdx', write=True)
@@ -8,7 +8,7 @@
 import inspect
 from typing import Optional, List
 
-from tools.prefix import save
+from tools.prefix import codegen_lazy, save
 
 
 def codegen_import_as(module: str, prefix: str = 'cs_',
@@ -72,4 +72,4 @@ def codegen_import_as(module: str, prefix: str = 'cs_',
 lines = ["""# this code is auto generated by tools/prefix_vec.py
 """]
 lines += codegen_import_as('polars_ta.wq.vector', prefix='cs_')
-save(lines, module='polars_ta.prefix.vec', write=True)
+save(codegen_lazy(lines), module='polars_ta.prefix.vec', write=True)
@@ -100,7 +100,7 @@ lines += codegen_import_as('polars_ta.wq.time_series',
                                          ])
 lines += codegen_import_as('polars_ta.wq.cross_sectional',
                            exclude_func=['cs_fill_except_all_null', 'cs_fill_mean', 'cs_fill_max', 'cs_fill_min',
-                                         'cs_top_bottom', 'cs_one_side',
+                                         'cs_top_bottom', 'cs_top_bottom_k', 'cs_one_side',
                                          'cs_regression_neut', 'cs_regression_proj', 'cs_scale_down', 'cs_truncate'])
 lines += codegen_import_as('polars_ta.wq.preprocess',
                            exclude_func=['cs_mad_zscore', 'cs_mad_zscore_resid', 'cs_mad_zscore_resid_zscore', 'cs_zscore_resid'])